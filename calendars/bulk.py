@@ -0,0 +1,240 @@
+"""
+일정 일괄 생성/수정/삭제.
+
+모든 항목을 먼저 검증한 뒤 캘린더, 메모 세트, 태그, 대상 일정을 종류별로 한 번의 쿼리로
+찾고, 하나의 트랜잭션 안에서 bulk_create/bulk_update로 씁니다.
+한 항목이라도 실패하면 아무것도 쓰지 않습니다.
+"""
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from calendars.models import Calendar, Schedule
+from calendars.serializers import ScheduleBulkFieldsSerializer
+from common.defaults import DEFAULT_CALENDAR, DEFAULT_MEMO_SET
+from memos.models import Memo, MemoSet
+from tags.models import Tag
+
+ScheduleTag = Tag.schedule.through
+
+
+def _validate_fields(operations):
+    """
+    create/update 항목의 data를 검증합니다. 관계 필드는 이름/id 그대로 남습니다.
+    """
+    fields, errors = {}, {}
+    for index, operation in enumerate(operations):
+        if operation["op"] == "delete":
+            continue
+
+        serializer = ScheduleBulkFieldsSerializer(
+            data=operation["data"], partial=operation["op"] == "update"
+        )
+        if serializer.is_valid():
+            fields[index] = dict(serializer.validated_data)
+        else:
+            errors[index] = serializer.errors
+
+    return fields, errors
+
+
+def _load_relations(user, operations, fields):
+    """
+    항목들이 참조하는 캘린더, 메모 세트, 태그, 대상 일정을 종류별로 한 번씩 조회합니다.
+    """
+    calendar_titles, memo_set_ids, tag_titles = set(), set(), set()
+    needs_default_memo_set = False
+
+    for index, data in fields.items():
+        if "calendar" in data:
+            calendar_titles.add(data["calendar"])
+        elif operations[index]["op"] == "create":
+            calendar_titles.add(DEFAULT_CALENDAR)
+
+        tag_titles.update(data.get("schedule_tags", ()))
+
+        if "memo" in data:
+            if "memo_set" in data["memo"]:
+                memo_set_ids.add(data["memo"]["memo_set"])
+            else:
+                needs_default_memo_set = True
+
+    target_ids = {op["id"] for op in operations if op["op"] != "create"}
+
+    calendars, memo_sets, tags, targets = {}, {}, {}, {}
+    if calendar_titles:
+        calendars = {
+            calendar.title: calendar
+            for calendar in Calendar.objects.filter(
+                user=user, title__in=calendar_titles
+            )
+        }
+    if memo_set_ids or needs_default_memo_set:
+        condition = Q(pk__in=memo_set_ids)
+        if needs_default_memo_set:
+            condition |= Q(title=DEFAULT_MEMO_SET)
+        memo_sets = {
+            memo_set.pk: memo_set
+            for memo_set in MemoSet.objects.filter(condition, user=user)
+        }
+    if tag_titles:
+        tags = {
+            tag.title: tag
+            for tag in Tag.objects.filter(user=user, title__in=tag_titles)
+        }
+    if target_ids:
+        targets = Schedule.objects.filter(calendar__user=user).in_bulk(target_ids)
+
+    return calendars, memo_sets, tags, targets
+
+
+def _resolve(operation, data, relations, seen_ids):
+    """
+    한 항목의 이름/id를 조회한 객체로 바꿉니다. 실패하면 오류 dict를 반환합니다.
+    """
+    calendars, memo_sets, tags, targets = relations
+    errors = {}
+
+    if operation["op"] != "create":
+        if operation["id"] in seen_ids:
+            errors["id"] = "같은 일정에 대한 작업이 중복되었습니다."
+        elif operation["id"] not in targets:
+            errors["id"] = "해당 일정이 존재하지 않습니다."
+        seen_ids.add(operation["id"])
+
+    if data is None:
+        return errors
+
+    title = data.get("calendar")
+    if title is None and operation["op"] == "create":
+        title = DEFAULT_CALENDAR
+    if title is not None:
+        if title in calendars:
+            data["calendar"] = calendars[title]
+        else:
+            errors["calendar"] = f"캘린더 '{title}'이/가 존재하지 않습니다."
+
+    if "schedule_tags" in data:
+        missing = [title for title in data["schedule_tags"] if title not in tags]
+        if missing:
+            errors["schedule_tags"] = (
+                f"태그 {', '.join(missing)}이/가 존재하지 않습니다."
+            )
+        else:
+            data["schedule_tags"] = [tags[title] for title in data["schedule_tags"]]
+
+    if "memo" in data:
+        memo = data["memo"]
+        if operation["op"] == "update":
+            errors["memo"] = "함께 있는 Memo는 메모 수정 API로 수정해야 합니다."
+        elif "memo_set" in memo:
+            if memo["memo_set"] in memo_sets:
+                memo["memo_set"] = memo_sets[memo["memo_set"]]
+            else:
+                errors["memo"] = {"memo_set": "해당 메모 세트가 존재하지 않습니다."}
+        else:
+            default = next(
+                (m for m in memo_sets.values() if m.title == DEFAULT_MEMO_SET), None
+            )
+            if default is None:
+                errors["memo"] = {"memo_set": "기본 메모 세트가 존재하지 않습니다."}
+            memo["memo_set"] = default
+
+    return errors
+
+
+def _write(operations, fields, targets):
+    """
+    검증과 조회가 끝난 항목들을 씁니다. 항목별 일정 id를 반환합니다.
+    """
+    ids = {}
+    created, updated, deleted = [], [], []
+    tag_rows, retagged = [], []
+    update_fields = {"updated_at"}
+    now = timezone.now()
+
+    for index, operation in enumerate(operations):
+        data = dict(fields.get(index, {}))
+        tags = data.pop("schedule_tags", None)
+        memo = data.pop("memo", None)
+
+        if operation["op"] == "create":
+            schedule = Schedule(**data)
+            if memo is not None:
+                schedule.memo = Memo(**memo)
+            created.append((index, schedule, tags))
+            continue
+
+        schedule = targets[operation["id"]]
+        ids[index] = schedule.pk
+        if operation["op"] == "delete":
+            deleted.append(schedule.pk)
+            continue
+
+        for attr, value in data.items():
+            setattr(schedule, attr, value)
+        schedule.updated_at = now
+        update_fields.update(data)
+        updated.append(schedule)
+        if tags is not None:
+            retagged.append(schedule.pk)
+            tag_rows += [ScheduleTag(schedule_id=schedule.pk, tag=tag) for tag in tags]
+
+    with transaction.atomic():
+        memos = [s.memo for _, s, _ in created if s.memo is not None]
+        Memo.objects.bulk_create(memos)
+
+        Schedule.objects.bulk_create([schedule for _, schedule, _ in created])
+        for index, schedule, tags in created:
+            ids[index] = schedule.pk
+            tag_rows += [
+                ScheduleTag(schedule_id=schedule.pk, tag=tag) for tag in tags or ()
+            ]
+
+        if updated:
+            Schedule.objects.bulk_update(updated, update_fields)
+        if retagged:
+            ScheduleTag.objects.filter(schedule_id__in=retagged).delete()
+        ScheduleTag.objects.bulk_create(tag_rows)
+
+        if deleted:
+            Schedule.objects.filter(pk__in=deleted).delete()
+
+    return ids
+
+
+def apply_operations(user, operations):
+    """
+    operations를 모두 적용하고 (항목별 결과 목록, 성공 여부)를 반환합니다.
+    실패한 경우 오류가 없는 항목은 "skipped"로 표시되고 아무것도 쓰지 않습니다.
+    """
+    fields, errors = _validate_fields(operations)
+    relations = _load_relations(user, operations, fields)
+
+    seen_ids = set()
+    for index, operation in enumerate(operations):
+        if index in errors:
+            continue
+        item_errors = _resolve(operation, fields.get(index), relations, seen_ids)
+        if item_errors:
+            errors[index] = item_errors
+
+    results = [
+        {"index": index, "op": operation["op"], "id": operation.get("id")}
+        for index, operation in enumerate(operations)
+    ]
+
+    if errors:
+        for index, result in enumerate(results):
+            if index in errors:
+                result.update(status="error", errors=errors[index])
+            else:
+                result["status"] = "skipped"
+        return results, False
+
+    ids = _write(operations, fields, relations[3])
+    for index, result in enumerate(results):
+        result.update(id=ids[index], status=f"{result['op']}d")
+
+    return results, True
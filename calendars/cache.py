@@ -0,0 +1,84 @@
+"""
+일정 조회(ScheduleListView, HeatmapView) 응답 캐시.
+
+응답은 (유저, 캘린더 집합, 보기, 기간, 커서)로 캐시합니다. 캐시 키에는 요청된 캘린더들의
+(id, version, updated_at)이 들어갑니다. 일정이 바뀌면 그 캘린더가 touch되어 version이 바뀌므로
+그 캘린더를 포함한 응답은 새 키를 쓰고, 이전 응답은 쓰이지 않다가 LRU로 밀려납니다.
+version은 ETag와 함께 DB에서 읽으므로, 캐시가 프로세스마다 따로 있어도(LocMemCache)
+다른 프로세스에서 바뀐 일정을 캐시에서 돌려주지 않습니다.
+
+적중률 통계(`stats`)는 캐시에 저장하므로 여러 프로세스의 값을 모으려면 Redis, Memcached,
+DB 캐시 등 공유 백엔드를 써야 합니다. 관리 명령 `schedule_cache_stats`는 공유 백엔드에서만 동작합니다.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+STATS = ("hits", "misses", "invalidations")
+
+
+def get_cache():
+    return caches[settings.SCHEDULE_CACHE_ALIAS]
+
+
+def is_shared() -> bool:
+    """
+    여러 프로세스가 같은 캐시를 보는 백엔드인지 여부입니다. LocMemCache는 프로세스마다 따로 있습니다.
+    """
+    return not isinstance(get_cache(), (LocMemCache, DummyCache))
+
+
+def _incr_stat(name, delta=1):
+    cache = get_cache()
+    key = f"schedule-stats:{name}"
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        # add와 incr 사이에 밀려난 경우입니다. 통계이므로 한 번 놓쳐도 괜찮습니다.
+        pass
+
+
+def page_key(user_id, calendars, *parts) -> str:
+    """
+    조회 응답의 캐시 키를 만듭니다. calendars는 요청된 캘린더들이며 pk, version, updated_at만 읽습니다.
+    """
+    rows = sorted((c.pk, c.version, c.updated_at) for c in calendars)
+
+    raw = repr((user_id, rows, parts))
+    return "schedule-page:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_page(key):
+    payload = get_cache().get(key)
+    _incr_stat("misses" if payload is None else "hits")
+    return payload
+
+
+def set_page(key, payload):
+    get_cache().set(key, payload, timeout=settings.SCHEDULE_CACHE_TIMEOUT)
+
+
+def record_invalidations(count):
+    """
+    캘린더 count개가 바뀌어 그 캘린더들의 캐시된 응답이 더 이상 쓰이지 않게 되었음을 통계에 기록합니다.
+    """
+    if count:
+        _incr_stat("invalidations", count)
+
+
+def stats() -> dict:
+    values = get_cache().get_many([f"schedule-stats:{name}" for name in STATS])
+    result = {name: values.get(f"schedule-stats:{name}", 0) for name in STATS}
+
+    lookups = result["hits"] + result["misses"]
+    result["hit_rate"] = result["hits"] / lookups if lookups else 0.0
+    return result
+
+
+def reset_stats():
+    get_cache().delete_many([f"schedule-stats:{name}" for name in STATS])
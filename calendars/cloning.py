@@ -0,0 +1,131 @@
+"""
+일정 복제.
+
+원본 일정과 메모, 참여자, 태그 연결을 종류별로 한 번씩 읽은 뒤, 하나의 트랜잭션 안에서
+메모, 일정, M2M 중간 테이블을 각각 bulk_create로 씁니다. 복제하는 일정 수와 관계없이
+쿼리 수가 일정합니다.
+"""
+
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.db import transaction
+
+from calendars.models import Schedule
+from memos.models import Memo
+from tags.models import Tag
+
+BATCH_SIZE = 500
+
+ScheduleParticipant = Schedule.participant.through
+ScheduleTag = Tag.schedule.through
+MemoTag = Tag.memo.through
+
+
+def _copy(instance, **overrides):
+    """
+    pk를 제외한 컬럼 값을 그대로 가진 저장되지 않은 인스턴스를 만듭니다.
+    created_at, updated_at은 저장할 때 새로 채워집니다.
+    """
+    values = {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields
+        if not field.primary_key
+    }
+    values.update(overrides)
+    return type(instance)(**values)
+
+
+def _shift(schedule, delta: timedelta):
+    """
+    일정의 날짜 필드(반복 규칙 포함)를 delta만큼 옮깁니다.
+    """
+    schedule.start_date += delta
+    if schedule.end_date is not None:
+        schedule.end_date += delta
+    if schedule.repeat_until is not None:
+        schedule.repeat_until += delta
+    schedule.repeat_exdates = [
+        (date.fromisoformat(value) + delta).isoformat()
+        for value in schedule.repeat_exdates
+    ]
+
+
+def _links(through, column, sources):
+    """
+    원본(sources 서브쿼리)의 M2M 연결을 {원본 id: [상대 id, ...]}로 읽습니다.
+    """
+    owner, target = column
+    links = defaultdict(list)
+    rows = through.objects.filter(**{f"{owner}__in": sources}).values_list(
+        owner, target
+    )
+    for owner_id, target_id in rows:
+        links[owner_id].append(target_id)
+    return links
+
+
+def clone_schedules(queryset, *, days=0, calendar=None):
+    """
+    queryset의 일정들을 메모, 참여자, 태그 연결과 함께 복제하고 복제본 목록을 반환합니다.
+
+    - days만큼 날짜를 옮깁니다. 반복 규칙의 종료일과 제외일도 함께 옮깁니다.
+    - calendar가 있으면 복제본을 그 캘린더에 만듭니다.
+    - 복제본은 외부 캘린더와 연결되지 않습니다(ical_uid 없음).
+
+    날짜가 표현할 수 있는 범위를 벗어나면 OverflowError가 발생합니다.
+    """
+    sources = list(queryset.select_related("memo").order_by("pk"))
+    if not sources:
+        return []
+
+    source_ids = queryset.values("pk")
+    participants = _links(ScheduleParticipant, ("schedule_id", "user_id"), source_ids)
+    schedule_tags = _links(ScheduleTag, ("schedule_id", "tag_id"), source_ids)
+    memo_tags = _links(
+        MemoTag,
+        ("memo_id", "tag_id"),
+        queryset.filter(memo__isnull=False).values("memo_id"),
+    )
+
+    delta = timedelta(days=days)
+    memos, clones = [], []
+    for source in sources:
+        clone = _copy(
+            source,
+            calendar_id=calendar.pk if calendar else source.calendar_id,
+            memo_id=None,
+            ical_uid=None,
+            ical_hash=None,
+        )
+        _shift(clone, delta)
+        if source.memo is not None:
+            clone.memo = _copy(source.memo)
+            memos.append(clone.memo)
+        clones.append(clone)
+
+    with transaction.atomic():
+        Memo.objects.bulk_create(memos, batch_size=BATCH_SIZE)
+        Schedule.objects.bulk_create(clones, batch_size=BATCH_SIZE)
+
+        participant_rows, schedule_tag_rows, memo_tag_rows = [], [], []
+        for source, clone in zip(sources, clones):
+            participant_rows += [
+                ScheduleParticipant(schedule_id=clone.pk, user_id=user_id)
+                for user_id in participants[source.pk]
+            ]
+            schedule_tag_rows += [
+                ScheduleTag(schedule_id=clone.pk, tag_id=tag_id)
+                for tag_id in schedule_tags[source.pk]
+            ]
+            if source.memo_id is not None:
+                memo_tag_rows += [
+                    MemoTag(memo_id=clone.memo.pk, tag_id=tag_id)
+                    for tag_id in memo_tags[source.memo_id]
+                ]
+
+        ScheduleParticipant.objects.bulk_create(participant_rows, batch_size=BATCH_SIZE)
+        ScheduleTag.objects.bulk_create(schedule_tag_rows, batch_size=BATCH_SIZE)
+        MemoTag.objects.bulk_create(memo_tag_rows, batch_size=BATCH_SIZE)
+
+    return clones
@@ -0,0 +1,132 @@
+"""
+일정 겹침(충돌) 검사.
+
+쓰려는 일정의 [starts_at, ends_at) 구간과 겹치는 일정을 같은 캘린더, 그리고 같은 참여자의
+일정(참여자가 소유하거나 참여하는 일정) 중에서 찾습니다.
+단일 일정은 starts_at/ends_at 인덱스를 쓰는 겹침 쿼리로 찾고, 반복 일정은 기간 안에
+걸칠 수 있는 규칙만 읽어 그 기간 안에서만 전개합니다. 유저의 전체 일정을 읽지 않습니다.
+
+쓰려는 일정이 반복 일정이면 처음 `HORIZON` 동안의 발생만 검사합니다.
+"""
+
+import copy
+from bisect import bisect_right
+from datetime import date, timedelta
+
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from calendars import recurrence
+from calendars.intervals import merge_intervals
+from calendars.models import Schedule
+
+HORIZON = timedelta(days=366)
+MAX_CONFLICTS = 20
+
+ScheduleParticipant = Schedule.participant.through
+
+
+def preview(fields, instance=None) -> Schedule:
+    """
+    fields(검증된 데이터)를 반영한, 저장하지 않은 일정입니다. instance가 있으면 그 복사본에 덮어씁니다.
+    M2M과 메모처럼 일정 행에 없는 값은 무시합니다.
+    """
+    schedule = copy.copy(instance) if instance is not None else Schedule()
+    for name, value in fields.items():
+        field = Schedule._meta.get_field(name)
+        if field.concrete and not field.many_to_many and name != "memo":
+            setattr(schedule, name, value)
+
+    schedule.sync_range()
+    return schedule
+
+
+def _target_intervals(schedule):
+    if schedule.repeat_frequency is None:
+        return [(schedule.starts_at, schedule.ends_at)]
+
+    horizon_end = (
+        schedule.start_date + HORIZON
+        if schedule.start_date <= date.max - HORIZON
+        else date.max
+    )
+    occurrences = recurrence.expand(schedule, schedule.start_date, horizon_end)
+    return merge_intervals((o.starts_at, o.ends_at) for o in occurrences)
+
+
+def _scope(schedule, participant_ids):
+    condition = Q(calendar_id=schedule.calendar_id)
+    if participant_ids:
+        condition |= Q(calendar__user_id__in=participant_ids) | Exists(
+            ScheduleParticipant.objects.filter(
+                schedule_id=OuterRef("pk"), user_id__in=participant_ids
+            )
+        )
+
+    queryset = Schedule.objects.filter(condition).select_related("calendar")
+    if schedule.pk is not None:
+        queryset = queryset.exclude(pk=schedule.pk)
+    return queryset
+
+
+def find_conflicts(schedule, participant_ids=(), user=None):
+    """
+    schedule과 겹치는 일정을 시작 시각 순으로 최대 MAX_CONFLICTS개 반환합니다.
+
+    각 항목은 id, title, calendar, start, end를 가진 dict이며 반복 일정은 처음 겹치는 발생의 구간을 가집니다.
+    user의 캘린더에 있지 않은 일정(다른 참여자의 일정)은 id, title, calendar를 숨깁니다.
+    """
+    intervals = _target_intervals(schedule)
+    if not intervals:
+        return []
+
+    window_start, window_end = intervals[0][0], intervals[-1][1]
+    ends = [end for _, end in intervals]
+
+    def overlaps(start, end):
+        # 병합된 구간은 끝 시각도 정렬되어 있으므로 start 이후에 끝나는 첫 구간만 보면 됩니다.
+        index = bisect_right(ends, start)
+        return index < len(intervals) and intervals[index][0] < end
+
+    scope = _scope(schedule, participant_ids)
+    found = []
+
+    singles = (
+        scope.filter(repeat_frequency__isnull=True)
+        .overlapping(window_start, window_end)
+        .order_by("starts_at", "pk")
+    )
+    for single in singles.iterator():
+        if overlaps(single.starts_at, single.ends_at):
+            found.append(single)
+            if len(found) == MAX_CONFLICTS:
+                break
+
+    first_day = timezone.localdate(window_start)
+    last_day = timezone.localdate(window_end) + timedelta(days=1)
+    rules = scope.recurring_overlapping(window_start, window_end)
+    for rule in rules:
+        occurrence = next(
+            (
+                o
+                for o in recurrence.occurrences_between(rule, first_day, last_day)
+                if overlaps(o.starts_at, o.ends_at)
+            ),
+            None,
+        )
+        if occurrence is not None:
+            found.append(occurrence)
+
+    found.sort(key=lambda s: (s.starts_at, s.pk))
+    return [_describe(s, user) for s in found[:MAX_CONFLICTS]]
+
+
+def _describe(schedule, user):
+    visible = user is None or schedule.calendar.user_id == user.pk
+    return {
+        "id": schedule.pk if visible else None,
+        "title": schedule.title if visible else None,
+        "calendar": schedule.calendar.title if visible else None,
+        "start": schedule.starts_at,
+        "end": schedule.ends_at,
+    }
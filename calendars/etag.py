@@ -0,0 +1,62 @@
+"""
+캘린더 변경 토큰 기반의 조건부 GET(ETag / Last-Modified).
+
+일정이 바뀌면 그 일정이 속한 캘린더가 touch되어 version과 updated_at이 바뀝니다.
+응답의 ETag는 요청된 캘린더들의 (id, version, updated_at)과 조회 조건으로 만들기 때문에
+캘린더 행만 읽고도, 일정 행은 건드리지 않고 304 Not Modified를 판단할 수 있습니다.
+
+캘린더 목록처럼 여러 캘린더를 모아 보여주는 응답은 Last-Modified를 보내지 않습니다.
+캘린더가 삭제되거나 공유가 해제되면 남은 캘린더의 max(updated_at)이 과거로 돌아가므로
+If-Modified-Since로는 바뀐 목록을 알아챌 수 없습니다. 이런 응답은 ETag로만 판단합니다.
+"""
+
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+def calendar_validators(calendars, *parts):
+    """
+    캘린더들과 조회 조건 parts로 (ETag, Last-Modified 타임스탬프)를 만듭니다.
+    캘린더는 pk, version, updated_at만 읽습니다. 캘린더가 하나도 없으면 Last-Modified는 None입니다.
+    """
+    rows = sorted((c.pk, c.version, c.updated_at) for c in calendars)
+
+    digest = hashlib.sha256(repr((rows, parts)).encode("utf-8")).hexdigest()[:32]
+    last_modified = max((updated_at for _, _, updated_at in rows), default=None)
+
+    return quote_etag(digest), last_modified and int(last_modified.timestamp())
+
+
+def calendar_set_validators(calendars, *parts):
+    """
+    여러 캘린더를 모아 보여주는 응답의 validators입니다. ETag만 만들고 Last-Modified는 None입니다.
+    """
+    etag, _ = calendar_validators(calendars, *parts)
+    return etag, None
+
+
+def not_modified(request, validators):
+    """
+    요청의 If-None-Match / If-Modified-Since가 validators와 맞으면 304 응답을, 아니면 None을 반환합니다.
+    """
+    etag, last_modified = validators
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        set_validators(response, validators)
+
+    return response
+
+
+def set_validators(response, validators):
+    """
+    응답에 ETag와 Last-Modified 헤더를 붙입니다. 응답은 유저마다 다르므로 Authorization으로 구분합니다.
+    """
+    etag, last_modified = validators
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    patch_vary_headers(response, ("Authorization",))
+
+    return response
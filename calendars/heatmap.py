@@ -0,0 +1,79 @@
+"""
+월/연 단위 히트맵(날짜별 일정 수) 계산.
+
+하루 안에 끝나는 단일 일정은 start_date로 GROUP BY 하여 날짜별 개수만 읽습니다.
+여러 날에 걸친 단일 일정은 구간만 읽어 걸친 날마다 세고, 반복 일정은 기간 안에서 전개해 셉니다.
+결과는 일정 조회 캐시(`calendars.cache`)에 캘린더 version과 함께 캐시되므로,
+캘린더의 일정이 바뀌면 그 캘린더를 포함한 히트맵을 다시 계산합니다.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from calendars import recurrence
+
+
+def _days(start: datetime, end: datetime, window_start, window_end):
+    """
+    [start, end) 구간이 기간 안에서 걸친 날짜들을 생성합니다. 길이가 0인 구간은 시작일에 속합니다.
+    """
+    start, end = max(start, window_start), min(max(start, end), window_end)
+    if start >= window_end or end < start:
+        return
+
+    day = timezone.localdate(start)
+    last = timezone.localdate(max(start, end - timedelta(microseconds=1)))
+    while day <= last:
+        yield day
+        day += timedelta(days=1)
+
+
+def day_counts(schedules, first_day: date, last_day: date) -> list[int]:
+    """
+    schedules(QuerySet) 중 [first_day, last_day] 의 날짜별 일정(반복 일정의 발생 포함) 수를 반환합니다.
+    여러 날에 걸친 일정은 걸친 날마다 셉니다.
+    """
+    counts = [0] * ((last_day - first_day).days + 1)
+
+    def add(day, n=1):
+        if first_day <= day <= last_day:
+            counts[(day - first_day).days] += n
+
+    tz = timezone.get_default_timezone()
+    window_start = datetime.combine(first_day, time.min, tz)
+    window_end = datetime.combine(last_day + timedelta(days=1), time.min, tz)
+
+    singles = schedules.filter(repeat_frequency__isnull=True)
+    one_day = Q(end_date__isnull=True) | Q(end_date__lte=F("start_date"))
+
+    grouped = (
+        singles.filter(one_day, start_date__range=(first_day, last_day))
+        .order_by()
+        .values_list("start_date")
+        .annotate(count=Count("pk"))
+    )
+    for day, count in grouped:
+        add(day, count)
+
+    spans = (
+        singles.exclude(one_day)
+        .overlapping(window_start, window_end)
+        .values_list("starts_at", "ends_at")
+    )
+    for start, end in spans:
+        for day in _days(start, end, window_start, window_end):
+            add(day)
+
+    rules = schedules.recurring_overlapping(window_start, window_end)
+    for rule in rules:
+        for occurrence in recurrence.occurrences_between(
+            rule, first_day, last_day + timedelta(days=1)
+        ):
+            for day in _days(
+                occurrence.starts_at, occurrence.ends_at, window_start, window_end
+            ):
+                add(day)
+
+    return counts
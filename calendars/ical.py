@@ -0,0 +1,371 @@
+"""
+iCalendar(RFC 5545) 변환.
+
+Schedule을 VEVENT로 씁니다. 반복 일정은 발생을 전개하지 않고 RRULE/EXDATE로 내보냅니다.
+시간이 있는 일정은 UTC 시각으로, 시간이 없는 일정은 종일(DATE) 일정으로 씁니다.
+
+가져오기는 줄 단위 스트림을 VEVENT 하나씩 파싱하므로 큰 파일도 전체를 메모리에 올리지 않습니다.
+"""
+
+import re
+from datetime import date, datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.utils import timezone
+
+PRODID = "-//PlanB//Schedule Integrator//KO"
+UID_DOMAIN = "planb"
+LINE_LIMIT = 75  # 줄바꿈 없이 쓸 수 있는 최대 octet 수
+
+
+def escape_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """
+    75 octet을 넘는 줄을 CRLF와 공백으로 접습니다. UTF-8 문자 중간에서는 자르지 않습니다.
+    """
+    encoded = line.encode("utf-8")
+    if len(encoded) <= LINE_LIMIT:
+        return line + "\r\n"
+
+    parts, current, size = [], [], 0
+    limit = LINE_LIMIT
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > limit:
+            parts.append("".join(current))
+            current, size = [], 0
+            # 이어지는 줄은 맨 앞 공백 한 칸을 포함해 75 octet입니다.
+            limit = LINE_LIMIT - 1
+        current.append(char)
+        size += width
+    parts.append("".join(current))
+
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _utc(value: datetime) -> str:
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _date(value: date) -> str:
+    return value.strftime("%Y%m%d")
+
+
+def is_all_day(schedule) -> bool:
+    return schedule.start_time is None and schedule.end_time is None
+
+
+def event_uid(schedule) -> str:
+    return f"schedule-{schedule.pk}@{UID_DOMAIN}"
+
+
+def _rrule(schedule, all_day: bool) -> str:
+    parts = [f"FREQ={schedule.repeat_frequency.upper()}"]
+    if schedule.repeat_interval and schedule.repeat_interval > 1:
+        parts.append(f"INTERVAL={schedule.repeat_interval}")
+    if schedule.repeat_count:
+        parts.append(f"COUNT={schedule.repeat_count}")
+    elif schedule.repeat_until:
+        if all_day:
+            parts.append(f"UNTIL={_date(schedule.repeat_until)}")
+        else:
+            # repeat_until 당일의 발생까지 포함합니다.
+            until = datetime.combine(
+                schedule.repeat_until, time.max, timezone.get_default_timezone()
+            )
+            parts.append(f"UNTIL={_utc(until)}")
+    if schedule.repeat_weekdays:
+        parts.append(f"BYDAY={schedule.repeat_weekdays}")
+
+    return "RRULE:" + ";".join(parts)
+
+
+def vevent(schedule) -> list[str]:
+    """
+    일정 하나의 VEVENT 줄 목록을 반환합니다.
+    schedule의 memo와 schedule_tags는 미리 불러와 두어야 합니다.
+    """
+    all_day = is_all_day(schedule)
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event_uid(schedule)}",
+        # 같은 내용이면 같은 본문이 나오도록 DTSTAMP에도 수정 시각을 씁니다.
+        f"DTSTAMP:{_utc(schedule.updated_at)}",
+    ]
+
+    if all_day:
+        end_date = schedule.end_date or schedule.start_date
+        lines.append(f"DTSTART;VALUE=DATE:{_date(schedule.start_date)}")
+        if end_date < date.max:
+            lines.append(f"DTEND;VALUE=DATE:{_date(end_date + timedelta(days=1))}")
+    else:
+        lines += [
+            f"DTSTART:{_utc(schedule.starts_at)}",
+            f"DTEND:{_utc(schedule.ends_at)}",
+        ]
+
+    lines.append(f"SUMMARY:{escape_text(schedule.title)}")
+    if schedule.memo is not None and schedule.memo.text:
+        lines.append(f"DESCRIPTION:{escape_text(schedule.memo.text)}")
+
+    tags = [escape_text(tag.title) for tag in schedule.schedule_tags.all()]
+    if tags:
+        lines.append("CATEGORIES:" + ",".join(tags))
+
+    lines.append(f"LAST-MODIFIED:{_utc(schedule.updated_at)}")
+
+    if schedule.repeat_frequency:
+        lines.append(_rrule(schedule, all_day))
+        for exdate in schedule.repeat_exdates or ():
+            excluded = date.fromisoformat(exdate)
+            if all_day:
+                lines.append(f"EXDATE;VALUE=DATE:{_date(excluded)}")
+            else:
+                start = schedule.starts_at.astimezone(timezone.get_default_timezone())
+                lines.append(
+                    f"EXDATE:{_utc(datetime.combine(excluded, start.timetz()))}"
+                )
+
+    lines.append("END:VEVENT")
+    return lines
+
+
+def render_calendar(calendar, schedules):
+    """
+    VCALENDAR를 접힌 줄 단위로 생성합니다. schedules는 한 번에 하나씩만 소비합니다.
+    """
+    header = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{escape_text(calendar.title)}",
+    ]
+    for line in header:
+        yield fold(line)
+
+    for schedule in schedules:
+        for line in vevent(schedule):
+            yield fold(line)
+
+    yield fold("END:VCALENDAR")
+
+
+# 가져오기(파싱)
+
+
+def unescape_text(value: str) -> str:
+    result, chars = [], iter(value)
+    for char in chars:
+        if char != "\\":
+            result.append(char)
+            continue
+        following = next(chars, "")
+        result.append("\n" if following in ("n", "N") else following)
+
+    return "".join(result)
+
+
+def iter_lines(stream):
+    """
+    바이트(또는 문자열) 줄 스트림을 접힌 줄을 이어 붙인 content line 단위로 생성합니다.
+    """
+    pending = None
+    for raw in stream:
+        line = raw.decode("utf-8", errors="replace") if isinstance(raw, bytes) else raw
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+
+        if pending:
+            yield pending
+        pending = line
+
+    if pending:
+        yield pending
+
+
+def parse_line(line: str):
+    """
+    `NAME;PARAM=VALUE:value` 형식의 줄을 (이름, 파라미터 dict, 값)으로 나눕니다.
+    """
+    quoted = False
+    for index, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif char == ":" and not quoted:
+            head, value = line[:index], line[index + 1 :]
+            break
+    else:
+        return line.upper(), {}, ""
+
+    name, *raw_params = head.split(";")
+    params = {}
+    for raw in raw_params:
+        key, _, param_value = raw.partition("=")
+        params[key.upper()] = param_value.strip('"')
+
+    return name.upper(), params, value
+
+
+def iter_events(stream):
+    """
+    VEVENT마다 {속성 이름: [(파라미터, 값), ...]} dict를 생성합니다.
+    VEVENT 안의 VALARM 같은 하위 컴포넌트는 무시합니다. 한 번에 이벤트 하나만 메모리에 둡니다.
+    """
+    event, depth = None, 0
+    for line in iter_lines(stream):
+        name, params, value = parse_line(line)
+        if name == "BEGIN":
+            if event is not None:
+                depth += 1
+            elif value.upper() == "VEVENT":
+                event = {}
+        elif name == "END":
+            if event is not None and depth:
+                depth -= 1
+            elif event is not None and value.upper() == "VEVENT":
+                yield event
+                event = None
+        elif event is not None and not depth:
+            event.setdefault(name, []).append((params, value))
+
+
+def parse_date_value(params, value):
+    """
+    DATE 또는 DATE-TIME 값을 기본 시간대의 (날짜, 시간)으로 바꿉니다. DATE 값의 시간은 None입니다.
+    """
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return datetime.strptime(value[:8], "%Y%m%d").date(), None
+
+    parsed = datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+    if value.endswith("Z"):
+        parsed = parsed.replace(tzinfo=dt_timezone.utc)
+    else:
+        try:
+            tz = ZoneInfo(params["TZID"])
+        except (KeyError, ValueError, ZoneInfoNotFoundError):
+            # 시간대가 없는(floating) 시각은 기본 시간대로 해석합니다.
+            tz = timezone.get_default_timezone()
+        parsed = parsed.replace(tzinfo=tz)
+
+    local = timezone.localtime(parsed)
+    return local.date(), local.time()
+
+
+DURATION_PATTERN = re.compile(
+    r"^(?P<sign>[+-])?P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
+)
+
+
+def parse_duration(value: str) -> timedelta | None:
+    match = DURATION_PATTERN.match(value.strip())
+    if not match:
+        return None
+
+    parts = {k: int(v) for k, v in match.groupdict().items() if v and k != "sign"}
+    duration = timedelta(**parts)
+    return -duration if match["sign"] == "-" else duration
+
+
+# 엔진(`calendars.recurrence`)이 그대로 전개할 수 있는 RRULE 요소만 가져옵니다.
+SUPPORTED_RRULE_PARTS = {"FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "WKST"}
+
+
+def parse_rrule(value: str):
+    """
+    RRULE을 Schedule의 repeat_* 필드로 바꿉니다. 엔진이 표현할 수 없는 규칙이면 None을 반환합니다.
+    """
+    parts = dict(part.partition("=")[::2] for part in value.upper().split(";") if part)
+    frequency = parts.get("FREQ", "").lower()
+    if frequency not in {"daily", "weekly", "monthly", "yearly"}:
+        return None
+    if set(parts) - SUPPORTED_RRULE_PARTS:
+        return None
+
+    weekdays = [day for day in parts.get("BYDAY", "").split(",") if day]
+    # "2MO"(둘째 월요일)처럼 순번이 붙은 요일은 지원하지 않습니다.
+    if any(day not in ("MO", "TU", "WE", "TH", "FR", "SA", "SU") for day in weekdays):
+        return None
+
+    fields = {
+        "repeat_frequency": frequency,
+        "repeat_interval": int(parts.get("INTERVAL", 1)),
+        "repeat_count": int(parts["COUNT"]) if "COUNT" in parts else None,
+        "repeat_until": None,
+        "repeat_weekdays": ",".join(weekdays),
+    }
+    if "UNTIL" in parts:
+        fields["repeat_until"] = parse_date_value({}, parts["UNTIL"])[0]
+
+    return fields
+
+
+def event_fields(event):
+    """
+    VEVENT를 Schedule 필드 dict로 바꿉니다. 가져올 수 없는 이벤트면 None을 반환합니다.
+
+    - 반복 일정의 개별 수정본(RECURRENCE-ID)과 취소된 이벤트는 가져오지 않습니다.
+    - 엔진이 표현할 수 없는 RRULE은 첫 발생만 단일 일정으로 가져옵니다.
+    """
+    if "DTSTART" not in event or "RECURRENCE-ID" in event:
+        return None
+    if event.get("STATUS", [({}, "")])[0][1].upper() == "CANCELLED":
+        return None
+
+    params, value = event["DTSTART"][0]
+    start_date, start_time = parse_date_value(params, value)
+    end_date, end_time = start_date, start_time
+
+    if "DTEND" in event:
+        params, value = event["DTEND"][0]
+        end_date, end_time = parse_date_value(params, value)
+        if start_time is None:
+            # 종일 일정의 DTEND는 다음 날(배타적)입니다.
+            end_date = max(start_date, end_date - timedelta(days=1))
+    elif "DURATION" in event and start_time is not None:
+        duration = parse_duration(event["DURATION"][0][1])
+        if duration:
+            start = datetime.combine(start_date, start_time)
+            end_date, end_time = (start + duration).date(), (start + duration).time()
+
+    summary = unescape_text(event.get("SUMMARY", [({}, "")])[0][1]).strip()
+    fields = {
+        "title": summary[:50] or "(제목 없음)",
+        "start_date": start_date,
+        "start_time": start_time,
+        "end_date": end_date,
+        "end_time": end_time,
+        "repeat_frequency": None,
+        "repeat_interval": 1,
+        "repeat_count": None,
+        "repeat_until": None,
+        "repeat_weekdays": "",
+        "repeat_exdates": [],
+    }
+
+    rule = parse_rrule(event["RRULE"][0][1]) if "RRULE" in event else None
+    if rule:
+        fields.update(rule)
+        exdates = set()
+        for params, value in event.get("EXDATE", ()):
+            exdates.update(
+                parse_date_value(params, item)[0].isoformat()
+                for item in value.split(",")
+                if item
+            )
+        fields["repeat_exdates"] = sorted(exdates)
+
+    return fields
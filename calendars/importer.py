@@ -0,0 +1,188 @@
+"""
+외부 iCalendar(예: User.google_cal_url) 가져오기.
+
+피드를 VEVENT 하나씩 스트림으로 읽어 `BATCH_SIZE`개씩 처리합니다. 일정은 유저의 가져오기 전용
+캘린더에 (calendar, ical_uid)로 대응되며, 파싱한 필드의 해시(`ical_hash`)가 같으면 건너뛰므로
+다시 동기화할 때는 바뀐 행만 씁니다. 피드에서 사라진 이벤트의 일정은 삭제합니다.
+피드 주소는 공개 인터넷의 http(s) 주소만 엽니다(`open_source`).
+"""
+
+import hashlib
+import ipaddress
+import json
+import socket
+from collections import Counter
+from urllib.parse import urlparse
+from urllib.request import HTTPRedirectHandler, build_opener
+
+from django.db import transaction
+from django.utils import timezone
+
+from calendars import ical
+from calendars.models import Calendar, Schedule
+
+IMPORT_CALENDAR = "Google Calendar"
+BATCH_SIZE = 1000
+FETCH_TIMEOUT = 30  # 초
+
+IMPORT_FIELDS = [
+    "title",
+    "start_date",
+    "start_time",
+    "end_date",
+    "end_time",
+    "repeat_frequency",
+    "repeat_interval",
+    "repeat_count",
+    "repeat_until",
+    "repeat_weekdays",
+    "repeat_exdates",
+]
+
+
+def check_public_url(url: str):
+    """
+    공개 인터넷의 http(s) 주소인지 확인합니다. 그 외의 scheme이나, 호스트가 루프백·사설·링크 로컬 등
+    내부 주소로 해석되면 ValueError를 발생시킵니다. 서버가 내부망을 대신 요청하지 않게 합니다(SSRF).
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        raise ValueError(f"http(s) 주소만 가져올 수 있습니다: {url}")
+
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    for *_, sockaddr in socket.getaddrinfo(
+        parsed.hostname, port, proto=socket.IPPROTO_TCP
+    ):
+        if not ipaddress.ip_address(sockaddr[0]).is_global:
+            raise ValueError(f"내부 주소는 가져올 수 없습니다: {parsed.hostname}")
+
+
+class _PublicRedirectHandler(HTTPRedirectHandler):
+    """
+    리다이렉트로 내부 주소나 다른 scheme으로 옮겨 가는 것도 막습니다.
+    """
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        check_public_url(newurl)
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+_opener = build_opener(_PublicRedirectHandler)
+
+
+def open_source(url: str):
+    """
+    공개 http(s) 주소의 피드를 내려받는 스트림으로 엽니다.
+    """
+    check_public_url(url)
+    return _opener.open(url, timeout=FETCH_TIMEOUT)
+
+
+def content_hash(fields) -> str:
+    raw = json.dumps(fields, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _batches(events, seen, counts):
+    """
+    (uid, 필드, 해시) 목록을 BATCH_SIZE개씩 생성합니다. 같은 UID는 처음 것만 씁니다.
+
+    읽은 UID는 seen에 더합니다. 날짜나 반복 규칙을 해석할 수 없는 이벤트는 건너뛰고
+    skipped로 셉니다. 그 UID도 seen에 더하므로 이전에 가져온 일정은 지우지 않고 그대로 둡니다.
+    """
+    batch = []
+    for event in events:
+        uid = event.get("UID", [({}, "")])[0][1].strip()[:255]
+        if not uid or uid in seen:
+            continue
+
+        try:
+            fields = ical.event_fields(event)
+        except (ValueError, OverflowError):
+            seen.add(uid)
+            counts["skipped"] += 1
+            continue
+        if fields is None:
+            continue
+
+        seen.add(uid)
+        batch.append((uid, fields, content_hash(fields)))
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def _write_batch(calendar, batch, counts):
+    existing = {
+        schedule.ical_uid: schedule
+        for schedule in Schedule.objects.filter(
+            calendar=calendar, ical_uid__in=[uid for uid, _, _ in batch]
+        )
+    }
+
+    created, updated = [], []
+    now = timezone.now()
+    for uid, fields, digest in batch:
+        schedule = existing.get(uid)
+        if schedule is None:
+            created.append(
+                Schedule(calendar=calendar, ical_uid=uid, ical_hash=digest, **fields)
+            )
+        elif schedule.ical_hash != digest:
+            for attr, value in fields.items():
+                setattr(schedule, attr, value)
+            schedule.ical_hash = digest
+            schedule.updated_at = now
+            updated.append(schedule)
+
+    with transaction.atomic():
+        Schedule.objects.bulk_create(created)
+        if updated:
+            Schedule.objects.bulk_update(
+                updated, [*IMPORT_FIELDS, "ical_hash", "updated_at"]
+            )
+
+    counts["created"] += len(created)
+    counts["updated"] += len(updated)
+    counts["unchanged"] += len(batch) - len(created) - len(updated)
+
+
+def _delete_missing(calendar, seen_uids, counts):
+    """
+    피드에서 사라진 이벤트의 일정을 BATCH_SIZE개씩 삭제합니다.
+    """
+    rows = (
+        Schedule.objects.filter(calendar=calendar, ical_uid__isnull=False)
+        .values_list("pk", "ical_uid")
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    missing = [pk for pk, uid in rows if uid not in seen_uids]
+
+    for start in range(0, len(missing), BATCH_SIZE):
+        pks = missing[start : start + BATCH_SIZE]
+        Schedule.objects.filter(pk__in=pks).delete()
+        counts["deleted"] += len(pks)
+
+
+def import_feed(user, stream) -> Counter:
+    """
+    줄 단위 스트림의 iCalendar를 유저의 가져오기 캘린더로 동기화합니다.
+    created, updated, unchanged, deleted, skipped(해석할 수 없어 건너뛴 이벤트) 개수를 반환합니다.
+    """
+    calendar, _ = Calendar.objects.get_or_create(user=user, title=IMPORT_CALENDAR)
+
+    counts = Counter(created=0, updated=0, unchanged=0, deleted=0, skipped=0)
+    seen_uids = set()
+    for batch in _batches(ical.iter_events(stream), seen_uids, counts):
+        _write_batch(calendar, batch, counts)
+
+    _delete_missing(calendar, seen_uids, counts)
+    return counts
+
+
+def import_user(user) -> Counter:
+    with open_source(user.google_cal_url) as stream:
+        return import_feed(user, stream)
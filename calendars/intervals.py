@@ -0,0 +1,89 @@
+"""
+일정의 시간 구간 계산과 구간 병합.
+
+Schedule은 날짜와 시간을 나눠 저장하고 시간은 비어 있을 수 있으므로,
+여기서 하나의 [시작, 끝) datetime 구간으로 정규화합니다.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+from django.db import models
+from django.utils import timezone
+
+_date = models.DateField()
+_time = models.TimeField()
+
+
+def schedule_bounds(schedule, tz=None) -> tuple[datetime, datetime]:
+    """
+    일정이 차지하는 [시작, 끝) 구간을 반환합니다.
+
+    - start_time이 없으면 시작일 자정부터 시작합니다.
+    - end_date가 없으면 시작일에 끝납니다.
+    - end_time이 없으면 종료일 하루 전체를 차지합니다.
+    """
+    tz = tz or timezone.get_default_timezone()
+
+    # 저장 전의 인스턴스는 datetime이나 문자열 값을 가질 수 있습니다.
+    start_date = _date.to_python(schedule.start_date)
+    start_time = _time.to_python(schedule.start_time)
+    end_date = _date.to_python(schedule.end_date) or start_date
+    end_time = _time.to_python(schedule.end_time)
+
+    start = datetime.combine(start_date, start_time or time.min, tz)
+
+    if end_time is not None:
+        end = datetime.combine(end_date, end_time, tz)
+    elif end_date < date.max:
+        end = datetime.combine(end_date + timedelta(days=1), time.min, tz)
+    else:
+        end = datetime.combine(end_date, time.max, tz)
+
+    return start, max(start, end)
+
+
+def repeat_end(schedule, ends_at: datetime):
+    """
+    반복 일정의 마지막으로 가능한 발생(repeat_until에 시작하는 발생)이 끝나는 시각입니다.
+    ends_at은 첫 발생이 끝나는 시각입니다.
+
+    반복 일정이 아니거나 repeat_until이 없으면(끝이 정해지지 않으면) None입니다.
+    """
+    until = _date.to_python(schedule.repeat_until)
+    if not schedule.repeat_frequency or until is None:
+        return None
+
+    start_date = _date.to_python(schedule.start_date)
+    try:
+        return ends_at + max(until - start_date, timedelta(0))
+    except OverflowError:
+        return None
+
+
+def merge_intervals(intervals):
+    """
+    [시작, 끝) 구간들을 시작 시각 순으로 정렬한 뒤 겹치거나 맞닿은 구간을 합칩니다.
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+
+    return [(start, end) for start, end in merged]
+
+
+def busy_intervals(schedules, window_start: datetime, window_end: datetime):
+    """
+    일정들이 차지하는 구간을 [window_start, window_end)로 잘라 병합합니다.
+    """
+    clipped = []
+    for schedule in schedules:
+        start, end = schedule_bounds(schedule)
+        start, end = max(start, window_start), min(end, window_end)
+        if start < end:
+            clipped.append((start, end))
+
+    return merge_intervals(clipped)
@@ -0,0 +1,41 @@
+from urllib.error import URLError
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from calendars import importer
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "google_cal_url이 등록된 유저들의 외부 캘린더(iCalendar)를 가져옵니다. 주기적으로 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            dest="emails",
+            action="append",
+            help="이 이메일의 유저만 가져옵니다.",
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(google_cal_url__isnull=False).exclude(
+            google_cal_url=""
+        )
+        if options["emails"]:
+            users = users.filter(email__in=options["emails"])
+
+        for user in users.iterator():
+            try:
+                counts = importer.import_user(user)
+            except (OSError, URLError, ValueError) as exc:
+                # 한 유저의 실패가 다른 유저의 가져오기를 막지 않도록 기록만 하고 넘어갑니다.
+                self.stderr.write(f"{user.email}: 가져오기에 실패했습니다. ({exc})")
+                continue
+
+            self.stdout.write(
+                f"{user.email}: 생성 {counts['created']}, 수정 {counts['updated']}, "
+                f"유지 {counts['unchanged']}, 삭제 {counts['deleted']}, "
+                f"건너뜀 {counts['skipped']}"
+            )
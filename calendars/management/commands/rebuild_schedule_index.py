@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from calendars import search
+from common.search import is_fts_available
+
+
+class Command(BaseCommand):
+    help = "일정 전문 검색 인덱스를 비우고 처음부터 다시 만듭니다."
+
+    def handle(self, *args, **options):
+        if not is_fts_available():
+            self.stderr.write("현재 DB는 FTS5 검색 인덱스를 지원하지 않습니다.")
+            return
+
+        total = search.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"{total}개의 일정을 인덱싱했습니다."))
@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from calendars import cache as schedule_cache
+
+
+class Command(BaseCommand):
+    help = "일정 조회 캐시의 적중률과 무효화 횟수를 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="출력한 뒤 통계를 초기화합니다."
+        )
+
+    def handle(self, *args, **options):
+        # 프로세스마다 따로 있는 캐시는 이 명령의 프로세스에서 항상 비어 있습니다.
+        if not schedule_cache.is_shared():
+            raise CommandError(
+                f"'{settings.SCHEDULE_CACHE_ALIAS}' 캐시가 프로세스마다 따로 있는 백엔드입니다. "
+                "통계를 모으려면 Redis, Memcached, DB 캐시 등 공유 백엔드로 설정하세요."
+            )
+
+        stats = schedule_cache.stats()
+        self.stdout.write(
+            f"hits: {stats['hits']}\n"
+            f"misses: {stats['misses']}\n"
+            f"hit rate: {stats['hit_rate']:.1%}\n"
+            f"invalidations: {stats['invalidations']}"
+        )
+
+        if options["reset"]:
+            schedule_cache.reset_stats()
+            self.stdout.write(self.style.SUCCESS("통계를 초기화했습니다."))
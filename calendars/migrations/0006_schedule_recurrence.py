@@ -0,0 +1,63 @@
+# Generated by Django 5.1.15 on 2026-10-18 03:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendars", "0005_alter_schedule_calendar"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="schedule",
+            name="repeat_count",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="repeat_exdates",
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="repeat_frequency",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("daily", "Daily"),
+                    ("weekly", "Weekly"),
+                    ("monthly", "Monthly"),
+                    ("yearly", "Yearly"),
+                ],
+                max_length=10,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="repeat_interval",
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="repeat_until",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="repeat_weekdays",
+            field=models.CharField(blank=True, default="", max_length=20),
+        ),
+        migrations.AlterField(
+            model_name="schedule",
+            name="calendar",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="calendar_schedule",
+                to="calendars.calendar",
+            ),
+        ),
+    ]
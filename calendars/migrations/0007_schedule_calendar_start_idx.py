@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-10-18 03:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendars", "0006_schedule_recurrence"),
+        ("memos", "0004_alter_memo_memo_set"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="schedule",
+            index=models.Index(
+                fields=["calendar", "start_date"], name="schedule_calendar_start_idx"
+            ),
+        ),
+    ]
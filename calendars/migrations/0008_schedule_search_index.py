@@ -0,0 +1,68 @@
+# Generated by Django 5.1.15 on 2026-10-18 04:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import common.search
+
+
+def create_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE calendars_schedule_fts USING fts5(title, memo_text)"
+    )
+    schema_editor.execute(
+        "INSERT INTO calendars_schedule_fts (rowid, title, memo_text) "
+        "SELECT s.id, s.title, COALESCE(m.text, '') "
+        "FROM calendars_schedule s LEFT JOIN memos_memo m ON m.id = s.memo_id"
+    )
+
+
+def drop_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    schema_editor.execute("DROP TABLE IF EXISTS calendars_schedule_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendars", "0007_schedule_calendar_start_idx"),
+        ("memos", "0004_alter_memo_memo_set"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScheduleSearchIndex",
+            fields=[
+                (
+                    "schedule",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="search_index",
+                        serialize=False,
+                        to="calendars.schedule",
+                    ),
+                ),
+                ("title", models.TextField()),
+                ("memo_text", models.TextField()),
+                (
+                    "document",
+                    common.search.SearchDocumentField(
+                        db_column="calendars_schedule_fts"
+                    ),
+                ),
+                ("rank", models.FloatField()),
+            ],
+            options={
+                "db_table": "calendars_schedule_fts",
+                "managed": False,
+            },
+        ),
+        migrations.RunPython(create_fts_table, drop_fts_table),
+    ]
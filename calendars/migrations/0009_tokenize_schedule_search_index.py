@@ -0,0 +1,33 @@
+from django.db import migrations
+
+from common.search import tokenize
+
+
+def retokenize(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    Schedule = apps.get_model("calendars", "Schedule")
+    rows = Schedule.objects.values_list("pk", "title", "memo__text")
+
+    schema_editor.execute("DELETE FROM calendars_schedule_fts")
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany(
+            "INSERT INTO calendars_schedule_fts (rowid, title, memo_text) "
+            "VALUES (%s, %s, %s)",
+            [
+                (pk, " ".join(tokenize(title)), " ".join(tokenize(text)))
+                for pk, title, text in rows.iterator()
+            ],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendars", "0008_schedule_search_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(retokenize, migrations.RunPython.noop),
+    ]
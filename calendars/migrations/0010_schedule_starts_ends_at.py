@@ -0,0 +1,62 @@
+from django.db import migrations, models
+
+from calendars.intervals import schedule_bounds
+
+
+def backfill_range(apps, schema_editor):
+    Schedule = apps.get_model("calendars", "Schedule")
+
+    batch = []
+    for schedule in Schedule.objects.only(
+        "start_date", "start_time", "end_date", "end_time"
+    ).iterator(chunk_size=2000):
+        schedule.starts_at, schedule.ends_at = schedule_bounds(schedule)
+        batch.append(schedule)
+        if len(batch) == 2000:
+            Schedule.objects.bulk_update(batch, ["starts_at", "ends_at"])
+            batch = []
+
+    Schedule.objects.bulk_update(batch, ["starts_at", "ends_at"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendars", "0009_tokenize_schedule_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="schedule",
+            name="starts_at",
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="ends_at",
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_range, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="schedule",
+            name="starts_at",
+            field=models.DateTimeField(editable=False),
+        ),
+        migrations.AlterField(
+            model_name="schedule",
+            name="ends_at",
+            field=models.DateTimeField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="schedule",
+            index=models.Index(
+                fields=["calendar", "starts_at"], name="schedule_calendar_starts_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="schedule",
+            index=models.Index(
+                fields=["calendar", "ends_at"], name="schedule_calendar_ends_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 04:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendars", "0010_schedule_starts_ends_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="calendar",
+            name="version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations, models
+
+import calendars.models
+from calendars.models import new_feed_token
+
+
+def fill_feed_tokens(apps, schema_editor):
+    Calendar = apps.get_model("calendars", "Calendar")
+
+    rows = list(Calendar.objects.only("pk"))
+    for calendar in rows:
+        calendar.feed_token = new_feed_token()
+    Calendar.objects.bulk_update(rows, ["feed_token"], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendars", "0011_calendar_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="calendar",
+            name="feed_token",
+            field=models.CharField(editable=False, max_length=64, null=True),
+        ),
+        migrations.RunPython(fill_feed_tokens, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="calendar",
+            name="feed_token",
+            field=models.CharField(
+                default=calendars.models.new_feed_token,
+                editable=False,
+                max_length=64,
+                unique=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.15 on 2026-10-18 04:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendars", "0012_calendar_feed_token"),
+        ("memos", "0004_alter_memo_memo_set"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="schedule",
+            name="ical_hash",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="schedule",
+            name="ical_uid",
+            field=models.CharField(
+                blank=True, editable=False, max_length=255, null=True
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="schedule",
+            constraint=models.UniqueConstraint(
+                fields=("calendar", "ical_uid"), name="unique_schedule_ical_uid"
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.15 on 2026-10-18 05:42
+
+from django.db import migrations, models
+
+from calendars.intervals import repeat_end
+
+
+def backfill_repeat_end(apps, schema_editor):
+    Schedule = apps.get_model("calendars", "Schedule")
+
+    batch = []
+    for schedule in (
+        Schedule.objects.filter(
+            repeat_frequency__isnull=False, repeat_until__isnull=False
+        )
+        .only("start_date", "repeat_frequency", "repeat_until", "ends_at")
+        .iterator(chunk_size=2000)
+    ):
+        schedule.repeat_ends_at = repeat_end(schedule, schedule.ends_at)
+        batch.append(schedule)
+        if len(batch) == 2000:
+            Schedule.objects.bulk_update(batch, ["repeat_ends_at"])
+            batch = []
+
+    Schedule.objects.bulk_update(batch, ["repeat_ends_at"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendars", "0013_schedule_ical_uid"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="schedule",
+            name="repeat_ends_at",
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_repeat_end, migrations.RunPython.noop),
+    ]
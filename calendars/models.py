@@ -1,6 +1,84 @@
+import secrets
+from datetime import time
+
 from django.db import models
+from django.db.models import Count, F, Max, Min, Q, Value, prefetch_related_objects
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
+from calendars import cache as schedule_cache
+from calendars.intervals import repeat_end, schedule_bounds
 from common.models import CommonModel
+from common.search import SearchDocumentField
+from memos import attachments
+
+# ScheduleDetailSerializer가 읽는 관계들입니다. 시리얼라이저 필드를 바꾸면 함께 수정해야 합니다.
+SCHEDULE_DETAIL_RELATED = ("calendar", "memo")
+SCHEDULE_DETAIL_PREFETCH = ("participant", "schedule_tags")
+
+# starts_at/ends_at은 이 필드들로부터 계산됩니다.
+SCHEDULE_RANGE_SOURCE_FIELDS = {
+    "start_date",
+    "start_time",
+    "end_date",
+    "end_time",
+    "repeat_frequency",
+    "repeat_until",
+}
+SCHEDULE_RANGE_FIELDS = ["starts_at", "ends_at", "repeat_ends_at"]
+
+# 일정이 "어디에" 있는지를 나타내는 필드들입니다. `schedule_span`을 참고하세요.
+SCHEDULE_SPAN_FIELDS = ("calendar_id", "starts_at", "ends_at", "repeat_frequency")
+SCHEDULE_SPAN_SOURCE_FIELDS = {"calendar", "calendar_id", "repeat_frequency"}
+
+# 전문 검색 인덱스(`calendars.search`)에 들어가는 필드들입니다. 메모 본문은 memo로 연결됩니다.
+SCHEDULE_SEARCH_SOURCE_FIELDS = {"title", "memo", "memo_id"}
+
+
+class CalendarQuerySet(models.QuerySet):
+    def touch(self):
+        """
+        캘린더의 일정이 바뀌었음을 기록합니다. version과 updated_at이 조건부 GET의 ETag가 됩니다.
+        """
+        rows = self.update(version=F("version") + 1, updated_at=timezone.now())
+        schedule_cache.record_invalidations(rows)
+        return rows
+
+    def with_stats(self, today):
+        """
+        캘린더별 일정 수(schedule_count), today 이후 가장 이른 시작일(next_start_date),
+        가장 최근 일정 수정 시각(last_schedule_updated_at)을 하나의 GROUP BY 쿼리로 주석합니다.
+        반복 일정은 하나로 세며, 다음 시작일은 첫 발생의 시작일입니다.
+        """
+        return self.annotate(
+            schedule_count=Count("calendar_schedule"),
+            next_start_date=Min(
+                "calendar_schedule__start_date",
+                filter=Q(calendar_schedule__start_date__gte=today),
+            ),
+            last_schedule_updated_at=Max("calendar_schedule__updated_at"),
+        )
+
+    def visible_to(self, user, titles=None, shared=True):
+        """
+        user가 일정을 볼 수 있는 캘린더입니다. user의 캘린더(titles가 있으면 그 이름의 캘린더)와,
+        shared이면 user가 참여자인 일정이 있는 다른 유저의 캘린더도 포함합니다.
+        `ScheduleQuerySet.visible_to`와 같은 조건이므로 그 일정들의 ETag와 캐시 키에 사용합니다.
+        """
+        own = Q(user_id=user.pk)
+        if titles is not None:
+            own &= Q(title__in=titles)
+        if not shared:
+            return self.filter(own)
+
+        participations = Schedule.participant.through.objects.filter(user_id=user.pk)
+        return self.filter(
+            own | Q(pk__in=participations.values("schedule__calendar_id"))
+        )
+
+
+def new_feed_token() -> str:
+    return secrets.token_urlsafe(32)
 
 
 class Calendar(CommonModel):
@@ -8,6 +86,14 @@ class Calendar(CommonModel):
         "users.User", on_delete=models.CASCADE, related_name="user_calendar"
     )
     title = models.CharField(max_length=50)
+    # 소속 일정(메모, 태그, 참가자 포함)이 바뀔 때마다 올라가는 변경 토큰입니다.
+    version = models.PositiveIntegerField(default=0, editable=False)
+    # iCalendar 구독 주소(feed.ics)의 인증 토큰입니다.
+    feed_token = models.CharField(
+        max_length=64, unique=True, default=new_feed_token, editable=False
+    )
+
+    objects = CalendarQuerySet.as_manager()
 
     class Meta:
         constraints = [
@@ -15,7 +101,212 @@ class Calendar(CommonModel):
         ]
 
 
+class ScheduleQuerySet(models.QuerySet):
+    def visible_to(self, user, titles=None, shared=True):
+        """
+        user의 캘린더(titles가 있으면 그 이름의 캘린더)에 있는 일정과, shared이면 user가 참여자로
+        초대된 일정을 남깁니다.
+
+        초대 시 participant 중간 테이블에 쓴 (schedule, user) 행이 유저별 공유 목록입니다.
+        두 조건은 각각 캘린더 인덱스와 중간 테이블의 user_id 인덱스로 찾으므로 JOIN 없이 OR로 합칩니다.
+        """
+        calendars = Calendar.objects.filter(user_id=user.pk)
+        if titles is not None:
+            calendars = calendars.filter(title__in=titles)
+        own = Q(calendar_id__in=calendars.values("pk"))
+        if not shared:
+            return self.filter(own)
+
+        participations = self.model.participant.through.objects.filter(user_id=user.pk)
+        return self.filter(own | Q(pk__in=participations.values("schedule_id")))
+
+    def select_details(self):
+        """
+        ScheduleDetailSerializer가 읽는 FK/1:1 관계를 JOIN으로 함께 불러옵니다.
+        """
+        return self.select_related(*SCHEDULE_DETAIL_RELATED)
+
+    def with_details(self):
+        """
+        ScheduleDetailSerializer가 읽는 모든 관계를 미리 불러옵니다.
+        몇 개의 일정을 직렬화하든 쿼리 수는 일정합니다.
+        """
+        return self.select_details().prefetch_related(*SCHEDULE_DETAIL_PREFETCH)
+
+    def in_sort_order(self):
+        """
+        `calendars.recurrence.sort_key`와 같은 (start_date, start_time, id) 순서로 정렬합니다.
+        start_time이 없으면 자정으로 취급하며, 그 값은 `sort_time`으로 주석됩니다.
+        """
+        return self.annotate(
+            sort_time=Coalesce("start_time", Value(time.min))
+        ).order_by("start_date", "sort_time", "id")
+
+    def overlapping(self, start, end):
+        """
+        [start, end) 구간과 겹치는 일정만 남깁니다. starts_at/ends_at 인덱스를 사용합니다.
+        """
+        return self.filter(starts_at__lt=end, ends_at__gt=start)
+
+    def recurring_overlapping(self, start, end):
+        """
+        [start, end) 구간에 발생이 걸칠 수 있는 반복 일정만 남깁니다.
+
+        첫 발생은 end 이전에 시작해야 하고, 마지막으로 가능한 발생은 start 이후에 끝나야 합니다.
+        repeat_until 이전에 시작해 여러 날에 걸친 발생도 구간 안까지 이어질 수 있으므로
+        repeat_until이 아니라 그 발생이 끝나는 repeat_ends_at과 비교합니다.
+        """
+        return self.filter(repeat_frequency__isnull=False, starts_at__lt=end).exclude(
+            repeat_ends_at__lte=start
+        )
+
+    def _plain(self):
+        """
+        파생 값을 이미 맞춘 뒤 쓸 때 사용하는 기본 QuerySet입니다. 아래 override를 다시 거치지 않습니다.
+        """
+        return models.QuerySet(self.model, using=self.db)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.is_repeat = obj.repeat_frequency is not None
+            obj.sync_range()
+
+        created = super().bulk_create(objs, *args, **kwargs)
+        record_schedule_changes(schedule_span(obj) for obj in objs)
+        index_schedule_changes(obj.pk for obj in objs if obj.pk is not None)
+
+        with_memo = [obj for obj in objs if obj.memo_id is not None]
+        attachments.sync(self.model, [obj.pk for obj in with_memo])
+        for obj in with_memo:
+            attachments.sync_cached_memo(obj)
+        return created
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs, fields = list(objs), list(fields)
+        if "repeat_frequency" in fields:
+            for obj in objs:
+                obj.is_repeat = obj.repeat_frequency is not None
+            if "is_repeat" not in fields:
+                fields.append("is_repeat")
+        if SCHEDULE_RANGE_SOURCE_FIELDS.intersection(fields):
+            for obj in objs:
+                obj.sync_range()
+            fields += [f for f in SCHEDULE_RANGE_FIELDS if f not in fields]
+
+        rows = self._plain().bulk_update(objs, fields, *args, **kwargs)
+        if {"memo", "memo_id"}.intersection(fields):
+            attachments.sync(self.model, [obj.pk for obj in objs])
+        if SCHEDULE_SEARCH_SOURCE_FIELDS.intersection(fields):
+            index_schedule_changes(obj.pk for obj in objs)
+
+        # 다른 캘린더나 기간으로 옮겨진 일정은 이전 위치도 함께 반영합니다.
+        spans = []
+        for obj in objs:
+            spans += [schedule_span(obj), getattr(obj, "_loaded_span", None)]
+            obj._loaded_span = schedule_span(obj)
+        record_schedule_changes(spans)
+        return rows
+
+    def update(self, **kwargs):
+        """
+        update()는 save()를 거치지 않으므로 여기서 파생 값을 맞춥니다.
+
+        - 날짜/시간 필드를 바꾸면 바뀐 행들의 starts_at/ends_at을 다시 계산합니다.
+        - 바뀌기 전과 후의 위치를 `record_schedule_changes`로 반영합니다.
+        - 메모를 바꾸면 메모의 연결 종류(`memos.attachments`)를 맞춥니다.
+        - 제목이나 메모를 바꾸면 전문 검색 인덱스에 반영합니다.
+        """
+        if "repeat_frequency" in kwargs:
+            kwargs.setdefault("is_repeat", kwargs["repeat_frequency"] is not None)
+
+        before = list(self.values_list("pk", *SCHEDULE_SPAN_FIELDS))
+        rows = super().update(**kwargs)
+        if not before:
+            return rows
+
+        if {"memo", "memo_id"}.intersection(kwargs):
+            attachments.sync(self.model, [pk for pk, *_ in before])
+        if SCHEDULE_SEARCH_SOURCE_FIELDS.intersection(kwargs):
+            index_schedule_changes(pk for pk, *_ in before)
+
+        spans = [
+            (calendar_id, starts_at, ends_at, frequency is not None)
+            for _, calendar_id, starts_at, ends_at, frequency in before
+        ]
+
+        range_changed = SCHEDULE_RANGE_SOURCE_FIELDS.intersection(kwargs)
+        if range_changed or SCHEDULE_SPAN_SOURCE_FIELDS.intersection(kwargs):
+            changed = list(
+                self.model.objects.filter(pk__in=[pk for pk, *_ in before]).only(
+                    *SCHEDULE_SPAN_FIELDS, *SCHEDULE_RANGE_SOURCE_FIELDS
+                )
+            )
+            if range_changed:
+                for obj in changed:
+                    obj.sync_range()
+                self._plain().bulk_update(
+                    changed, SCHEDULE_RANGE_FIELDS, batch_size=500
+                )
+            spans += [schedule_span(obj) for obj in changed]
+
+        record_schedule_changes(spans)
+        return rows
+
+
+def schedule_span(schedule):
+    """
+    일정이 차지하는 위치 (calendar_id, starts_at, ends_at, 반복 여부)입니다.
+    불러오지 않은(deferred) 필드는 추가 쿼리 없이 알 수 없음(None, 반복)으로 취급합니다.
+    """
+    values = schedule.__dict__
+    return (
+        values.get("calendar_id"),
+        values.get("starts_at"),
+        values.get("ends_at"),
+        "repeat_frequency" not in values or values["repeat_frequency"] is not None,
+    )
+
+
+def record_schedule_changes(spans):
+    """
+    일정 변경을 캘린더 변경 토큰(ETag, 일정 조회 캐시 키)에 반영합니다.
+    spans는 `schedule_span` 형식의 목록이며 None은 무시합니다.
+    """
+    spans = [span for span in spans if span is not None]
+    if not spans:
+        return
+
+    Calendar.objects.filter(pk__in={span[0] for span in spans}).touch()
+
+
+def index_schedule_changes(schedule_ids):
+    """
+    save()를 거치지 않고 쓴 일정들(bulk_create/bulk_update/update)을 전문 검색 인덱스에 반영합니다.
+    save()와 delete()는 `calendars.signals`가 반영합니다.
+    """
+    # calendars.search가 이 모듈을 import하므로 호출할 때 불러옵니다.
+    from calendars import search
+
+    search.index_schedules(schedule_ids)
+
+
+def prefetch_schedule_details(schedules):
+    """
+    이미 불러온 일정 목록(반복 일정의 발생 포함)에 M2M 관계를 한 번에 채웁니다.
+    `iterator()`로 읽은 스트림에서 잘라낸 페이지에 사용합니다.
+    """
+    prefetch_related_objects(schedules, *SCHEDULE_DETAIL_PREFETCH)
+    return schedules
+
+
 class Schedule(CommonModel):
+    class FrequencyChoices(models.TextChoices):
+        DAILY = ("daily", "Daily")
+        WEEKLY = ("weekly", "Weekly")
+        MONTHLY = ("monthly", "Monthly")
+        YEARLY = ("yearly", "Yearly")
+
     calendar = models.ForeignKey(
         "calendars.Calendar",
         on_delete=models.CASCADE,
@@ -31,3 +322,90 @@ class Schedule(CommonModel):
     end_date = models.DateField(null=True)
     end_time = models.TimeField(null=True)
     is_repeat = models.BooleanField(default=False)
+
+    # 반복 규칙 (RFC 5545 RRULE의 부분집합). start_date가 규칙의 DTSTART 입니다.
+    repeat_frequency = models.CharField(
+        max_length=10, choices=FrequencyChoices, null=True, blank=True
+    )
+    repeat_interval = models.PositiveSmallIntegerField(default=1)
+    repeat_until = models.DateField(null=True, blank=True)
+    repeat_count = models.PositiveIntegerField(null=True, blank=True)
+    repeat_weekdays = models.CharField(max_length=20, blank=True, default="")
+    repeat_exdates = models.JSONField(default=list, blank=True)
+
+    # 날짜/시간 필드로부터 계산되는 [starts_at, ends_at) 구간입니다. 겹침 조회에 사용합니다.
+    # 반복 일정은 첫 발생의 구간을 가집니다.
+    starts_at = models.DateTimeField(editable=False)
+    ends_at = models.DateTimeField(editable=False)
+    # 반복 일정의 마지막으로 가능한 발생이 끝나는 시각입니다. 끝이 정해지지 않았으면 None입니다.
+    repeat_ends_at = models.DateTimeField(null=True, editable=False)
+
+    # 외부 iCalendar에서 가져온 일정의 UID와 내용 해시입니다. `calendars.importer`를 참고하세요.
+    ical_uid = models.CharField(max_length=255, null=True, blank=True, editable=False)
+    ical_hash = models.CharField(max_length=64, null=True, blank=True, editable=False)
+
+    objects = ScheduleQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["calendar", "ical_uid"], name="unique_schedule_ical_uid"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["calendar", "start_date"], name="schedule_calendar_start_idx"
+            ),
+            models.Index(
+                fields=["calendar", "starts_at"], name="schedule_calendar_starts_idx"
+            ),
+            models.Index(
+                fields=["calendar", "ends_at"], name="schedule_calendar_ends_idx"
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 저장 시 다른 캘린더나 기간으로 옮겨졌는지 알 수 있도록 불러온 위치를 기억합니다.
+        instance._loaded_span = schedule_span(instance)
+        return instance
+
+    def sync_range(self):
+        self.starts_at, self.ends_at = schedule_bounds(self)
+        self.repeat_ends_at = repeat_end(self, self.ends_at)
+
+    def save(self, *args, **kwargs):
+        self.is_repeat = self.repeat_frequency is not None
+        self.sync_range()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and SCHEDULE_RANGE_SOURCE_FIELDS.intersection(
+            update_fields
+        ):
+            kwargs["update_fields"] = {*update_fields, *SCHEDULE_RANGE_FIELDS}
+
+        super().save(*args, **kwargs)
+
+
+class ScheduleSearchIndex(models.Model):
+    """
+    Schedule 제목과 연결된 메모 본문의 SQLite FTS5 전문 검색 인덱스입니다.
+    테이블은 마이그레이션에서 생성되고, 내용은 `calendars.search`가 관리합니다.
+    """
+
+    schedule = models.OneToOneField(
+        "calendars.Schedule",
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column="rowid",
+        related_name="search_index",
+    )
+    title = models.TextField()
+    memo_text = models.TextField()
+    document = SearchDocumentField(db_column="calendars_schedule_fts")
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = "calendars_schedule_fts"
@@ -0,0 +1,74 @@
+from datetime import date, time
+from itertools import dropwhile, islice
+
+from django.db.models import Q
+
+from calendars.recurrence import sort_key
+from common.pagination import KeysetCursorPagination
+
+
+class ScheduleCursorPagination(KeysetCursorPagination):
+    """
+    (start_date, start_time, id) 키셋 기반의 커서 페이지네이션입니다.
+
+    COUNT(*)와 OFFSET 없이 마지막으로 본 일정 다음부터 이어서 읽기 때문에
+    깊은 페이지도 첫 페이지와 같은 비용이 듭니다.
+    """
+
+    cursor_query_param = "cursor"
+
+    def cursor_key(self, schedule) -> list:
+        start_date, start_time, pk = sort_key(schedule)
+        return [start_date.isoformat(), start_time.isoformat(), pk]
+
+    def parse_cursor_key(self, values):
+        start_date, start_time, pk = values
+        return date.fromisoformat(start_date), time.fromisoformat(start_time), int(pk)
+
+    def order_queryset(self, queryset):
+        """
+        `sort_key`와 같은 순서로 정렬합니다. start_time이 없으면 자정으로 취급합니다.
+        """
+        return queryset.in_sort_order()
+
+    def filter_queryset(self, queryset):
+        """
+        커서 위치 이후(next) 또는 이전(previous)의 행만 남기는 키셋 조건을 적용합니다.
+        `order_queryset`을 먼저 적용해야 합니다.
+        """
+        if self.position is None:
+            return queryset
+
+        start_date, start_time, pk = self.position
+        op = "gt" if self.direction == "next" else "lt"
+
+        return queryset.filter(
+            Q(**{f"start_date__{op}": start_date})
+            | Q(start_date=start_date, **{f"sort_time__{op}": start_time})
+            | Q(start_date=start_date, sort_time=start_time, **{f"id__{op}": pk})
+        )
+
+    def paginate_stream(self, stream, request, view=None):
+        """
+        정렬된 일정 스트림에서 한 페이지만 꺼냅니다. 스트림은 필요한 만큼만 소비됩니다.
+        previous 방향이면 스트림은 역순(sort_key 내림차순)이어야 합니다.
+        """
+        self.request = request
+
+        if self.direction == "previous":
+            # 커서 위치에서 거꾸로 page_size + 1개만 읽습니다.
+            stream = dropwhile(lambda s: sort_key(s) >= self.position, stream)
+            page = list(islice(stream, self.page_size + 1))
+            self.has_previous = len(page) > self.page_size
+            self.has_next = True
+            page = page[: self.page_size][::-1]
+        else:
+            if self.position is not None:
+                stream = dropwhile(lambda s: sort_key(s) <= self.position, stream)
+            page = list(islice(stream, self.page_size + 1))
+            self.has_previous = self.position is not None
+            self.has_next = len(page) > self.page_size
+            page = page[: self.page_size]
+
+        self.page = page
+        return page
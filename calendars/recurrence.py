@@ -0,0 +1,240 @@
+"""
+Schedule 반복 규칙 전개 엔진.
+
+반복 일정은 규칙 하나만 저장하고, 조회 시 요청된 기간 안의 발생(occurrence)만
+제너레이터로 전개합니다. 발생 자체는 DB에 저장되지 않습니다.
+"""
+
+import calendar as pycalendar
+import copy
+import heapq
+from datetime import date, datetime, time, timedelta
+
+from django.utils import timezone
+
+from calendars.intervals import schedule_bounds
+
+# 역순 전개의 첫 구간(일)입니다. 이후 구간은 두 배씩 넓어집니다.
+REVERSE_CHUNK_DAYS = 7
+
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+
+def add_months(value: date, months: int) -> date:
+    """
+    value에 months 만큼의 달을 더합니다. 해당 월에 같은 일이 없으면 말일로 맞춥니다.
+    """
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(value.day, pycalendar.monthrange(year, month)[1])
+    return date(year, month, day)
+
+
+def parse_weekdays(value: str) -> list[int]:
+    """
+    "MO,WE,FR" 형식의 문자열을 `date.weekday()` 값 목록으로 변환합니다.
+    """
+    if not value:
+        return []
+
+    weekdays = []
+    for token in value.split(","):
+        token = token.strip().upper()
+        if token not in WEEKDAYS:
+            raise ValueError(f"'{token}'은/는 올바른 요일이 아닙니다.")
+        weekdays.append(WEEKDAYS.index(token))
+
+    return sorted(set(weekdays))
+
+
+def _daily(dtstart, interval, window_start):
+    step = 0
+    if window_start > dtstart:
+        # 기간 이전의 발생은 건너뜁니다.
+        step = -(-(window_start - dtstart).days // interval)
+
+    while True:
+        try:
+            yield dtstart + timedelta(days=step * interval)
+        except OverflowError:
+            # date.max를 넘으면 더 이상 발생이 없습니다.
+            return
+        step += 1
+
+
+def _weekly(dtstart, interval, weekdays, window_start):
+    weekdays = weekdays or [dtstart.weekday()]
+    week_start = dtstart - timedelta(days=dtstart.weekday())
+
+    if window_start > week_start:
+        weeks = (window_start - week_start).days // 7
+        week_start += timedelta(weeks=weeks // interval * interval)
+
+    try:
+        while True:
+            for weekday in weekdays:
+                candidate = week_start + timedelta(days=weekday)
+                if candidate >= dtstart:
+                    yield candidate
+            week_start += timedelta(weeks=interval)
+    except OverflowError:
+        # date.max를 넘으면 더 이상 발생이 없습니다.
+        return
+
+
+def _monthly(dtstart, interval, weekdays, window_start):
+    months = 0
+    if window_start > dtstart:
+        elapsed = (window_start.year - dtstart.year) * 12 + (
+            window_start.month - dtstart.month
+        )
+        months = elapsed // interval * interval
+
+    while True:
+        month_index = dtstart.month - 1 + months
+        year = dtstart.year + month_index // 12
+        month = month_index % 12 + 1
+        if year > date.max.year:
+            return
+
+        last_day = pycalendar.monthrange(year, month)[1]
+        if weekdays:
+            for day in range(1, last_day + 1):
+                candidate = date(year, month, day)
+                if candidate >= dtstart and candidate.weekday() in weekdays:
+                    yield candidate
+        elif dtstart.day <= last_day:
+            # RFC 5545와 같이 해당 일이 없는 달(예: 31일)은 건너뜁니다.
+            yield date(year, month, dtstart.day)
+
+        months += interval
+
+
+def _yearly(dtstart, interval, window_start):
+    years = 0
+    if window_start > dtstart:
+        years = (window_start.year - dtstart.year) // interval * interval
+
+    while dtstart.year + years <= date.max.year:
+        try:
+            yield dtstart.replace(year=dtstart.year + years)
+        except ValueError:
+            # 윤년이 아닌 해의 2월 29일
+            pass
+        years += interval
+
+
+def iter_dates(schedule, window_start: date, window_end: date):
+    """
+    schedule의 반복 규칙에 따라 [window_start, window_end) 안의 발생 날짜를 순서대로 생성합니다.
+
+    `repeat_count`가 있으면 규칙의 처음부터 세어야 하므로 기간 앞부분을 건너뛰지 않습니다.
+    """
+    dtstart = schedule.start_date
+    interval = max(schedule.repeat_interval or 1, 1)
+    weekdays = parse_weekdays(schedule.repeat_weekdays)
+    exdates = {date.fromisoformat(d) for d in schedule.repeat_exdates or ()}
+    skip_to = dtstart if schedule.repeat_count else window_start
+
+    match schedule.repeat_frequency:
+        case "daily":
+            dates = _daily(dtstart, interval, skip_to)
+        case "weekly":
+            dates = _weekly(dtstart, interval, weekdays, skip_to)
+        case "monthly":
+            dates = _monthly(dtstart, interval, weekdays, skip_to)
+        case "yearly":
+            dates = _yearly(dtstart, interval, skip_to)
+        case _:
+            if window_start <= dtstart < window_end:
+                yield dtstart
+            return
+
+    for index, current in enumerate(dates, start=1):
+        if current >= window_end:
+            return
+        if schedule.repeat_until and current > schedule.repeat_until:
+            return
+        if schedule.repeat_count and index > schedule.repeat_count:
+            return
+        if current < window_start or current in exdates:
+            continue
+        yield current
+
+
+def span(schedule) -> timedelta:
+    """
+    한 번의 발생이 시작일로부터 걸쳐 있는 기간입니다.
+    """
+    if schedule.end_date is None:
+        return timedelta(0)
+    return max(schedule.end_date - schedule.start_date, timedelta(0))
+
+
+def expand(schedule, window_start: date, window_end: date):
+    """
+    반복 일정을 기간 안의 발생들로 전개합니다.
+    각 발생은 start_date/end_date와 그 구간(starts_at/ends_at)만 옮긴 schedule의 얕은 복사본입니다.
+    """
+    duration = schedule.end_date - schedule.start_date if schedule.end_date else None
+
+    for current in iter_dates(schedule, window_start, window_end):
+        occurrence = copy.copy(schedule)
+        occurrence.start_date = current
+        if duration is not None:
+            try:
+                occurrence.end_date = current + duration
+            except OverflowError:
+                # 종료일이 date.max를 넘는 발생부터는 나타낼 수 없습니다.
+                return
+        occurrence.starts_at, occurrence.ends_at = schedule_bounds(occurrence)
+        yield occurrence
+
+
+def occurrences_between(schedule, window_start: date, window_end: date):
+    """
+    [window_start, window_end) 날짜 구간과 겹치는 발생을 생성합니다.
+    여러 날에 걸친 발생은 기간 이전에 시작했더라도 포함됩니다.
+    """
+    start = datetime.combine(window_start, time.min, timezone.get_default_timezone())
+
+    for occurrence in expand(schedule, window_start - span(schedule), window_end):
+        if occurrence.ends_at > start:
+            yield occurrence
+
+
+def occurrences_reversed(schedule, window_start: date, window_end: date):
+    """
+    `occurrences_between`과 같은 발생을 역순(sort_key 내림차순)으로 생성합니다.
+    window_end부터 두 배씩 넓어지는 구간 단위로 거슬러 전개하므로, 앞쪽 몇 개만 꺼내면
+    기간 시작까지 전개하지 않습니다.
+    """
+    start = datetime.combine(window_start, time.min, timezone.get_default_timezone())
+    lookback = window_start - span(schedule)
+    end, days = window_end, REVERSE_CHUNK_DAYS
+
+    while end > lookback:
+        if (end - lookback).days <= days:
+            chunk_start = lookback
+        else:
+            chunk_start = end - timedelta(days=days)
+        for occurrence in reversed(list(expand(schedule, chunk_start, end))):
+            if occurrence.ends_at > start:
+                yield occurrence
+        end, days = chunk_start, days * 2
+
+
+def sort_key(schedule):
+    return (schedule.start_date, schedule.start_time or time.min, schedule.pk)
+
+
+def merge(singles, rules, window_start: date, window_end: date, reverse=False):
+    """
+    정렬된 단일 일정 스트림과 반복 규칙들의 발생 스트림을 하나의 정렬된 스트림으로 병합합니다.
+    reverse이면 singles는 내림차순이어야 하며, 병합한 스트림도 내림차순입니다.
+    """
+    occurrences = occurrences_reversed if reverse else occurrences_between
+    streams = [occurrences(rule, window_start, window_end) for rule in rules]
+
+    return heapq.merge(singles, *streams, key=sort_key, reverse=reverse)
@@ -0,0 +1,100 @@
+"""
+Schedule 전문 검색 인덱스(`ScheduleSearchIndex`) 관리.
+
+인덱스 행의 rowid는 Schedule의 id와 같습니다. 한글 복합어 안의 단어도 찾을 수 있도록
+원문 대신 `common.search.tokenize`의 n-gram 토큰을 저장합니다. 일정이나 메모가 바뀌면
+`calendars.signals`(save/delete)와 ScheduleQuerySet(bulk_create/bulk_update/update)이
+이 모듈을 호출해 해당 일정의 행만 다시 씁니다.
+"""
+
+from django.db import connection, transaction
+
+from calendars.models import Schedule, ScheduleSearchIndex
+from common.search import build_match_query, is_fts_available, tokenize
+
+TABLE = ScheduleSearchIndex._meta.db_table
+REBUILD_CHUNK_SIZE = 2000
+
+
+def _document(title, memo_text):
+    """
+    인덱스에는 원문 대신 `tokenize`한 토큰을 공백으로 이어 저장합니다.
+    """
+    return " ".join(tokenize(title)), " ".join(tokenize(memo_text))
+
+
+def _write(rows):
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {TABLE} (rowid, title, memo_text) VALUES (%s, %s, %s)",
+            [(pk, *_document(title, memo_text)) for pk, title, memo_text in rows],
+        )
+
+
+def remove_schedules(schedule_ids):
+    if not is_fts_available():
+        return
+
+    ids = list(schedule_ids)
+    if ids:
+        ScheduleSearchIndex.objects.filter(pk__in=ids).delete()
+
+
+def index_schedules(schedule_ids):
+    """
+    주어진 일정들의 인덱스 행을 현재 내용으로 다시 씁니다.
+    """
+    if not is_fts_available():
+        return
+
+    ids = list(schedule_ids)
+    if not ids:
+        return
+
+    rows = Schedule.objects.filter(pk__in=ids).values_list("pk", "title", "memo__text")
+
+    # 일괄 쓰기 도중에는 이미 트랜잭션 안이므로 savepoint를 따로 만들지 않습니다.
+    with transaction.atomic(savepoint=False):
+        remove_schedules(ids)
+        _write(rows)
+
+
+def rebuild():
+    """
+    인덱스를 비우고 모든 일정으로 처음부터 다시 만듭니다. 처리한 일정 수를 반환합니다.
+    """
+    if not is_fts_available():
+        return 0
+
+    rows = Schedule.objects.order_by("pk").values_list("pk", "title", "memo__text")
+    total = 0
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE}")
+
+        chunk = []
+        for row in rows.iterator(chunk_size=REBUILD_CHUNK_SIZE):
+            chunk.append(row)
+            if len(chunk) == REBUILD_CHUNK_SIZE:
+                _write(chunk)
+                total += len(chunk)
+                chunk = []
+
+        _write(chunk)
+        total += len(chunk)
+
+    return total
+
+
+def search(queryset, query: str):
+    """
+    queryset을 검색어에 맞는 일정으로 좁히고 관련도 순으로 정렬합니다.
+    """
+    match = build_match_query(query)
+    if not match:
+        return queryset.none()
+
+    return queryset.filter(search_index__document__match=match).order_by(
+        "search_index__rank", "pk"
+    )
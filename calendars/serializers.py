@@ -1,3 +1,4 @@
+from datetime import date
 from random import choice
 from types import FunctionType
 from typing import Self
@@ -6,6 +7,8 @@ from rest_framework import serializers as s
 from rest_framework.fields import ChoiceField
 
 from calendars.models import Calendar, Schedule
+from calendars.recurrence import parse_weekdays
+from common.defaults import DEFAULT_CALENDAR, DEFAULT_MEMO_SET
 from memos.models import Memo, MemoSet
 from memos.serializers import MemoDetailSerializer
 from tags.models import Tag
@@ -45,7 +48,38 @@ class CalendarDetailSerializer(s.ModelSerializer):
         return instance
 
 
-class ScheduleDetailSerializer(s.ModelSerializer):
+class CalendarStatsSerializer(CalendarDetailSerializer):
+    """
+    `CalendarQuerySet.with_stats`로 주석된 캘린더의 통계를 함께 보여줍니다.
+    """
+
+    schedule_count = s.IntegerField(read_only=True)
+    next_start_date = s.DateField(read_only=True, allow_null=True)
+    last_schedule_updated_at = s.DateTimeField(read_only=True, allow_null=True)
+
+
+class RepeatRuleValidationMixin:
+    """
+    반복 규칙 필드(`repeat_weekdays`, `repeat_exdates`)의 검증을 공유합니다.
+    """
+
+    def validate_repeat_weekdays(self, value):
+        try:
+            parse_weekdays(value)
+        except ValueError as exc:
+            raise s.ValidationError(str(exc))
+        return value.upper()
+
+    def validate_repeat_exdates(self, value):
+        if not isinstance(value, list):
+            raise s.ValidationError("날짜 문자열의 목록이어야 합니다.")
+        try:
+            return sorted({date.fromisoformat(d).isoformat() for d in value})
+        except (TypeError, ValueError):
+            raise s.ValidationError("YYYY-MM-DD 형식의 날짜만 허용합니다.")
+
+
+class ScheduleDetailSerializer(RepeatRuleValidationMixin, s.ModelSerializer):
     participant = s.PrimaryKeyRelatedField(read_only=True, many=True)
     memo = MemoDetailSerializer(required=False)
     calendar = s.SlugRelatedField(
@@ -62,7 +96,10 @@ class ScheduleDetailSerializer(s.ModelSerializer):
 
     class Meta:
         model = Schedule
-        fields = "__all__"
+        # 외부 캘린더 가져오기용 내부 값입니다. 응답에 보이지 않아야 하고,
+        # (calendar, ical_uid) 제약으로 calendar가 필수가 되지 않도록 제외합니다.
+        exclude = ("ical_uid", "ical_hash")
+        read_only_fields = ("is_repeat",)
 
     def create(self, validated_data):
         request = self.context.get("request")
@@ -74,7 +111,9 @@ class ScheduleDetailSerializer(s.ModelSerializer):
 
         if cal is None:
             # calendar 미포함시 기본 캘린더를 사용합니다.
-            default_cal = (Calendar.objects.get(user_id=user.pk, title="Calendar"),)
+            default_cal = (
+                Calendar.objects.get(user_id=user.pk, title=DEFAULT_CALENDAR),
+            )
             cal = default_cal[0]
 
         instance = Schedule.objects.create(
@@ -87,7 +126,7 @@ class ScheduleDetailSerializer(s.ModelSerializer):
                 title=memo.pop("title"),
                 text=memo.pop("text"),
                 memo_set=memo.pop(
-                    "memo_set", MemoSet.objects.get(user=user, title="Memo")
+                    "memo_set", MemoSet.objects.get(user=user, title=DEFAULT_MEMO_SET)
                 ),
             )
             instance.memo = memo_instance
@@ -130,11 +169,183 @@ class ScheduleUpdateSerializer(s.ModelSerializer):
             "end_date",
             "end_time",
             "is_repeat",
+            "repeat_frequency",
+            "repeat_interval",
+            "repeat_until",
+            "repeat_count",
+            "repeat_weekdays",
+            "repeat_exdates",
             "calendar",
             "participant",
         )
 
 
+class ScheduleBulkMemoSerializer(s.Serializer):
+    title = s.CharField(max_length=50)
+    text = s.CharField(allow_blank=True, allow_null=True, required=False)
+    memo_set = s.IntegerField(required=False)
+
+
+class ScheduleBulkFieldsSerializer(RepeatRuleValidationMixin, s.ModelSerializer):
+    """
+    일괄 처리의 한 항목에 담긴 일정 필드를 검증합니다.
+
+    calendar, schedule_tags, memo.memo_set은 이름이나 id 그대로 두고,
+    항목 전체를 검증한 뒤 종류별로 한 번의 쿼리로 찾습니다.
+    """
+
+    calendar = s.CharField(max_length=50, required=False)
+    schedule_tags = s.ListField(
+        child=s.CharField(max_length=30), required=False, allow_empty=True
+    )
+    memo = ScheduleBulkMemoSerializer(required=False)
+
+    class Meta:
+        model = Schedule
+        fields = (
+            "title",
+            "start_date",
+            "start_time",
+            "end_date",
+            "end_time",
+            "repeat_frequency",
+            "repeat_interval",
+            "repeat_until",
+            "repeat_count",
+            "repeat_weekdays",
+            "repeat_exdates",
+            "calendar",
+            "schedule_tags",
+            "memo",
+        )
+
+
+class ScheduleBulkOperationSerializer(s.Serializer):
+    op = ChoiceField(choices=("create", "update", "delete"))
+    id = s.IntegerField(required=False)
+    data = s.DictField(required=False)
+
+    def validate(self, attrs):
+        if attrs["op"] != "create" and attrs.get("id") is None:
+            raise s.ValidationError({"id": "update, delete에는 id가 필요합니다."})
+        if attrs["op"] != "delete" and not attrs.get("data"):
+            raise s.ValidationError({"data": "create, update에는 data가 필요합니다."})
+        return attrs
+
+
+class ScheduleBulkSerializer(s.Serializer):
+    """
+    ScheduleBulkView 요청 형식입니다.
+    """
+
+    MAX_OPERATIONS = 500
+
+    operations = s.ListField(
+        child=ScheduleBulkOperationSerializer(),
+        allow_empty=False,
+        max_length=MAX_OPERATIONS,
+    )
+
+
+class ScheduleBulkResultSerializer(s.Serializer):
+    index = s.IntegerField()
+    op = s.CharField()
+    id = s.IntegerField(allow_null=True)
+    status = ChoiceField(choices=("created", "updated", "deleted", "error", "skipped"))
+    errors = s.DictField(required=False)
+
+
+class ScheduleBulkResponseSerializer(s.Serializer):
+    """
+    ScheduleBulkView 응답 형식을 명시하기 위해 사용하는 serializer 입니다.
+    """
+
+    results = ScheduleBulkResultSerializer(many=True)
+
+
+class ScheduleConflictSerializer(s.Serializer):
+    """
+    겹치는 일정입니다. 다른 유저의 일정이면 id, title, calendar는 null입니다.
+    """
+
+    id = s.IntegerField(allow_null=True)
+    title = s.CharField(allow_null=True)
+    calendar = s.CharField(allow_null=True)
+    start = s.DateTimeField()
+    end = s.DateTimeField()
+
+
+class ScheduleConflictChoices(s.Serializer):
+    """
+    일정 등록/수정 요청의 query_params 중에서 `conflicts` Choices를 명시하기 위해 사용되는 serializer 입니다.
+    """
+
+    conflicts = ChoiceField(choices=("check", "strict"))
+
+
+class ScheduleCopySerializer(s.Serializer):
+    """
+    ScheduleCopyView 요청 형식입니다. 모든 필드는 선택입니다.
+    """
+
+    MAX_DAYS = 36500
+
+    days = s.IntegerField(
+        default=0,
+        min_value=-MAX_DAYS,
+        max_value=MAX_DAYS,
+        help_text="복사본의 날짜를 옮길 일 수입니다. 음수면 앞당깁니다.",
+    )
+    calendar = s.CharField(
+        required=False,
+        help_text="복사본을 만들 캘린더입니다. 없으면 원본과 같은 캘린더입니다.",
+    )
+
+
+class ScheduleBulkCopySerializer(ScheduleCopySerializer):
+    """
+    ScheduleBulkCopyView 요청 형식입니다.
+    schedule_ids 또는 source_calendar(+ 선택적인 기간) 중 하나로 복사할 일정을 고릅니다.
+    """
+
+    MAX_SCHEDULES = 500
+
+    schedule_ids = s.ListField(
+        child=s.IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_SCHEDULES,
+    )
+    source_calendar = s.CharField(required=False)
+    start_date = s.DateField(required=False)
+    end_date = s.DateField(required=False)
+
+    def validate(self, attrs):
+        if ("schedule_ids" in attrs) == ("source_calendar" in attrs):
+            raise s.ValidationError(
+                "schedule_ids와 source_calendar 중 하나만 지정해야 합니다."
+            )
+        if "schedule_ids" in attrs and ("start_date" in attrs or "end_date" in attrs):
+            raise s.ValidationError(
+                "start_date, end_date는 source_calendar와 함께 사용해야 합니다."
+            )
+        if attrs.get("start_date") and attrs.get("end_date"):
+            if attrs["start_date"] > attrs["end_date"]:
+                raise s.ValidationError(
+                    {"end_date": "종료일은 시작일보다 빠를 수 없습니다."}
+                )
+        return attrs
+
+
+class ScheduleBulkCopyResponseSerializer(s.Serializer):
+    """
+    ScheduleBulkCopyView 응답 형식을 명시하기 위해 사용하는 serializer 입니다.
+    """
+
+    count = s.IntegerField()
+    ids = s.ListField(child=s.IntegerField())
+
+
 class ScheduleViewChoices(s.Serializer):
     """
     ScheduleListView GET 요청의 query_params 중에서 `view` Choices를 명시하기 위해 사용되는 serializer 입니다.
@@ -149,9 +360,27 @@ class ScheduleViewChoices(s.Serializer):
     )
 
 
-class ScheduleDirectionChoices(s.Serializer):
+class BusyIntervalSerializer(s.Serializer):
+    start = s.DateTimeField()
+    end = s.DateTimeField()
+
+
+class FreeBusySerializer(s.Serializer):
+    """
+    FreeBusyView 응답 형식을 명시하기 위해 사용하는 serializer 입니다.
+    """
+
+    start = s.DateTimeField()
+    end = s.DateTimeField()
+    busy = BusyIntervalSerializer(many=True)
+
+
+class HeatmapSerializer(s.Serializer):
     """
-    ScheduleListView GET 요청의 query_params 중에서 `direction` Choices를 명시하기 위해 사용하는 serializer 입니다.
+    HeatmapView 응답 형식을 명시하기 위해 사용하는 serializer 입니다.
+    counts[i]는 start_date로부터 i일째 되는 날의 일정 수입니다.
     """
 
-    direction = ChoiceField(choices=("next", "previous"))
+    start_date = s.DateField()
+    end_date = s.DateField()
+    counts = s.ListField(child=s.IntegerField())
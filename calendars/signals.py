@@ -0,0 +1,97 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from calendars import search
+from calendars.models import (
+    SCHEDULE_SPAN_FIELDS,
+    Schedule,
+    record_schedule_changes,
+    schedule_span,
+)
+from memos.models import Memo
+from tags.models import Tag
+
+# bulk_create/bulk_update/update()는 post_save를 보내지 않으므로 ScheduleQuerySet이 직접 인덱싱합니다.
+
+
+@receiver(post_save, sender=Schedule)
+def index_saved_schedule(sender, instance, **kwargs):
+    search.index_schedules([instance.pk])
+
+
+@receiver(post_delete, sender=Schedule)
+def unindex_deleted_schedule(sender, instance, **kwargs):
+    search.remove_schedules([instance.pk])
+
+
+@receiver(post_save, sender=Memo)
+def index_memo_schedule(sender, instance, created, **kwargs):
+    if created:
+        # 새 메모는 아직 어떤 일정에도 연결되어 있지 않습니다.
+        return
+
+    search.index_schedules(
+        Schedule.objects.filter(memo_id=instance.pk).values_list("pk", flat=True)
+    )
+
+
+# 캘린더 변경 토큰(ETag)과 일정 조회 캐시 갱신.
+# 일정 응답에 들어가는 메모, 태그, 참가자가 바뀌어도 해당 일정의 변경으로 기록합니다.
+# bulk_create/bulk_update/update()는 ScheduleQuerySet이 직접 기록합니다.
+
+SCHEDULE_M2M_LOOKUPS = {
+    Schedule.participant.through: "participant",
+    Tag.schedule.through: "schedule_tags",
+}
+
+
+def _record_schedules(schedules):
+    record_schedule_changes(
+        (calendar_id, starts_at, ends_at, frequency is not None)
+        for calendar_id, starts_at, ends_at, frequency in schedules.values_list(
+            *SCHEDULE_SPAN_FIELDS
+        )
+    )
+
+
+@receiver(post_save, sender=Schedule)
+def record_saved_schedule(sender, instance, **kwargs):
+    # 다른 캘린더나 기간으로 옮겨진 일정은 이전 위치도 함께 기록합니다.
+    record_schedule_changes(
+        [schedule_span(instance), getattr(instance, "_loaded_span", None)]
+    )
+    instance._loaded_span = schedule_span(instance)
+
+
+@receiver(post_delete, sender=Schedule)
+def record_deleted_schedule(sender, instance, **kwargs):
+    record_schedule_changes([schedule_span(instance)])
+
+
+@receiver(post_save, sender=Memo)
+def record_memo_schedule(sender, instance, created, **kwargs):
+    if not created:
+        _record_schedules(Schedule.objects.filter(memo_id=instance.pk))
+
+
+@receiver(post_save, sender=Tag)
+@receiver(pre_delete, sender=Tag)
+def record_tag_schedules(sender, instance, **kwargs):
+    if instance.pk is not None:
+        _record_schedules(Schedule.objects.filter(schedule_tags=instance.pk))
+
+
+@receiver(m2m_changed, sender=Schedule.participant.through)
+@receiver(m2m_changed, sender=Tag.schedule.through)
+def record_schedule_m2m(sender, instance, action, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if isinstance(instance, Schedule):
+        record_schedule_changes([schedule_span(instance)])
+    elif action == "pre_clear":
+        # 반대편(유저, 태그)에서 clear()하면 pk_set이 비어 있으므로 지우기 전에 찾습니다.
+        lookup = SCHEDULE_M2M_LOOKUPS[sender]
+        _record_schedules(Schedule.objects.filter(**{lookup: instance.pk}))
+    elif pk_set:
+        _record_schedules(Schedule.objects.filter(pk__in=pk_set))
@@ -1,10 +1,28 @@
-from datetime import datetime, timedelta
+import json
+import os
+import tempfile
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from io import BytesIO, StringIO
+from itertools import islice
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.db import connection, models
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.authentication import get_user_model
 from rest_framework.reverse import reverse
 
 from tests.auth_base_test import TestAuthBase
+from calendars import cache as schedule_cache
+from calendars import ical, importer, recurrence, timeline
 from calendars.models import Calendar, Schedule
+from calendars.pagination import ScheduleCursorPagination
+from calendars.views import ScheduleAgendaView
 from memos.models import Memo, MemoSet
 from tags.models import Tag
 
@@ -27,6 +45,65 @@ class TestCalendarList(TestAuthBase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["title"], "Calendar1")
 
+    def test_get_calendars_with_stats(self):
+        empty = Calendar.objects.create(user=self.user, title="Empty")
+        today = timezone.localdate()
+        for days in (-3, 2, 5):
+            Schedule.objects.create(
+                calendar=self.calendar,
+                title="일정",
+                start_date=today + timedelta(days=days),
+            )
+        latest = Schedule.objects.get(start_date=today + timedelta(days=5))
+
+        # 유저 조회와 통계를 포함한 캘린더 목록 조회, 두 번의 쿼리입니다.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.URL, {"stats": "true"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        stats = {calendar["title"]: calendar for calendar in response.data}
+        self.assertEqual(stats["Calendar1"]["schedule_count"], 3)
+        self.assertEqual(
+            stats["Calendar1"]["next_start_date"],
+            (today + timedelta(days=2)).isoformat(),
+        )
+        self.assertEqual(
+            stats["Calendar1"]["last_schedule_updated_at"],
+            timezone.localtime(latest.updated_at).isoformat(),
+        )
+        self.assertEqual(
+            (stats["Empty"]["schedule_count"], stats["Empty"]["next_start_date"]),
+            (0, None),
+        )
+        self.assertEqual(empty.pk, stats["Empty"]["id"])
+
+        # 통계가 없는 응답과 ETag가 다릅니다.
+        plain = self.client.get(self.URL)
+        self.assertNotIn("schedule_count", plain.data[0])
+        self.assertNotEqual(plain["ETag"], response["ETag"])
+
+    def test_get_calendars_with_stats_next_day(self):
+        """next_start_date는 날짜가 바뀌면 달라지므로 다음 날에는 304를 반환하지 않습니다."""
+        today = timezone.localdate()
+        Schedule.objects.create(
+            calendar=self.calendar, title="일정", start_date=today + timedelta(days=1)
+        )
+        response = self.client.get(self.URL, {"stats": "true"})
+        self.assertNotIn("Last-Modified", response)
+
+        conditions = [
+            {"If-None-Match": response["ETag"]},
+            {"If-Modified-Since": "Fri, 31 Dec 9999 23:59:59 GMT"},
+        ]
+        for headers in conditions:
+            with patch(
+                "calendars.views.timezone.localdate",
+                return_value=today + timedelta(days=2),
+            ):
+                response = self.client.get(self.URL, {"stats": "true"}, headers=headers)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIsNone(response.data[0]["next_start_date"])
+
     def test_create_calendar(self):
         payload = {"title": "Calendar2"}
         response = self.client.post(self.URL, data=payload)
@@ -115,8 +192,8 @@ class TestScheduleList(TestAuthBase):
             self.URL, query_params={"start_date": self.schedule1.start_date}
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
-        self.assertEqual(response.data[0]["title"], self.schedule1.title)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(response.data["results"][0]["title"], self.schedule1.title)
 
     def test_create_schedule_with_memo(self):
         memo_set = MemoSet.objects.create(user=self.user, title="Memo")
@@ -151,6 +228,27 @@ class TestScheduleList(TestAuthBase):
         for key in payload.keys():
             self.assertIn(key, response.data)
 
+    def test_create_schedule_without_calendar(self):
+        """calendar가 없으면 기본 캘린더에 일정을 만듭니다."""
+        default = Calendar.objects.create(user=self.user, title="Calendar")
+        payload = {"title": "schedule1", "start_date": "9999-12-31"}
+
+        response = self.client.post(self.URL, data=payload)
+        self.assertEqual(
+            response.status_code, status.HTTP_201_CREATED, response.content
+        )
+        self.assertEqual(response.data["calendar"], default.title)
+        self.assertNotIn("ical_uid", response.data)
+        self.assertNotIn("ical_hash", response.data)
+
+        response = self.client.put(
+            f"{self.URL}{response.data['id']}/",
+            data={"title": "renamed", "start_date": "9999-12-30"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        self.assertEqual(response.data["calendar"], default.title)
+
     def test_get_without_start_date(self):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -158,7 +256,7 @@ class TestScheduleList(TestAuthBase):
     def test_get_with_start_date(self):
         response = self.client.get(self.url, {"start_date": datetime.now().isoformat()})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data["results"]), 2)
 
     def test_get_with_start_date_and_calendar(self):
         response = self.client.get(
@@ -169,28 +267,97 @@ class TestScheduleList(TestAuthBase):
             },
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
 
     def test_get_with_start_date_and_view_monthly(self):
         response = self.client.get(
             self.url, {"start_date": datetime.now().isoformat(), "view": "monthly"}
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data["results"]), 2)
 
     def test_get_with_start_date_and_view_weekly(self):
         response = self.client.get(
             self.url, {"start_date": datetime.now().isoformat(), "view": "weekly"}
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data["results"]), 2)
 
     def test_get_with_start_date_and_view_daily(self):
         response = self.client.get(
             self.url, {"start_date": datetime.now().isoformat(), "view": "daily"}
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_get_view_monthly_is_bounded_to_one_month(self):
+        """
+        월간 보기는 [start_date, start_date + 1개월) 구간만 포함합니다.
+        다른 해의 이전 월이나 다음 해의 일정이 섞이지 않아야 합니다.
+        """
+        for day in (date(2025, 12, 1), date(2025, 12, 31), date(2026, 1, 1)):
+            Schedule.objects.create(
+                calendar=self.calendar1, start_date=day, title=str(day)
+            )
+        Schedule.objects.create(
+            calendar=self.calendar1, start_date=date(2026, 3, 1), title="2026-03-01"
+        )
+
+        response = self.client.get(
+            self.url, {"start_date": "2025-12-01", "view": "monthly"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [x["title"] for x in response.data["results"]], ["2025-12-01", "2025-12-31"]
+        )
+
+    def test_get_view_includes_events_started_before_window(self):
+        """기간 이전에 시작해 기간 안까지 이어지는 일정도 조회됩니다."""
+        Schedule.objects.create(
+            calendar=self.calendar1,
+            title="Trip",
+            start_date=date(2025, 11, 28),
+            end_date=date(2025, 12, 2),
+        )
+        Schedule.objects.create(
+            calendar=self.calendar1,
+            title="Ended",
+            start_date=date(2025, 11, 30),
+            end_date=date(2025, 11, 30),
+            end_time=time(23, 0),
+        )
+
+        response = self.client.get(
+            self.url, {"start_date": "2025-12-01", "view": "daily"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([x["title"] for x in response.data["results"]], ["Trip"])
+
+    def test_range_columns_follow_updates(self):
+        """save, update, bulk_update 모두 starts_at/ends_at을 갱신합니다."""
+        schedule = Schedule.objects.create(
+            calendar=self.calendar1,
+            start_date=date(2025, 12, 1),
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+        )
+        tz = timezone.get_default_timezone()
+        self.assertEqual(
+            (schedule.starts_at, schedule.ends_at),
+            (
+                datetime(2025, 12, 1, 9, tzinfo=tz),
+                datetime(2025, 12, 1, 10, tzinfo=tz),
+            ),
+        )
+
+        Schedule.objects.filter(pk=schedule.pk).update(end_date=date(2025, 12, 3))
+        schedule.refresh_from_db()
+        self.assertEqual(schedule.ends_at, datetime(2025, 12, 3, 10, tzinfo=tz))
+
+        schedule.start_time = None
+        Schedule.objects.bulk_update([schedule], ["start_time"])
+        schedule.refresh_from_db()
+        self.assertEqual(schedule.starts_at, datetime(2025, 12, 1, tzinfo=tz))
 
 
 class TestScheduleDetail(TestAuthBase):
@@ -240,26 +407,244 @@ class TestScheduleListPagination(TestAuthBase):
         self.url = reverse("schedule-list")
 
     def test_get_schedules_with_pagination(self):
-        response = self.client.get(
-            self.url, {"start_date": datetime.now().isoformat(), "page": 1}
-        )
+        response = self.client.get(self.url, {"start_date": datetime.now().isoformat()})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 10)
+        self.assertEqual(len(response.data["results"]), 10)
+        self.assertIsNone(response.data["previous"])
+        self.assertIsNotNone(response.data["next"])
 
     def test_get_schedules_with_pagination_second_page(self):
+        response = self.client.get(self.url, {"start_date": datetime.now().isoformat()})
+        first_page = [x["id"] for x in response.data["results"]]
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(
+            first_page + [x["id"] for x in response.data["results"]],
+            [schedule.id for schedule in self.schedules],
+        )
+
+        # previous 링크는 첫 페이지를 그대로 돌려줍니다.
+        response = self.client.get(response.data["previous"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([x["id"] for x in response.data["results"]], first_page)
+        self.assertIsNone(response.data["previous"])
+
+    def test_get_schedules_with_pagination_same_day_tiebreak(self):
+        """같은 날짜, 같은 시간의 일정은 id 순서로 이어서 조회됩니다."""
+        today = datetime.now().date()
+        Schedule.objects.filter(calendar=self.calendar1).update(start_date=today)
+
+        ids = []
+        response = self.client.get(self.url, {"start_date": today.isoformat()})
+        while True:
+            ids += [x["id"] for x in response.data["results"]]
+            if response.data["next"] is None:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(ids, sorted(schedule.id for schedule in self.schedules))
+
+    def test_get_schedules_with_pagination_previous_pages_with_rules(self):
+        """previous 링크를 따라가면 next로 지나온 페이지를 거꾸로 그대로 돌려줍니다."""
+        today = datetime.now().date()
+        Schedule.objects.create(
+            calendar=self.calendar2,
+            start_date=today,
+            start_time=time(9, 0),
+            title="Standup",
+            repeat_frequency=Schedule.FrequencyChoices.DAILY,
+        )
+        params = {
+            "start_date": today.isoformat(),
+            "end_date": (today + timedelta(days=15)).isoformat(),
+        }
+
+        pages = []
+        response = self.client.get(self.url, params)
+        while True:
+            pages.append([(x["id"], x["start_date"]) for x in response.data["results"]])
+            if response.data["next"] is None:
+                break
+            response = self.client.get(response.data["next"])
+        self.assertGreater(len(pages), 2)
+
+        for expected in reversed(pages[:-1]):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(response.data["previous"])
+            self.assertEqual(
+                [(x["id"], x["start_date"]) for x in response.data["results"]],
+                expected,
+            )
+            # 단일 일정은 커서 위치에서 거꾸로 읽습니다.
+            self.assertTrue(
+                any(
+                    "ORDER BY" in query["sql"] and "DESC" in query["sql"]
+                    for query in queries.captured_queries
+                )
+            )
+        self.assertIsNone(response.data["previous"])
+
+    def test_get_schedules_out_of_range(self):
+        for view in ("monthly", "weekly", "daily"):
+            response = self.client.get(
+                self.url, {"start_date": "9999-12-31", "view": view}
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {"start_date": "2025-13-01"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
         response = self.client.get(
-            self.url, {"start_date": datetime.now().isoformat(), "page": 2}
+            self.url, {"start_date": "9999-12-24", "view": "weekly"}
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 5)
 
-    def test_get_schedules_with_pagination_invalid_page(self):
+    def test_get_schedules_with_pagination_invalid_cursor(self):
         response = self.client.get(
-            self.url, {"start_date": datetime.now().isoformat(), "page": 3}
+            self.url, {"start_date": datetime.now().isoformat(), "cursor": "invalid"}
         )
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
+class TestScheduleConflicts(TestAuthBase):
+    URL = "/api/v1/calendars/schedule/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.calendar = Calendar.objects.create(user=self.user, title="Work")
+        self.other_calendar = Calendar.objects.create(user=self.user, title="Home")
+        self.meeting = Schedule.objects.create(
+            calendar=self.calendar,
+            title="회의",
+            start_date=date(2025, 3, 3),
+            start_time=time(10),
+            end_time=time(11),
+        )
+        self.weekly = Schedule.objects.create(
+            calendar=self.calendar,
+            title="주간 보고",
+            start_date=date(2025, 1, 6),
+            start_time=time(14),
+            end_time=time(15),
+            repeat_frequency="weekly",
+        )
+
+    def post(self, payload, mode="check"):
+        return self.client.post(
+            f"{self.URL}?conflicts={mode}", data=payload, format="json"
+        )
+
+    def test_create_reports_conflicts(self):
+        response = self.post(
+            {
+                "calendar": "Work",
+                "title": "점심",
+                "start_date": "2025-03-03",
+                "start_time": "10:30",
+                "end_time": "14:30",
+            }
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [(c["title"], c["start"]) for c in response.data["conflicts"]],
+            [
+                ("회의", "2025-03-03T10:00:00+09:00"),
+                ("주간 보고", "2025-03-03T14:00:00+09:00"),
+            ],
+        )
+
+    def test_adjacent_and_other_calendar_do_not_conflict(self):
+        for payload in (
+            {"calendar": "Work", "start_time": "11:00", "end_time": "12:00"},
+            {"calendar": "Home", "start_time": "10:00", "end_time": "11:00"},
+        ):
+            response = self.post({"title": "x", "start_date": "2025-03-03", **payload})
+            self.assertEqual(response.data["conflicts"], [])
+
+    def test_strict_rejects_write(self):
+        response = self.post(
+            {"calendar": "Work", "title": "x", "start_date": "2025-03-03"},
+            mode="strict",
+        )
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(len(response.data["conflicts"]), 2)
+        self.assertFalse(Schedule.objects.filter(title="x").exists())
+
+    def test_recurring_schedule_is_checked_ahead(self):
+        far = Schedule.objects.create(
+            calendar=self.calendar,
+            title="출장",
+            start_date=date(2025, 8, 13),
+        )
+        response = self.post(
+            {
+                "calendar": "Work",
+                "title": "수요 스터디",
+                "start_date": "2025-03-05",
+                "start_time": "19:00",
+                "end_time": "20:00",
+                "repeat_frequency": "weekly",
+            }
+        )
+        self.assertEqual(
+            [c["id"] for c in response.data["conflicts"]],
+            [far.pk],
+        )
+
+    def test_update_checks_participants_schedules(self):
+        friend = User.objects.create(email="friend@test.com", birthday="1997-01-01")
+        friend_calendar = Calendar.objects.create(user=friend, title="Friend")
+        Schedule.objects.create(
+            calendar=friend_calendar,
+            title="비공개",
+            start_date=date(2025, 3, 10),
+            start_time=time(9),
+            end_time=time(10),
+        )
+        self.meeting.participant.add(friend)
+
+        response = self.client.put(
+            f"{self.URL}{self.meeting.pk}/?conflicts=check",
+            {
+                "title": "회의",
+                "start_date": "2025-03-10",
+                "start_time": "09:30",
+                "end_time": "10:30",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # 다른 유저의 일정은 시간만 알려 줍니다.
+        self.assertEqual(
+            response.data["conflicts"],
+            [
+                {
+                    "id": None,
+                    "title": None,
+                    "calendar": None,
+                    "start": "2025-03-10T09:00:00+09:00",
+                    "end": "2025-03-10T10:00:00+09:00",
+                }
+            ],
+        )
+
+    def test_without_mode(self):
+        response = self.client.post(
+            self.URL,
+            {"calendar": "Work", "title": "x", "start_date": "2025-03-03"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("conflicts", response.data)
+
+        response = self.post({"title": "x", "start_date": "2025-03-03"}, mode="x")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
 class TestCopySchedule(TestAuthBase):
     URL = "/api/v1/calendars/schedule/"
 
@@ -311,6 +696,154 @@ class TestCopySchedule(TestAuthBase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Schedule.objects.last().memo, None)
 
+    def test_copy_schedule_with_relations_and_offset(self):
+        friend = User.objects.create(email="friend@test.com", birthday="1997-01-01")
+        self.schedule.participant.add(friend)
+        tag = Tag.objects.create(user=self.user, title="업무")
+        tag.schedule.add(self.schedule)
+        tag.memo.add(self.memo)
+        target = Calendar.objects.create(user=self.user, title="Target")
+
+        response = self.client.post(
+            self.copy_url, {"days": 7, "calendar": "Target"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        copied = Schedule.objects.get(pk=response.data["id"])
+        self.assertEqual(copied.calendar, target)
+        self.assertEqual(
+            copied.start_date, self.schedule.start_date + timedelta(days=7)
+        )
+        self.assertEqual(list(copied.participant.all()), [friend])
+        self.assertEqual(list(copied.schedule_tags.all()), [tag])
+        self.assertEqual(copied.memo.text, "Memo")
+        self.assertEqual(list(copied.memo.memo_tags.all()), [tag])
+
+    def test_copy_other_users_schedule(self):
+        other = User.objects.create(email="other@test.com", birthday="1997-01-01")
+        self.schedule.calendar = Calendar.objects.create(user=other, title="Other")
+        self.schedule.save()
+
+        response = self.client.post(self.copy_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(Schedule.objects.count(), 1)
+
+
+class TestBulkCopySchedule(TestAuthBase):
+    URL = "/api/v1/calendars/schedule/copy/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.memo_set = MemoSet.objects.create(user=self.user, title="MemoSet")
+        self.calendar = Calendar.objects.create(user=self.user, title="Work")
+        self.target = Calendar.objects.create(user=self.user, title="Next Year")
+        self.tag = Tag.objects.create(user=self.user, title="업무")
+        self.friend = User.objects.create(
+            email="friend@test.com", birthday="1997-01-01"
+        )
+
+    def create_schedules(self, count, start=date(2025, 3, 1)):
+        schedules = []
+        for day in range(count):
+            schedule = Schedule.objects.create(
+                calendar=self.calendar,
+                title=f"Schedule {day}",
+                start_date=start + timedelta(days=day),
+                start_time=time(9),
+                end_time=time(10),
+                memo=Memo.objects.create(memo_set=self.memo_set, text=f"메모 {day}"),
+            )
+            schedule.participant.add(self.friend)
+            self.tag.schedule.add(schedule)
+            schedules.append(schedule)
+        return schedules
+
+    def test_copy_ids(self):
+        first, second, _ = self.create_schedules(3)
+
+        response = self.client.post(
+            self.URL,
+            {"schedule_ids": [first.pk, second.pk], "days": -1},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["count"], 2)
+
+        copies = Schedule.objects.filter(pk__in=response.data["ids"]).order_by("pk")
+        self.assertEqual(
+            [copy.start_date for copy in copies], [date(2025, 2, 28), date(2025, 3, 1)]
+        )
+        self.assertEqual(Memo.objects.count(), 5)
+        self.assertEqual(self.tag.schedule.count(), 5)
+
+        # 복사본도 바로 검색됩니다.
+        response = self.client.get(
+            "/api/v1/calendars/schedule/search/", {"query": "메모"}
+        )
+        self.assertEqual(response.data["count"], 5)
+
+    def test_copy_range_shifts_recurrence(self):
+        self.create_schedules(5)
+        Schedule.objects.create(
+            calendar=self.calendar,
+            title="격주 회의",
+            start_date=date(2025, 3, 3),
+            repeat_frequency="weekly",
+            repeat_interval=2,
+            repeat_until=date(2025, 6, 30),
+            repeat_exdates=["2025-03-17"],
+        )
+
+        response = self.client.post(
+            self.URL,
+            {
+                "source_calendar": "Work",
+                "start_date": "2025-03-02",
+                "end_date": "2025-03-04",
+                "calendar": "Next Year",
+                "days": 364,
+            },
+            format="json",
+        )
+        self.assertEqual(response.data["count"], 4)
+
+        series = self.target.calendar_schedule.get(title="격주 회의")
+        self.assertEqual(series.start_date, date(2026, 3, 2))
+        self.assertEqual(series.repeat_until, date(2026, 6, 29))
+        self.assertEqual(series.repeat_exdates, ["2026-03-16"])
+
+    def test_query_count_does_not_grow(self):
+        self.create_schedules(3)
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.URL, {"source_calendar": "Work"}, format="json")
+
+        self.create_schedules(30, start=date(2025, 4, 1))
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.post(
+                self.URL, {"source_calendar": "Work"}, format="json"
+            )
+
+        self.assertEqual(response.data["count"], 36)
+        self.assertEqual(len(large), len(small))
+
+    def test_invalid_requests(self):
+        schedule = self.create_schedules(1)[0]
+        for data in (
+            {},
+            {"schedule_ids": [schedule.pk], "source_calendar": "Work"},
+            {"schedule_ids": [schedule.pk], "start_date": "2025-03-01"},
+            {"source_calendar": "Work", "days": 10**6},
+        ):
+            response = self.client.post(self.URL, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(
+            self.URL, {"schedule_ids": [schedule.pk, 99999]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data["ids"], ["99999"])
+
 
 class TestScheduleSearch(TestAuthBase):
     URL = "/api/v1/calendars/schedule/search/"
@@ -369,34 +902,61 @@ class TestScheduleSearch(TestAuthBase):
     def test_search_by_english_title(self):
         response = self.client.get(self.URL, query_params={"query": "meeting"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["title"], "Team Meeting")
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["title"], "Team Meeting")
+
+    def test_index_follows_queryset_writes(self):
+        """save()를 거치지 않는 update, bulk_update, bulk_create도 인덱스에 반영됩니다."""
+
+        def titles(query):
+            response = self.client.get(self.URL, query_params={"query": query})
+            return [x["title"] for x in response.data["results"]]
+
+        Schedule.objects.filter(pk=self.schedule3.pk).update(title="Retrospective")
+        self.assertEqual(titles("retrospective"), ["Retrospective"])
+
+        self.schedule1.title = "Planning"
+        Schedule.objects.bulk_update([self.schedule1], ["title"])
+        self.assertEqual(titles("planning"), ["Planning"])
+
+        memo = Memo.objects.create(memo_set=self.memo_set, text="회식 장소 예약")
+        Schedule.objects.filter(pk=self.schedule2.pk).update(memo=memo)
+        self.assertEqual(titles("회식"), ["점심 미팅"])
+
+        Schedule.objects.bulk_create(
+            [
+                Schedule(
+                    calendar=self.calendar, title="Workshop", start_date=date.today()
+                )
+            ]
+        )
+        self.assertEqual(titles("workshop"), ["Workshop"])
 
     def test_search_by_korean_title(self):
         response = self.client.get(f"{self.URL}?query=점심")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["title"], "점심 미팅")
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["title"], "점심 미팅")
 
     def test_search_by_memo_text(self):
         response = self.client.get(f"{self.URL}?query=project")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
         self.assertEqual(
-            response.data[0]["memo"]["text"], "Meeting notes about project"
+            response.data["results"][0]["memo"]["text"], "Meeting notes about project"
         )
 
     def test_search_by_korean_memo_text(self):
         response = self.client.get(f"{self.URL}?query=약속")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["memo"]["text"], "점심 약속")
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["memo"]["text"], "점심 약속")
 
     def test_search_with_tag_filter(self):
         response = self.client.get(self.URL, query_params={"tag[]": [self.tag1.title]})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
-        titles = {schedule["title"] for schedule in response.data}
+        self.assertEqual(len(response.data["results"]), 2)
+        titles = {schedule["title"] for schedule in response.data["results"]}
         self.assertEqual(titles, {"Team Meeting", "Status Update"})
 
     def test_search_with_multiple_tags(self):
@@ -405,9 +965,12 @@ class TestScheduleSearch(TestAuthBase):
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(
-            len(response.data),
+            len(response.data["results"]),
             2,
-            [(x["id"], x["title"], x["schedule_tags"]) for x in response.data],
+            [
+                (x["id"], x["title"], x["schedule_tags"])
+                for x in response.data["results"]
+            ],
         )
         self.assertContains(response, self.tag1.title)
         self.assertContains(response, self.tag3.title)
@@ -417,15 +980,1291 @@ class TestScheduleSearch(TestAuthBase):
             self.URL, query_params={"query": "meeting", "tag[]": [self.tag1.title]}
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["title"], "Team Meeting")
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["title"], "Team Meeting")
 
     def test_search_no_results(self):
         response = self.client.get(self.URL, query_params={"query": "nonexistent"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data["results"]), 0)
 
     def test_search_with_nonexistent_tag(self):
         response = self.client.get(self.URL, query_params={"tag[]": ["NonexistentTag"]})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data["results"]), 0)
+
+    def test_search_inside_korean_compound(self):
+        """
+        띄어 쓰지 않은 한글 복합어 안의 단어도 icontains와 같이 검색됩니다.
+        """
+        Schedule.objects.create(
+            calendar=self.calendar, title="주간회의준비", start_date=datetime.now()
+        )
+        for query in ("회의", "간회", "주간회의준비", "비"):
+            response = self.client.get(self.URL, query_params={"query": query})
+            self.assertEqual(
+                [x["title"] for x in response.data["results"]], ["주간회의준비"], query
+            )
+
+        response = self.client.get(self.URL, query_params={"query": "회준"})
+        self.assertEqual(len(response.data["results"]), 0)
+
+    def test_search_ranked_by_relevance(self):
+        Schedule.objects.create(
+            calendar=self.calendar,
+            title="Status status status",
+            start_date=datetime.now(),
+        )
+        response = self.client.get(self.URL, query_params={"query": "status"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [x["title"] for x in response.data["results"]],
+            ["Status status status", "Status Update"],
+        )
+
+    def test_search_index_follows_memo_and_schedule_changes(self):
+        self.memo3.text = "Quarterly review"
+        self.memo3.save()
+
+        response = self.client.get(self.URL, query_params={"query": "quarterly"})
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["title"], "Status Update")
+
+        self.schedule3.delete()
+        response = self.client.get(self.URL, query_params={"query": "quarterly"})
+        self.assertEqual(len(response.data["results"]), 0)
+
+    def test_search_excludes_other_users(self):
+        other = User.objects.create(email="other@test.com", birthday="1997-01-01")
+        calendar = Calendar.objects.create(user=other, title="Other")
+        Schedule.objects.create(
+            calendar=calendar, title="Team Meeting", start_date=datetime.now()
+        )
+        response = self.client.get(self.URL, query_params={"query": "team"})
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_rebuild_index_command(self):
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM calendars_schedule_fts")
+
+        response = self.client.get(self.URL, query_params={"query": "meeting"})
+        self.assertEqual(len(response.data["results"]), 0)
+
+        call_command("rebuild_schedule_index", stdout=StringIO())
+
+        response = self.client.get(self.URL, query_params={"query": "meeting"})
+        self.assertEqual(len(response.data["results"]), 1)
+
+
+class TestScheduleRecurrence(TestAuthBase):
+    URL = "/api/v1/calendars/schedule/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.calendar = Calendar.objects.create(user=self.user, title="Work")
+        # 2025-01-06은 월요일입니다.
+        self.weekly = Schedule.objects.create(
+            calendar=self.calendar,
+            title="Weekly",
+            start_date=date(2025, 1, 6),
+            end_date=date(2025, 1, 6),
+            repeat_frequency=Schedule.FrequencyChoices.WEEKLY,
+            repeat_weekdays="MO,WE",
+        )
+        self.single = Schedule.objects.create(
+            calendar=self.calendar,
+            title="Single",
+            start_date=date(2025, 1, 7),
+        )
+
+    def get_titles_and_dates(self, **params):
+        response = self.client.get(self.URL, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return [(x["title"], x["start_date"]) for x in response.data["results"]]
+
+    def test_rule_is_stored_once(self):
+        self.assertTrue(Schedule.objects.get(pk=self.weekly.pk).is_repeat)
+        self.assertEqual(Schedule.objects.count(), 2)
+
+    def test_weekly_expansion_merged_with_single(self):
+        data = self.get_titles_and_dates(start_date="2025-01-06", view="weekly")
+        self.assertEqual(
+            data,
+            [
+                ("Weekly", "2025-01-06"),
+                ("Single", "2025-01-07"),
+                ("Weekly", "2025-01-08"),
+            ],
+        )
+
+    def test_expansion_starts_inside_window(self):
+        data = self.get_titles_and_dates(start_date="2025-03-03", view="daily")
+        self.assertEqual(data, [("Weekly", "2025-03-03")])
+
+    def test_exdates_count_and_until(self):
+        Schedule.objects.filter(pk=self.weekly.pk).update(
+            repeat_exdates=["2025-01-08"], repeat_count=3
+        )
+        data = self.get_titles_and_dates(start_date="2025-01-06", view="weekly")
+        self.assertEqual(data, [("Weekly", "2025-01-06"), ("Single", "2025-01-07")])
+
+        data = self.get_titles_and_dates(start_date="2025-01-13", view="weekly")
+        self.assertEqual(data, [("Weekly", "2025-01-13")])
+
+        Schedule.objects.filter(pk=self.weekly.pk).update(
+            repeat_count=None, repeat_until=date(2025, 1, 12)
+        )
+        data = self.get_titles_and_dates(start_date="2025-01-13", view="weekly")
+        self.assertEqual(data, [])
+
+    def test_multi_day_occurrence_after_until(self):
+        """repeat_until 이전에 시작해 그 이후까지 이어지는 발생도 조회됩니다."""
+        # 월요일부터 수요일까지, 마지막 발생은 1월 13일(월)에 시작합니다.
+        trip = Schedule.objects.create(
+            calendar=self.calendar,
+            title="Trip",
+            start_date=date(2025, 1, 6),
+            end_date=date(2025, 1, 8),
+            repeat_frequency=Schedule.FrequencyChoices.WEEKLY,
+            repeat_until=date(2025, 1, 13),
+        )
+        data = self.get_titles_and_dates(start_date="2025-01-15", view="daily")
+        self.assertIn(("Trip", "2025-01-13"), data)
+
+        data = self.get_titles_and_dates(start_date="2025-01-16", view="daily")
+        self.assertNotIn("Trip", [title for title, _ in data])
+
+        # update()로 규칙을 바꿔도 마지막 발생의 끝이 함께 갱신됩니다.
+        Schedule.objects.filter(pk=trip.pk).update(repeat_until=date(2025, 1, 20))
+        data = self.get_titles_and_dates(start_date="2025-01-22", view="daily")
+        self.assertIn(("Trip", "2025-01-20"), data)
+
+    def test_monthly_skips_missing_days(self):
+        Schedule.objects.create(
+            calendar=self.calendar,
+            title="Monthly",
+            start_date=date(2025, 1, 31),
+            repeat_frequency=Schedule.FrequencyChoices.MONTHLY,
+        )
+        dates = [
+            d
+            for title, d in self.get_titles_and_dates(start_date="2025-02-01")
+            if title == "Monthly"
+        ]
+        self.assertEqual(dates, [])
+
+        dates = [
+            d
+            for title, d in self.get_titles_and_dates(start_date="2025-03-01")
+            if title == "Monthly"
+        ]
+        self.assertEqual(dates, ["2025-03-31"])
+
+    def test_create_with_invalid_rule(self):
+        payload = {
+            "calendar": self.calendar.title,
+            "title": "Bad rule",
+            "start_date": "2025-01-01",
+            "repeat_frequency": "weekly",
+            "repeat_weekdays": "XX",
+        }
+        response = self.client.post(self.URL, data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("repeat_weekdays", response.data)
+
+
+class TestScheduleListQueryCount(TestAuthBase):
+    URL = "/api/v1/calendars/schedule/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.calendar = Calendar.objects.create(user=self.user, title="Work")
+        self.memo_set = MemoSet.objects.create(user=self.user, title="Memo")
+        self.tag = Tag.objects.create(user=self.user, title="work")
+        self.friend = User.objects.create(
+            email="friend@test.com", birthday="1997-01-01"
+        )
+
+    def create_schedules(self, start, count):
+        for i in range(count):
+            schedule = Schedule.objects.create(
+                calendar=self.calendar,
+                title=f"Schedule {i}",
+                start_date=start + timedelta(days=i),
+                memo=Memo.objects.create(memo_set=self.memo_set, text=f"memo {i}"),
+                repeat_frequency=(
+                    Schedule.FrequencyChoices.YEARLY if i % 3 == 0 else None
+                ),
+            )
+            schedule.participant.add(self.user, self.friend)
+            schedule.schedule_tags.add(self.tag)
+
+    def count_queries(self, url, params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries), response
+
+    def test_list_query_count_is_flat(self):
+        self.create_schedules(date(2025, 1, 1), 2)
+        self.create_schedules(date(2025, 3, 1), 10)
+
+        small, response = self.count_queries(self.URL, {"start_date": "2025-01-01"})
+        self.assertEqual(len(response.data["results"]), 2)
+
+        large, response = self.count_queries(self.URL, {"start_date": "2025-03-01"})
+        self.assertEqual(len(response.data["results"]), 10)
+        self.assertEqual(small, large)
+
+        row = response.data["results"][0]
+        self.assertEqual(row["schedule_tags"], [self.tag.title])
+        self.assertEqual(set(row["participant"]), {self.user.pk, self.friend.pk})
+        self.assertEqual(row["memo"]["memo_schedule"], row["id"])
+
+    def test_search_query_count_is_flat(self):
+        self.create_schedules(date(2025, 1, 1), 2)
+        small, response = self.count_queries(
+            "/api/v1/calendars/schedule/search/", {"query": "Schedule"}
+        )
+        self.assertEqual(len(response.data["results"]), 2)
+
+        self.create_schedules(date(2025, 3, 1), 10)
+        large, response = self.count_queries(
+            "/api/v1/calendars/schedule/search/", {"query": "Schedule"}
+        )
+        self.assertEqual(len(response.data["results"]), 10)
+        self.assertEqual(response.data["count"], 12)
+        self.assertEqual(small, large)
+
+
+class TestFreeBusy(TestAuthBase):
+    URL = "/api/v1/calendars/freebusy/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.work = Calendar.objects.create(user=self.user, title="Work")
+        self.personal = Calendar.objects.create(user=self.user, title="Personal")
+        self.friend = User.objects.create(
+            email="friend@test.com", birthday="1997-01-01"
+        )
+        self.friend_calendar = Calendar.objects.create(user=self.friend, title="Friend")
+
+        day = date(2025, 1, 6)
+        # 09:00-10:00와 09:30-11:00는 하나의 구간으로 병합됩니다.
+        Schedule.objects.create(
+            calendar=self.work,
+            title="Standup",
+            start_date=day,
+            start_time=time(9),
+            end_time=time(10),
+        )
+        Schedule.objects.create(
+            calendar=self.personal,
+            title="Dentist",
+            start_date=day,
+            start_time=time(9, 30),
+            end_time=time(11),
+        )
+        # 매주 월요일 14:00-15:00
+        Schedule.objects.create(
+            calendar=self.work,
+            title="Weekly",
+            start_date=date(2024, 12, 2),
+            start_time=time(14),
+            end_time=time(15),
+            repeat_frequency=Schedule.FrequencyChoices.WEEKLY,
+        )
+        Schedule.objects.create(
+            calendar=self.friend_calendar,
+            title="Friend lunch",
+            start_date=day,
+            start_time=time(12),
+            end_time=time(13),
+        )
+
+    def get_busy(self, **params):
+        response = self.client.get(
+            self.URL,
+            {"start": "2025-01-06T00:00:00", "end": "2025-01-07T00:00:00", **params},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return [
+            (
+                datetime.fromisoformat(x["start"]).strftime("%H:%M"),
+                datetime.fromisoformat(x["end"]).strftime("%H:%M"),
+            )
+            for x in response.data["busy"]
+        ]
+
+    def test_merges_own_calendars_and_expands_recurrence(self):
+        self.assertEqual(self.get_busy(), [("09:00", "11:00"), ("14:00", "15:00")])
+
+    def test_filter_by_calendar(self):
+        self.assertEqual(
+            self.get_busy(**{"calendar[]": ["Personal"]}), [("09:30", "11:00")]
+        )
+
+    def test_participant_user(self):
+        shared = Schedule.objects.create(
+            calendar=self.work,
+            title="Shared",
+            start_date=date(2025, 1, 6),
+            start_time=time(16),
+            end_time=time(17),
+        )
+        shared.participant.add(self.friend)
+
+        self.assertEqual(
+            self.get_busy(**{"user[]": [self.friend.email]}),
+            [("12:00", "13:00"), ("16:00", "17:00")],
+        )
+
+    def test_clips_to_window_and_all_day(self):
+        Schedule.objects.create(
+            calendar=self.work,
+            title="Trip",
+            start_date=date(2025, 1, 5),
+            end_date=date(2025, 1, 6),
+        )
+        busy = self.get_busy(start="2025-01-06T08:00:00", end="2025-01-06T12:00:00")
+        self.assertEqual(busy, [("08:00", "12:00")])
+
+    def test_invalid_range(self):
+        response = self.client.get(
+            self.URL, {"start": "2025-01-06T00:00:00", "end": "2025-01-05T00:00:00"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.URL, {"start": "2025-01-06T00:00:00"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestScheduleBulk(TestAuthBase):
+    URL = "/api/v1/calendars/schedule/bulk/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.calendar = Calendar.objects.create(user=self.user, title="Calendar")
+        self.work = Calendar.objects.create(user=self.user, title="Work")
+        self.memo_set = MemoSet.objects.create(user=self.user, title="Memo")
+        self.tag = Tag.objects.create(user=self.user, title="lecture")
+        self.existing = Schedule.objects.create(
+            calendar=self.calendar, title="Existing", start_date=date(2025, 3, 3)
+        )
+        self.obsolete = Schedule.objects.create(
+            calendar=self.calendar, title="Obsolete", start_date=date(2025, 3, 4)
+        )
+
+    def post(self, operations):
+        return self.client.post(self.URL, {"operations": operations}, format="json")
+
+    def test_create_update_delete(self):
+        operations = [
+            {
+                "op": "create",
+                "data": {
+                    "calendar": "Work",
+                    "title": f"강의 {i}",
+                    "start_date": "2025-03-05",
+                    "start_time": "09:00",
+                    "end_time": "10:30",
+                    "repeat_frequency": "weekly",
+                    "repeat_weekdays": "we",
+                    "schedule_tags": ["lecture"],
+                    "memo": {"title": "강의실", "text": f"공학관 {i}호"},
+                },
+            }
+            for i in range(20)
+        ]
+        operations += [
+            {"op": "update", "id": self.existing.pk, "data": {"title": "Renamed"}},
+            {"op": "delete", "id": self.obsolete.pk},
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post(operations)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertLess(len(queries), 30)
+
+        results = response.data["results"]
+        self.assertEqual(
+            [x["status"] for x in results], ["created"] * 20 + ["updated", "deleted"]
+        )
+
+        created = Schedule.objects.get(pk=results[0]["id"])
+        self.assertEqual(created.calendar, self.work)
+        self.assertTrue(created.is_repeat)
+        self.assertEqual(created.repeat_weekdays, "WE")
+        self.assertEqual(created.memo.memo_set, self.memo_set)
+        self.assertEqual(list(created.schedule_tags.all()), [self.tag])
+        self.assertEqual(Schedule.objects.get(pk=self.existing.pk).title, "Renamed")
+        self.assertFalse(Schedule.objects.filter(pk=self.obsolete.pk).exists())
+
+        # bulk_create로 만든 일정도 검색 인덱스에 반영됩니다.
+        response = self.client.get(
+            "/api/v1/calendars/schedule/search/", {"query": "공학관"}
+        )
+        self.assertEqual(response.data["count"], 20)
+
+    def test_invalid_item_rolls_back_everything(self):
+        response = self.post(
+            [
+                {
+                    "op": "create",
+                    "data": {"title": "OK", "start_date": "2025-03-05"},
+                },
+                {
+                    "op": "create",
+                    "data": {
+                        "calendar": "Missing",
+                        "title": "Nope",
+                        "start_date": "2025-03-05",
+                    },
+                },
+                {
+                    "op": "create",
+                    "data": {"calendar": "Missing", "title": "Nope"},
+                },
+                {"op": "update", "id": 99999, "data": {"title": "Nope"}},
+                {"op": "delete", "id": self.obsolete.pk},
+            ]
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        results = response.data["results"]
+        self.assertEqual(
+            [x["status"] for x in results],
+            ["skipped", "error", "error", "error", "skipped"],
+        )
+        self.assertIn("calendar", results[1]["errors"])
+        self.assertIn("start_date", results[2]["errors"])
+        self.assertIn("id", results[3]["errors"])
+        self.assertEqual(Schedule.objects.count(), 2)
+
+    def test_cannot_touch_other_users_schedule(self):
+        other = User.objects.create(email="other@test.com", birthday="1990-01-01")
+        schedule = Schedule.objects.create(
+            calendar=Calendar.objects.create(user=other, title="Calendar"),
+            title="Private",
+            start_date=date(2025, 3, 3),
+        )
+
+        response = self.post([{"op": "delete", "id": schedule.pk}])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(Schedule.objects.filter(pk=schedule.pk).exists())
+
+
+class TestConditionalGet(TestAuthBase):
+    URL = "/api/v1/calendars/schedule/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.work = Calendar.objects.create(user=self.user, title="Work")
+        self.personal = Calendar.objects.create(user=self.user, title="Personal")
+        self.schedule = Schedule.objects.create(
+            calendar=self.work, title="Meeting", start_date=date(2025, 1, 6)
+        )
+        self.params = {"start_date": "2025-01-01", "calendar[]": ["Work"]}
+
+    def get(self, url, params=None, etag=None):
+        headers = {"If-None-Match": etag} if etag else {}
+        return self.client.get(url, params, headers=headers)
+
+    def assertNotModified(self, url, params=None):
+        etag = self.get(url, params)["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(url, params, etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        # 일정 행은 읽지 않습니다.
+        self.assertFalse(
+            any(
+                'FROM "calendars_schedule"' in q["sql"]
+                for q in queries.captured_queries
+            )
+        )
+        return etag
+
+    def test_schedule_list_not_modified(self):
+        etag = self.assertNotModified(self.URL, self.params)
+
+        # 다른 조회 조건은 다른 ETag를 가집니다.
+        response = self.get(self.URL, {**self.params, "view": "weekly"}, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_schedule_list_changes_invalidate(self):
+        tag = Tag.objects.create(user=self.user, title="important")
+        changes = [
+            lambda: Schedule.objects.create(
+                calendar=self.work, title="New", start_date=date(2025, 1, 7)
+            ),
+            lambda: self.schedule.schedule_tags.add(tag),
+            lambda: setattr(tag, "title", "urgent") or tag.save(),
+            lambda: Schedule.objects.filter(pk=self.schedule.pk).update(title="Moved"),
+        ]
+        for change in changes:
+            etag = self.get(self.URL, self.params)["ETag"]
+            change()
+            response = self.get(self.URL, self.params, etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_moving_schedule_touches_both_calendars(self):
+        etag = self.get(self.URL, self.params)["ETag"]
+
+        self.schedule.calendar = self.personal
+        self.schedule.save()
+
+        response = self.get(self.URL, self.params, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [])
+
+    def test_schedule_detail(self):
+        url = f"{self.URL}{self.schedule.pk}/"
+        response = self.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["title"], "Meeting")
+
+        self.assertNotModified(url)
+
+        response = self.get(f"{self.URL}99999/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_calendar_set_responses_have_no_last_modified(self):
+        """캘린더를 삭제해 목록이 줄어도 If-Modified-Since로 304를 받지 않습니다."""
+        urls = [
+            ("/api/v1/calendars/", None),
+            (self.URL, {"start_date": "2025-01-01"}),
+            ("/api/v1/calendars/heatmap/", {"year": 2025}),
+        ]
+        responses = [self.client.get(url, params) for url, params in urls]
+        for response in responses:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("Last-Modified", response)
+
+        self.personal.delete()
+
+        for (url, params), before in zip(urls, responses):
+            response = self.client.get(
+                url,
+                params,
+                headers={"If-Modified-Since": "Fri, 31 Dec 9999 23:59:59 GMT"},
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotEqual(response["ETag"], before["ETag"])
+
+    def test_calendar_list_and_detail(self):
+        self.assertNotModified("/api/v1/calendars/")
+        etag = self.assertNotModified("/api/v1/calendars/name/Work/")
+
+        Schedule.objects.create(
+            calendar=self.work, title="New", start_date=date(2025, 1, 7)
+        )
+        response = self.get("/api/v1/calendars/name/Work/", etag=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TestScheduleListCache(TestAuthBase):
+    URL = "/api/v1/calendars/schedule/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.calendar = Calendar.objects.create(user=self.user, title="Work")
+        self.january = Schedule.objects.create(
+            calendar=self.calendar, title="January", start_date=date(2025, 1, 6)
+        )
+        self.march = Schedule.objects.create(
+            calendar=self.calendar, title="March", start_date=date(2025, 3, 6)
+        )
+
+    def get_titles(self, start_date="2025-01-01"):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.URL, {"start_date": start_date})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.schedule_queries = [
+            q
+            for q in queries.captured_queries
+            if 'FROM "calendars_schedule"' in q["sql"]
+        ]
+        return [x["title"] for x in response.data["results"]]
+
+    def test_hit_and_invalidation(self):
+        self.assertEqual(self.get_titles(), ["January"])
+        self.assertEqual(self.get_titles(), ["January"])
+        self.assertEqual(self.schedule_queries, [])
+
+        # 1월로 옮겨 오면 1월(새 위치)과 3월(이전 위치) 응답 모두 새로 만듭니다.
+        self.get_titles("2025-03-01")
+        Schedule.objects.filter(pk=self.march.pk).update(start_date=date(2025, 1, 20))
+        self.assertEqual(self.get_titles(), ["January", "March"])
+        self.assertEqual(self.get_titles("2025-03-01"), [])
+
+        stats = schedule_cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 4))
+        self.assertGreater(stats["invalidations"], 0)
+
+    def test_change_from_other_process(self):
+        """다른 프로세스가 일정을 바꿔 이 프로세스의 캐시가 그대로여도, version이 바뀌면 새로 조회합니다."""
+        self.assertEqual(self.get_titles(), ["January"])
+
+        # 일정 훅을 거치지 않는 쓰기와 캘린더 touch만 흉내 냅니다.
+        models.QuerySet(Schedule).filter(pk=self.january.pk).update(title="Moved")
+        Calendar.objects.filter(pk=self.calendar.pk).touch()
+
+        self.assertEqual(self.get_titles(), ["Moved"])
+
+    def test_related_and_recurring_changes_invalidate(self):
+        self.get_titles()
+
+        tag = Tag.objects.create(user=self.user, title="urgent")
+        self.january.schedule_tags.add(tag)
+        self.get_titles()
+        self.assertNotEqual(self.schedule_queries, [])
+
+        # 반복 일정은 캘린더의 모든 기간을 무효화합니다.
+        self.get_titles("2025-03-01")
+        Schedule.objects.create(
+            calendar=self.calendar,
+            title="Daily",
+            start_date=date(2024, 12, 1),
+            repeat_frequency=Schedule.FrequencyChoices.DAILY,
+            repeat_count=100,
+        )
+        self.assertIn("Daily", self.get_titles("2025-03-01"))
+
+    def test_stats_command(self):
+        with tempfile.TemporaryDirectory() as location:
+            shared = {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": location,
+            }
+            with override_settings(CACHES={**settings.CACHES, "schedules": shared}):
+                self.get_titles()
+                self.get_titles()
+
+                out = StringIO()
+                call_command("schedule_cache_stats", "--reset", stdout=out)
+                self.assertIn("hit rate: 50.0%", out.getvalue())
+                self.assertEqual(schedule_cache.stats()["hits"], 0)
+
+    def test_stats_command_requires_shared_cache(self):
+        with self.assertRaises(CommandError):
+            call_command("schedule_cache_stats", stdout=StringIO())
+
+
+class TestScheduleAgenda(TestAuthBase):
+    URL = "/api/v1/calendars/schedule/agenda/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.calendar = Calendar.objects.create(user=self.user, title="Work")
+        for month in range(1, 13):
+            Schedule.objects.create(
+                calendar=self.calendar,
+                title=f"Review {month}",
+                start_date=date(2025, month, 15),
+                start_time=time(10),
+            )
+        Schedule.objects.create(
+            calendar=self.calendar,
+            title="Standup",
+            start_date=date(2025, 1, 6),
+            start_time=time(9),
+            repeat_frequency=Schedule.FrequencyChoices.WEEKLY,
+            repeat_until=date(2025, 1, 31),
+        )
+
+    def get_lines(self, **params):
+        response = self.client.get(self.URL, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        body = b"".join(response.streaming_content).decode("utf-8")
+        return [json.loads(line) for line in body.splitlines()]
+
+    def test_streams_whole_range_in_order(self):
+        lines = self.get_lines(start_date="2025-01-01", end_date="2026-01-01")
+        self.assertEqual(len(lines), 12 + 4)
+        self.assertEqual(
+            [(x["title"], x["start_date"]) for x in lines[:5]],
+            [
+                ("Standup", "2025-01-06"),
+                ("Standup", "2025-01-13"),
+                ("Review 1", "2025-01-15"),
+                ("Standup", "2025-01-20"),
+                ("Standup", "2025-01-27"),
+            ],
+        )
+        self.assertEqual(lines[-1]["title"], "Review 12")
+
+    def test_reads_singles_in_chunks(self):
+        with patch.object(ScheduleAgendaView, "chunk_size", 5):
+            lines = self.get_lines(start_date="2025-01-01", end_date="2026-01-01")
+        self.assertEqual(len(lines), 16)
+
+    def test_rules_stop_at_date_max(self):
+        for frequency in ("daily", "weekly"):
+            Schedule.objects.create(
+                calendar=self.calendar,
+                title=frequency,
+                start_date=date(9999, 12, 1),
+                end_date=date(9999, 12, 3),
+                repeat_frequency=frequency,
+            )
+
+        lines = self.get_lines(start_date="9999-12-01", end_date="9999-12-31")
+        titles = Counter(x["title"] for x in lines)
+        # 12월 30일의 daily 발생은 종료일이 date.max를 넘으므로 나타낼 수 없습니다.
+        self.assertEqual(titles, {"daily": 29, "weekly": 5})
+
+    def test_invalid_range(self):
+        response = self.client.get(
+            self.URL, {"start_date": "2025-02-01", "end_date": "2025-01-01"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.URL, {"start_date": "2025-02-01"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestCalendarFeed(TestAuthBase):
+    def setUp(self):
+        super().setUp()
+
+        self.calendar = Calendar.objects.create(user=self.user, title="Work")
+        memo_set = MemoSet.objects.create(user=self.user, title="Memo")
+        self.meeting = Schedule.objects.create(
+            calendar=self.calendar,
+            title="Meeting, weekly",
+            start_date=date(2025, 1, 6),
+            start_time=time(9),
+            end_time=time(10),
+            repeat_frequency=Schedule.FrequencyChoices.WEEKLY,
+            repeat_weekdays="MO,WE",
+            repeat_until=date(2025, 3, 31),
+            repeat_exdates=["2025-01-08"],
+            memo=Memo.objects.create(
+                memo_set=memo_set, title="Agenda", text="1. 회고\n2. 계획"
+            ),
+        )
+        self.meeting.schedule_tags.add(Tag.objects.create(user=self.user, title="work"))
+        Schedule.objects.create(
+            calendar=self.calendar,
+            title="Holiday",
+            start_date=date(2025, 1, 28),
+            end_date=date(2025, 1, 30),
+        )
+        self.url = "/api/v1/calendars/name/Work/feed.ics"
+
+    def get_feed(self, token=None, etag=None):
+        headers = {"If-None-Match": etag} if etag else {}
+        self.client.credentials()
+        return self.client.get(
+            self.url, {"token": token or self.calendar.feed_token}, headers=headers
+        )
+
+    def test_feed_contents(self):
+        response = self.get_feed()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/calendar"))
+
+        body = b"".join(response.streaming_content).decode("utf-8")
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertTrue(body.endswith("END:VCALENDAR\r\n"))
+        self.assertEqual(body.count("BEGIN:VEVENT"), 2)
+        self.assertIn("SUMMARY:Meeting\\, weekly\r\n", body)
+        self.assertIn("DTSTART:20250106T000000Z\r\n", body)
+        self.assertIn("RRULE:FREQ=WEEKLY;UNTIL=20250331T145959Z;BYDAY=MO,WE\r\n", body)
+        self.assertIn("EXDATE:20250108T000000Z\r\n", body)
+        self.assertIn("DESCRIPTION:1. 회고\\n2. 계획\r\n", body)
+        self.assertIn("CATEGORIES:work\r\n", body)
+        self.assertIn("DTSTART;VALUE=DATE:20250128\r\n", body)
+        self.assertIn("DTEND;VALUE=DATE:20250131\r\n", body)
+
+    def test_feed_requires_token(self):
+        response = self.get_feed(token="wrong")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_feed_not_modified_until_schedule_changes(self):
+        etag = self.get_feed()["ETag"]
+        self.assertEqual(
+            self.get_feed(etag=etag).status_code, status.HTTP_304_NOT_MODIFIED
+        )
+
+        self.meeting.title = "Renamed"
+        self.meeting.save()
+        self.assertEqual(self.get_feed(etag=etag).status_code, status.HTTP_200_OK)
+
+    def test_long_lines_are_folded(self):
+        self.assertEqual(ical.fold("A" * 75), "A" * 75 + "\r\n")
+
+        folded = ical.fold("SUMMARY:" + "가" * 40)
+        lines = folded.split("\r\n")[:-1]
+        self.assertTrue(all(len(line.encode("utf-8")) <= 75 for line in lines))
+        self.assertEqual(
+            "".join(line.lstrip(" ") for line in lines), "SUMMARY:" + "가" * 40
+        )
+
+
+class TestIcalImport(TestAuthBase):
+    FEED = """BEGIN:VCALENDAR\r
+VERSION:2.0\r
+PRODID:-//Google Inc//Google Calendar 70.9054//EN\r
+BEGIN:VEVENT\r
+DTSTART;TZID=America/New_York:20250106T190000\r
+DTEND;TZID=America/New_York:20250106T200000\r
+DTSTAMP:{stamp}\r
+UID:standup@google.com\r
+RRULE:FREQ=WEEKLY;UNTIL=20250331T235959Z;BYDAY=MO,WE\r
+EXDATE;TZID=America/New_York:20250108T190000\r
+SUMMARY:Standup\\, daily sync\r
+BEGIN:VALARM\r
+ACTION:DISPLAY\r
+SUMMARY:Alarm\r
+END:VALARM\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+DTSTART;TZID=America/New_York:20250108T200000\r
+RECURRENCE-ID;TZID=America/New_York:20250108T190000\r
+DTSTAMP:{stamp}\r
+UID:standup@google.com\r
+SUMMARY:Moved standup\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+DTSTART;VALUE=DATE:20250128\r
+DTEND;VALUE=DATE:20250131\r
+DTSTAMP:{stamp}\r
+UID:holiday@google.com\r
+SUMMARY:{holiday}\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+DTSTART:20250301T010000Z\r
+DURATION:PT1H30M\r
+DTSTAMP:{stamp}\r
+UID:monthly@google.com\r
+RRULE:FREQ=MONTHLY;BYDAY=1SA\r
+SUMMARY:First Saturday\r
+END:VEVENT\r
+{extra}END:VCALENDAR\r
+"""
+
+    def feed(self, stamp="20250101T000000Z", holiday="설날 연휴", extra=""):
+        text = self.FEED.format(stamp=stamp, holiday=holiday, extra=extra)
+        return BytesIO(text.encode("utf-8"))
+
+    def test_import_fields(self):
+        counts = importer.import_feed(self.user, self.feed())
+        self.assertEqual(counts["created"], 3)
+
+        calendar = Calendar.objects.get(user=self.user, title=importer.IMPORT_CALENDAR)
+        standup = Schedule.objects.get(calendar=calendar, ical_uid="standup@google.com")
+        self.assertEqual(standup.title, "Standup, daily sync")
+        # 뉴욕 19시는 서울 다음 날 9시입니다.
+        self.assertEqual(
+            (standup.start_date, standup.start_time, standup.end_time),
+            (date(2025, 1, 7), time(9), time(10)),
+        )
+        self.assertEqual(standup.repeat_frequency, "weekly")
+        self.assertEqual(standup.repeat_weekdays, "MO,WE")
+        self.assertEqual(standup.repeat_until, date(2025, 4, 1))
+        self.assertEqual(standup.repeat_exdates, ["2025-01-09"])
+
+        holiday = Schedule.objects.get(ical_uid="holiday@google.com")
+        self.assertEqual(
+            (holiday.start_date, holiday.end_date, holiday.start_time),
+            (date(2025, 1, 28), date(2025, 1, 30), None),
+        )
+
+        # 엔진이 표현할 수 없는 규칙은 단일 일정으로 가져옵니다.
+        monthly = Schedule.objects.get(ical_uid="monthly@google.com")
+        self.assertIsNone(monthly.repeat_frequency)
+        self.assertEqual(
+            (monthly.start_time, monthly.end_time), (time(10), time(11, 30))
+        )
+
+    def test_resync_touches_only_changed_rows(self):
+        importer.import_feed(self.user, self.feed())
+        standup = Schedule.objects.get(ical_uid="standup@google.com")
+
+        extra = (
+            "BEGIN:VEVENT\r\nDTSTART;VALUE=DATE:20250301\r\n"
+            "UID:new@google.com\r\nSUMMARY:New\r\nEND:VEVENT\r\n"
+        )
+        # DTSTAMP는 내려받을 때마다 바뀌지만 내용 변경으로 보지 않습니다.
+        counts = importer.import_feed(
+            self.user,
+            self.feed(stamp="20250201T000000Z", holiday="설 연휴", extra=extra),
+        )
+        self.assertEqual(
+            counts,
+            Counter(created=1, updated=1, unchanged=2, deleted=0),
+        )
+        self.assertEqual(
+            Schedule.objects.get(pk=standup.pk).updated_at, standup.updated_at
+        )
+        self.assertEqual(
+            Schedule.objects.get(ical_uid="holiday@google.com").title, "설 연휴"
+        )
+
+        counts = importer.import_feed(self.user, self.feed())
+        self.assertEqual((counts["deleted"], counts["updated"]), (1, 1))
+        self.assertFalse(Schedule.objects.filter(ical_uid="new@google.com").exists())
+
+    def test_import_in_batches(self):
+        events = "".join(
+            f"BEGIN:VEVENT\r\nDTSTART;VALUE=DATE:2025020{i}\r\n"
+            f"UID:event-{i}\r\nSUMMARY:Event {i}\r\nEND:VEVENT\r\n"
+            for i in range(1, 8)
+        )
+        with patch.object(importer, "BATCH_SIZE", 2):
+            counts = importer.import_feed(self.user, self.feed(extra=events))
+        self.assertEqual(counts["created"], 10)
+
+        # 가져온 일정도 검색 인덱스에 반영됩니다.
+        response = self.client.get(
+            "/api/v1/calendars/schedule/search/", {"query": "연휴"}
+        )
+        self.assertEqual(response.data["count"], 1)
+
+    def test_malformed_events_are_skipped(self):
+        importer.import_feed(self.user, self.feed())
+        holiday = Schedule.objects.get(ical_uid="holiday@google.com")
+
+        bad = (
+            "BEGIN:VEVENT\r\nDTSTART:2025-02-01\r\n"
+            "UID:bad-date@google.com\r\nSUMMARY:Bad date\r\nEND:VEVENT\r\n"
+            "BEGIN:VEVENT\r\nDTSTART;VALUE=DATE:20250201\r\n"
+            "RRULE:FREQ=DAILY;INTERVAL=x\r\n"
+            "UID:bad-rule@google.com\r\nSUMMARY:Bad rule\r\nEND:VEVENT\r\n"
+            "BEGIN:VEVENT\r\nDTSTART;VALUE=DATE:20250301\r\n"
+            "UID:good@google.com\r\nSUMMARY:Good\r\nEND:VEVENT\r\n"
+        )
+        # 이미 가져온 이벤트가 잘못된 값으로 바뀌어도 이전 일정을 지우지 않습니다.
+        feed = (
+            self.feed(extra=bad)
+            .getvalue()
+            .replace(b"DTSTART;VALUE=DATE:20250128", b"DTSTART;VALUE=DATE:2025-01-28")
+        )
+        with patch.object(importer, "BATCH_SIZE", 1):
+            counts = importer.import_feed(self.user, BytesIO(feed))
+
+        self.assertEqual(
+            counts,
+            Counter(created=1, updated=0, unchanged=2, deleted=0, skipped=3),
+        )
+        self.assertTrue(Schedule.objects.filter(ical_uid="good@google.com").exists())
+        self.assertEqual(Schedule.objects.get(pk=holiday.pk).title, holiday.title)
+        self.assertFalse(Schedule.objects.filter(ical_uid__startswith="bad-").exists())
+
+    def test_command_reads_google_cal_url(self):
+        with tempfile.NamedTemporaryFile(suffix=".ics", delete=False) as file:
+            file.write(self.feed().getvalue())
+        self.addCleanup(os.remove, file.name)
+
+        self.user.google_cal_url = "https://calendar.google.com/basic.ics"
+        self.user.save()
+
+        # 테스트에서만 피드 주소 대신 로컬 파일을 엽니다.
+        out = StringIO()
+        with patch.object(
+            importer, "open_source", side_effect=lambda url: open(file.name, "rb")
+        ):
+            call_command("import_google_calendars", stdout=out)
+        self.assertIn("생성 3", out.getvalue())
+
+    def test_open_source_rejects_local_and_internal_urls(self):
+        urls = [
+            "/etc/passwd",
+            "file:///etc/passwd",
+            "ftp://example.com/basic.ics",
+            "http://127.0.0.1/basic.ics",
+            "http://localhost:8000/basic.ics",
+            "http://10.0.0.1/basic.ics",
+            "http://169.254.169.254/latest/meta-data/",
+            "http://[::1]/basic.ics",
+        ]
+        for url in urls:
+            with self.subTest(url=url), self.assertRaises(ValueError):
+                importer.open_source(url)
+
+        # 공개 주소에서 내부 주소로 리다이렉트하는 것도 막습니다.
+        with self.assertRaises(ValueError):
+            importer._PublicRedirectHandler().redirect_request(
+                None, None, 302, "Found", {}, "http://127.0.0.1/basic.ics"
+            )
+
+    def test_command_reports_rejected_url(self):
+        self.user.google_cal_url = "file:///etc/passwd"
+        self.user.save()
+
+        err = StringIO()
+        call_command("import_google_calendars", stdout=StringIO(), stderr=err)
+        self.assertIn("가져오기에 실패했습니다", err.getvalue())
+        self.assertFalse(Schedule.objects.filter(calendar__user=self.user).exists())
+
+
+class TestHeatmap(TestAuthBase):
+    URL = "/api/v1/calendars/heatmap/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.calendar = Calendar.objects.create(user=self.user, title="Work")
+        self.home = Calendar.objects.create(user=self.user, title="Home")
+        for day in (3, 3, 20):
+            Schedule.objects.create(
+                calendar=self.calendar,
+                title="회의",
+                start_date=date(2025, 3, day),
+                start_time=time(10),
+                end_time=time(11),
+            )
+        # 3월 30일부터 4월 1일까지 사흘에 걸친 일정입니다.
+        Schedule.objects.create(
+            calendar=self.home,
+            title="여행",
+            start_date=date(2025, 3, 30),
+            end_date=date(2025, 4, 1),
+        )
+        # 매주 월요일(3월에는 3, 10, 17, 24, 31일)
+        Schedule.objects.create(
+            calendar=self.calendar,
+            title="주간 보고",
+            start_date=date(2025, 1, 6),
+            start_time=time(14),
+            end_time=time(15),
+            repeat_frequency="weekly",
+        )
+
+    def test_month(self):
+        response = self.client.get(self.URL, {"year": 2025, "month": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["start_date"], "2025-03-01")
+        self.assertEqual(response.data["end_date"], "2025-03-31")
+
+        counts = response.data["counts"]
+        self.assertEqual(len(counts), 31)
+        expected = {3: 3, 10: 1, 17: 1, 20: 1, 24: 1, 30: 1, 31: 2}
+        self.assertEqual(
+            {day: count for day, count in enumerate(counts, 1) if count}, expected
+        )
+
+    def test_multi_day_rule_across_month_edge(self):
+        # 9일에 걸친 주간 일정입니다. 1월 23일, 30일에 시작하는 발생이 모두 2월까지 이어집니다.
+        Schedule.objects.create(
+            calendar=self.home,
+            title="장기 출장",
+            start_date=date(2025, 1, 23),
+            end_date=date(2025, 2, 1),
+            repeat_frequency="weekly",
+            repeat_until=date(2025, 1, 30),
+        )
+        response = self.client.get(
+            self.URL, {"year": 2025, "month": 2, "calendar[]": "Home"}
+        )
+        counts = response.data["counts"]
+        self.assertEqual(counts[:9], [2, 1, 1, 1, 1, 1, 1, 1, 0])
+
+    def test_year_and_calendar_filter(self):
+        response = self.client.get(self.URL, {"year": 2025, "calendar[]": "Home"})
+        counts = response.data["counts"]
+        self.assertEqual(len(counts), 365)
+        self.assertEqual(sum(counts), 3)
+        self.assertEqual(counts[date(2025, 4, 1).timetuple().tm_yday - 1], 1)
+
+        response = self.client.get(self.URL, {"year": 2025})
+        # 단일 일정 3개 + 여행 3일 + 2025년의 월요일 52번
+        self.assertEqual(sum(response.data["counts"]), 3 + 3 + 52)
+
+    def test_cached_until_month_changes(self):
+        self.client.get(self.URL, {"year": 2025, "month": 3})
+
+        # 캐시된 응답은 인증 유저 조회와 캘린더 조회만으로 반환됩니다.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.URL, {"year": 2025, "month": 3})
+        self.assertEqual(response.data["counts"][19], 1)
+
+        Schedule.objects.create(
+            calendar=self.home, title="저녁", start_date=date(2025, 3, 20)
+        )
+        response = self.client.get(self.URL, {"year": 2025, "month": 3})
+        self.assertEqual(response.data["counts"][19], 2)
+
+    def test_conditional_get(self):
+        response = self.client.get(self.URL, {"year": 2025, "month": 3})
+        response = self.client.get(
+            self.URL,
+            {"year": 2025, "month": 3},
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_invalid_params(self):
+        for params in ({}, {"year": "x"}, {"year": 2025, "month": 13}):
+            response = self.client.get(self.URL, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestSharedSchedules(TestAuthBase):
+    URL = "/api/v1/calendars/schedule/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.calendar = Calendar.objects.create(user=self.user, title="Work")
+        Schedule.objects.create(
+            calendar=self.calendar, title="내 일정", start_date=date(2025, 3, 3)
+        )
+
+        self.friend = User.objects.create(
+            email="friend@test.com", birthday="1997-01-01"
+        )
+        friend_calendar = Calendar.objects.create(user=self.friend, title="Friend")
+        self.shared = Schedule.objects.create(
+            calendar=friend_calendar, title="함께하는 일정", start_date=date(2025, 3, 5)
+        )
+        self.private = Schedule.objects.create(
+            calendar=friend_calendar, title="친구 일정", start_date=date(2025, 3, 6)
+        )
+
+    def get_titles(self, **params):
+        response = self.client.get(self.URL, {"start_date": "2025-03-01", **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [schedule["title"] for schedule in response.data["results"]], response
+
+    def test_invite_makes_schedule_visible(self):
+        titles, response = self.get_titles()
+        self.assertEqual(titles, ["내 일정"])
+
+        self.shared.participant.add(self.user)
+        response = self.client.get(
+            self.URL,
+            {"start_date": "2025-03-01"},
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [schedule["title"] for schedule in response.data["results"]],
+            ["내 일정", "함께하는 일정"],
+        )
+
+        titles, _ = self.get_titles(shared="false")
+        self.assertEqual(titles, ["내 일정"])
+        titles, _ = self.get_titles(**{"calendar[]": "Work"})
+        self.assertEqual(titles, ["내 일정", "함께하는 일정"])
+
+    def test_host_changes_reach_participants(self):
+        self.shared.participant.add(self.user)
+        self.get_titles()
+
+        self.shared.title = "바뀐 일정"
+        self.shared.save()
+        titles, _ = self.get_titles()
+        self.assertEqual(titles, ["내 일정", "바뀐 일정"])
+
+        self.shared.participant.remove(self.user)
+        titles, _ = self.get_titles()
+        self.assertEqual(titles, ["내 일정"])
+
+    def test_agenda_and_detail(self):
+        self.shared.participant.add(self.user)
+
+        response = self.client.get(
+            f"{self.URL}agenda/", {"start_date": "2025-03-01", "end_date": "2025-04-01"}
+        )
+        body = b"".join(response.streaming_content).decode("utf-8")
+        self.assertEqual(
+            [json.loads(line)["title"] for line in body.splitlines()],
+            ["내 일정", "함께하는 일정"],
+        )
+
+        response = self.client.get(f"{self.URL}{self.shared.pk}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(f"{self.URL}{self.private.pk}/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestTimeline(TestAuthBase):
+    URL = "/api/v1/calendars/schedule/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.work = Calendar.objects.create(user=self.user, title="Work")
+        self.home = Calendar.objects.create(user=self.user, title="Home")
+        self.imported = Calendar.objects.create(
+            user=self.user, title=importer.IMPORT_CALENDAR
+        )
+        for calendar, days in (
+            (self.work, (1, 4, 4, 9)),
+            (self.home, (2, 4, 8)),
+            (self.imported, (3, 7)),
+        ):
+            for day in days:
+                Schedule.objects.create(
+                    calendar=calendar,
+                    title=f"{calendar.title} {day}",
+                    start_date=date(2025, 3, day),
+                    start_time=time(9, day),
+                )
+        # 끝나지 않는 매일 반복 일정
+        Schedule.objects.create(
+            calendar=self.home,
+            title="산책",
+            start_date=date(2025, 3, 1),
+            start_time=time(7),
+            repeat_frequency="daily",
+        )
+
+    def test_merged_order(self):
+        stream = timeline.timeline(
+            Schedule.objects.all(),
+            [self.work.pk, self.home.pk, self.imported.pk],
+            date(2025, 3, 1),
+            date(2025, 3, 11),
+        )
+        schedules = list(stream)
+        keys = [recurrence.sort_key(schedule) for schedule in schedules]
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(len(schedules), 9 + 10)
+
+    def test_first_items_without_expanding_window(self):
+        # 100년 기간이라도 처음 몇 개만 꺼내면 나머지 발생은 전개하지 않습니다.
+        stream = timeline.timeline(
+            Schedule.objects.all(),
+            [self.work.pk, self.home.pk, self.imported.pk],
+            date(2025, 3, 1),
+            date(2125, 3, 1),
+        )
+        first = [schedule.title for schedule in islice(stream, 4)]
+        self.assertEqual(first, ["산책", "Work 1", "산책", "Home 2"])
+
+    def test_list_pages_across_calendars(self):
+        expected = [
+            schedule.title
+            for schedule in timeline.timeline(
+                Schedule.objects.all(),
+                [self.work.pk, self.home.pk, self.imported.pk],
+                date(2025, 3, 1),
+                date(2025, 3, 8),
+            )
+        ]
+        self.assertEqual(len(expected), 7 + 7)
+
+        titles, url = [], self.URL
+        params = {"start_date": "2025-03-01", "view": "weekly"}
+        with patch.object(ScheduleCursorPagination, "page_size", 3):
+            while url:
+                response = self.client.get(url, params)
+                titles += [schedule["title"] for schedule in response.data["results"]]
+                url, params = response.data["next"], None
+
+        self.assertEqual(titles, expected)
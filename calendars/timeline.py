@@ -0,0 +1,95 @@
+"""
+여러 캘린더의 일정을 하나의 정렬된 스트림(타임라인)으로 합칩니다.
+
+캘린더마다 단일 일정의 서버 측 iterator와 반복 일정의 발생을 병합한 정렬된 스트림을 만들고,
+이 스트림들을 `recurrence.sort_key` 순서로 heapq.merge 하여 k-way 병합합니다.
+각 스트림은 필요한 만큼만 읽히므로, 처음 N개를 꺼낼 때 캘린더마다 최대 `chunk_size`개의
+행만 읽고 나머지 일정은 읽거나 전개하지 않습니다.
+외부에서 가져온 일정(`calendars.importer`)은 가져오기 캘린더의 스트림이 됩니다.
+"""
+
+import heapq
+from collections import defaultdict
+from datetime import date, datetime, time
+
+from django.utils import timezone
+
+from calendars import recurrence
+
+CHUNK_SIZE = 100
+
+
+def _rows(queryset, chunk_size):
+    """
+    처음 값을 요청할 때 쿼리를 실행하는 iterator입니다.
+    """
+    yield from queryset.iterator(chunk_size=chunk_size)
+
+
+def calendar_stream(
+    singles, rules, start: date, end: date, chunk_size=CHUNK_SIZE, reverse=False
+):
+    """
+    한 캘린더의 정렬된 스트림입니다. singles는 정렬된 QuerySet, rules는 반복 일정 목록입니다.
+    """
+    return recurrence.merge(
+        _rows(singles, chunk_size), rules, start, end, reverse=reverse
+    )
+
+
+def timeline(
+    queryset,
+    calendar_ids,
+    start: date,
+    end: date,
+    *,
+    expand=None,
+    prepare=None,
+    chunk_size=CHUNK_SIZE,
+    reverse=False,
+):
+    """
+    queryset의 일정 중 [start, end) 기간의 일정(반복 일정의 발생 포함)을 정렬된 스트림으로 반환합니다.
+
+    - queryset의 일정은 모두 calendar_ids의 캘린더에 있어야 합니다. 캘린더마다 스트림을 하나씩 만듭니다.
+    - expand가 (시작일, 종료일)이면 반복 일정은 그 기간에서만 전개합니다. 기본값은 [start, end)입니다.
+    - prepare는 캘린더별 단일 일정 QuerySet(정렬 후)에 적용할 함수입니다. 커서 조건 등에 사용합니다.
+    - reverse이면 끝에서부터 거꾸로(sort_key 내림차순) 읽는 스트림을 반환합니다.
+
+    반복 규칙은 모든 캘린더를 한 번에 읽습니다. 단일 일정은 캘린더마다 하나의 쿼리로 읽습니다.
+    """
+    expand_start, expand_end = expand or (start, end)
+    tz = timezone.get_default_timezone()
+
+    rules = defaultdict(list)
+    rule_queryset = queryset.recurring_overlapping(
+        datetime.combine(expand_start, time.min, tz),
+        datetime.combine(expand_end, time.min, tz),
+    )
+    for rule in rule_queryset:
+        rules[rule.calendar_id].append(rule)
+
+    # 기간 이전에 시작해 기간 안까지 이어지는 일정도 포함합니다.
+    singles = queryset.filter(repeat_frequency__isnull=True).overlapping(
+        datetime.combine(start, time.min, tz), datetime.combine(end, time.min, tz)
+    )
+
+    streams = []
+    for calendar_id in calendar_ids:
+        calendar_singles = singles.filter(calendar_id=calendar_id).in_sort_order()
+        if reverse:
+            calendar_singles = calendar_singles.reverse()
+        if prepare is not None:
+            calendar_singles = prepare(calendar_singles)
+        streams.append(
+            calendar_stream(
+                calendar_singles,
+                rules[calendar_id],
+                expand_start,
+                expand_end,
+                chunk_size,
+                reverse,
+            )
+        )
+
+    return heapq.merge(*streams, key=recurrence.sort_key, reverse=reverse)
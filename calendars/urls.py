@@ -2,7 +2,13 @@ from django.urls import path
 
 from .views import (
     CalendarDetailView,
+    CalendarFeedView,
     CalendarListView,
+    FreeBusyView,
+    HeatmapView,
+    ScheduleAgendaView,
+    ScheduleBulkCopyView,
+    ScheduleBulkView,
     ScheduleCopyView,
     ScheduleDetailView,
     ScheduleListView,
@@ -15,7 +21,14 @@ calendar_urls = [
         CalendarDetailView.as_view(),
         name="calendar-detail",
     ),
+    path(
+        "name/<str:calendar_name>/feed.ics",
+        CalendarFeedView.as_view(),
+        name="calendar-feed",
+    ),
     path("", CalendarListView.as_view(), name="calendar-list"),
+    path("freebusy/", FreeBusyView.as_view(), name="calendar-freebusy"),
+    path("heatmap/", HeatmapView.as_view(), name="calendar-heatmap"),
 ]
 
 schedule_urls = [
@@ -30,7 +43,10 @@ schedule_urls = [
         ScheduleCopyView.as_view(),
         name="schedule-copy",
     ),
+    path("schedule/copy/", ScheduleBulkCopyView.as_view(), name="schedule-bulk-copy"),
     path("schedule/search/", ScheduleSearchView.as_view(), name="schedule-search"),
+    path("schedule/bulk/", ScheduleBulkView.as_view(), name="schedule-bulk"),
+    path("schedule/agenda/", ScheduleAgendaView.as_view(), name="schedule-agenda"),
 ]
 
 urlpatterns = calendar_urls + schedule_urls
@@ -1,26 +1,59 @@
-from copy import deepcopy
 from datetime import date, datetime, timedelta
+from itertools import chain
 
+from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Exists, OuterRef, Q
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
 from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.generics import ListAPIView
 from rest_framework.pagination import PageNumberPagination
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.views import APIView
-from django.db.models import Q
 
-from calendars.models import Calendar, Schedule
+from calendars import bulk
+from calendars import cache as schedule_cache
+from calendars import (
+    cloning,
+    conflicts,
+    etag,
+    heatmap,
+    ical,
+    recurrence,
+    search,
+    timeline,
+)
+from calendars.intervals import busy_intervals
+from calendars.models import Calendar, Schedule, prefetch_schedule_details
+from calendars.pagination import ScheduleCursorPagination
+from common.defaults import DEFAULT_CALENDAR
+from common.search import is_fts_available
+from tags.models import Tag
 
 from .serializers import (
     CalendarDetailSerializer,
+    CalendarStatsSerializer,
+    FreeBusySerializer,
+    HeatmapSerializer,
+    ScheduleBulkCopyResponseSerializer,
+    ScheduleBulkCopySerializer,
+    ScheduleBulkResponseSerializer,
+    ScheduleBulkSerializer,
+    ScheduleConflictChoices,
+    ScheduleConflictSerializer,
+    ScheduleCopySerializer,
     ScheduleDetailSerializer,
-    ScheduleViewChoices,
     ScheduleUpdateSerializer,
+    ScheduleViewChoices,
 )
 
+User = get_user_model()
+
 
 class CalendarListView(APIView):
     """
@@ -33,15 +66,42 @@ class CalendarListView(APIView):
 
     @extend_schema(
         summary="캘린더 목록 조회",
-        description="유저가 등록한 모든 캘린더를 불러옵니다.",
-        responses={200: CalendarDetailSerializer(many=True)},
+        description="유저가 등록한 모든 캘린더를 불러옵니다. stats=true이면 캘린더별 일정 수, 오늘 이후 가장 이른 일정의 시작일, \
+            가장 최근의 일정 수정 시각을 함께 반환합니다. 응답의 ETag를 If-None-Match로 보내면 바뀐 것이 없을 때 304를 반환합니다.",
+        parameters=[
+            OpenApiParameter(
+                name="stats",
+                description="캘린더별 일정 통계를 함께 조회할지 여부입니다. 기본값은 false입니다.",
+                required=False,
+                type=bool,
+            ),
+        ],
+        responses={200: CalendarStatsSerializer(many=True)},
         tags=["Calendars"],
     )
     def get(self, request):
-        queryset = self.queryset.filter(user=request.user)
-        serializer = self.serializer_class(instance=queryset, many=True)
+        calendars = self.queryset.filter(user=request.user)
+        serializer_class, parts = self.serializer_class, ["calendar-list"]
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # 통계는 캘린더 목록과 같은 쿼리에서 GROUP BY로 함께 계산합니다.
+        if request.query_params.get("stats", "false").lower() in ("true", "1"):
+            today = timezone.localdate()
+            calendars = calendars.with_stats(today)
+            # 다음 일정은 날짜가 바뀌면 달라지므로 오늘 날짜를 ETag에 포함합니다.
+            # 캘린더 목록은 Last-Modified를 보내지 않으므로 날이 바뀌면 If-Modified-Since로도 304가 되지 않습니다.
+            serializer_class = CalendarStatsSerializer
+            parts += ["stats", today]
+        calendars = list(calendars)
+
+        validators = etag.calendar_set_validators(calendars, *parts)
+        if (response := etag.not_modified(request, validators)) is not None:
+            return response
+
+        serializer = serializer_class(instance=calendars, many=True)
+
+        return etag.set_validators(
+            Response(serializer.data, status=status.HTTP_200_OK), validators
+        )
 
     @extend_schema(
         summary="캘린더 생성",
@@ -73,7 +133,8 @@ class CalendarDetailView(APIView):
     @extend_schema(
         summary="캘린더 속성 조회",
         description="스케줄들을 포함하는 캘린더의 속성들을 조회합니다. \
-            Calendar: calendar_name, description, timezone, subscription_url",
+            Calendar: calendar_name, description, timezone, subscription_url \
+            응답의 ETag를 If-None-Match로 보내면 바뀐 것이 없을 때 304를 반환합니다.",
         responses={200: CalendarDetailSerializer},
         tags=["Calendars"],
     )
@@ -81,8 +142,14 @@ class CalendarDetailView(APIView):
         try:
             instance = self.queryset.get(user=request.user, title=calendar_name)
 
+            validators = etag.calendar_validators([instance], "calendar-detail")
+            if (response := etag.not_modified(request, validators)) is not None:
+                return response
+
             serializer = self.serializer_class(instance=instance)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return etag.set_validators(
+                Response(serializer.data, status=status.HTTP_200_OK), validators
+            )
 
         except ObjectDoesNotExist:
             raise NotFound(detail={"message": "해당 캘린더가 존재하지 않습니다."})
@@ -135,55 +202,227 @@ class CalendarDetailView(APIView):
             raise NotFound(detail={"message": "캘린더가 존재하지 않습니다."})
 
 
+class CalendarFeedView(APIView):
+    """
+    캘린더를 iCalendar(.ics) 형식으로 스트리밍합니다. 외부 캘린더 앱의 구독 주소로 사용합니다.
+    JWT 대신 캘린더의 `feed_token`으로 인증합니다.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    queryset = Calendar.objects.all()
+    chunk_size = 500
+
+    @extend_schema(
+        summary="캘린더 구독(iCalendar)",
+        description="캘린더의 일정을 text/calendar 형식으로 내려줍니다. 반복 일정은 RRULE로 표현됩니다. \
+            token 쿼리 파라미터로 캘린더의 feed_token을 보내야 합니다. \
+            응답의 ETag를 If-None-Match로 보내면 바뀐 것이 없을 때 304를 반환합니다.",
+        parameters=[
+            OpenApiParameter(
+                name="token",
+                description="캘린더 속성 조회에서 받은 feed_token",
+                required=True,
+                type=str,
+            ),
+        ],
+        responses={(200, "text/calendar"): str},
+        tags=["Calendars"],
+    )
+    def get(self, request, calendar_name):
+        token = request.query_params.get("token")
+        try:
+            calendar = self.queryset.get(title=calendar_name, feed_token=token)
+        except ObjectDoesNotExist:
+            raise NotFound(detail={"message": "해당 캘린더가 존재하지 않습니다."})
+
+        validators = etag.calendar_validators([calendar], "calendar-feed")
+        if (response := etag.not_modified(request, validators)) is not None:
+            return response
+
+        schedules = (
+            Schedule.objects.filter(calendar=calendar)
+            .select_related("memo")
+            .prefetch_related("schedule_tags")
+            .order_by("pk")
+            .iterator(chunk_size=self.chunk_size)
+        )
+
+        response = StreamingHttpResponse(
+            ical.render_calendar(calendar, schedules),
+            content_type="text/calendar; charset=utf-8",
+        )
+        return etag.set_validators(response, validators)
+
+
+def _shared(param):
+    """
+    `shared` query param입니다. 기본값은 참입니다.
+    """
+    return param.get("shared", "true").lower() not in ("false", "0")
+
+
+SHARED_PARAMETER = OpenApiParameter(
+    name="shared",
+    description="참여자로 초대된 다른 유저의 일정도 함께 조회할지 여부입니다. 기본값은 true입니다.",
+    required=False,
+    type=bool,
+)
+
+
+def _copy_target(user, title):
+    """
+    복사본을 만들 캘린더입니다. title이 없으면 None(원본과 같은 캘린더)입니다.
+    """
+    if title is None:
+        return None
+    try:
+        return Calendar.objects.get(user=user, title=title)
+    except Calendar.DoesNotExist as exc:
+        raise NotFound(detail={"message": "해당 캘린더가 존재하지 않습니다."}) from exc
+
+
+def _clone(queryset, data, target):
+    try:
+        return cloning.clone_schedules(queryset, days=data["days"], calendar=target)
+    except OverflowError as exc:
+        raise ValidationError(
+            {"days": "복사본의 날짜가 표현할 수 있는 범위를 벗어납니다."}
+        ) from exc
+
+
+def _conflict_mode(request):
+    mode = request.query_params.get("conflicts")
+    if mode not in (None, "check", "strict"):
+        raise ValidationError({"conflicts": "check 또는 strict만 허용합니다."})
+    return mode
+
+
+def _check_conflicts(request, mode, preview, participant_ids):
+    """
+    mode가 있으면 겹치는 일정을 찾습니다. strict에서 겹치는 일정이 있으면 409 응답을 반환합니다.
+    """
+    if mode is None:
+        return None, None
+
+    found = conflicts.find_conflicts(preview, participant_ids, user=request.user)
+    found = ScheduleConflictSerializer(found, many=True).data
+    if found and mode == "strict":
+        response = Response(
+            {"message": "겹치는 일정이 있습니다.", "conflicts": found},
+            status=status.HTTP_409_CONFLICT,
+        )
+        return found, response
+
+    return found, None
+
+
+def _with_conflicts(data, found):
+    return data if found is None else {**data, "conflicts": found}
+
+
+CONFLICT_PARAMETER = OpenApiParameter(
+    name="conflicts",
+    description="check이면 같은 캘린더와 같은 참여자의 겹치는 일정을 응답의 conflicts에 담고, \
+        strict이면 겹치는 일정이 있을 때 쓰지 않고 409를 반환합니다. 생략하면 검사하지 않습니다.",
+    required=False,
+    type=ScheduleConflictChoices,
+)
+
+
 class ScheduleCopyView(APIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ScheduleDetailSerializer
-    queryset = Schedule.objects.select_related("memo")
+    queryset = Schedule.objects.all()
 
     @extend_schema(
         summary="일정 복사",
-        description="schedule_id의 일정을 복사하여 새로운 일정으로 생성합니다. 이때 메모가 존재하면 메모도 함께 복사합니다."
-        + "복사된 일정은 기존 일정과 동일한 속성을 가지고 일정의 시작일, 시작시간 모두 기존 일정과 동일하게 생성됩니다."
-        + "따라서, 복사된 일정의 시간을 변경하려면 일정 수정 API를 호출해야 합니다.",
+        description="schedule_id의 일정을 복사하여 새로운 일정으로 생성합니다. 메모, 참여자, 태그도 함께 복사합니다. "
+        + "days를 보내면 복사본의 날짜(반복 규칙 포함)를 그만큼 옮기고, calendar를 보내면 해당 캘린더에 복사본을 만듭니다. "
+        + "보내지 않으면 원본과 같은 캘린더, 같은 날짜에 생성됩니다.",
+        request=ScheduleCopySerializer,
         responses={201: ScheduleDetailSerializer},
         tags=["Schedules"],
     )
     def post(self, request, schedule_id):
-        try:
-            instance = self.queryset.get(pk=schedule_id)
+        serializer = ScheduleCopySerializer(data=request.data)
+        if not serializer.is_valid():
+            raise ValidationError(serializer.errors)
 
-            # Copy instance
-            instance.pk = None
-            if instance.memo:
-                instance.memo.pk = None
-                new_memo = deepcopy(instance.memo)
-                new_memo.save()
-            else:
-                new_memo = None
+        source = self.queryset.filter(pk=schedule_id, calendar__user=request.user)
+        target = _copy_target(request.user, serializer.validated_data.get("calendar"))
 
-            new_schedule = deepcopy(instance)
-            new_schedule.memo = new_memo
-            new_schedule.save()
+        clones = _clone(source, serializer.validated_data, target)
+        if not clones:
+            raise NotFound(detail={"message": "일정이 존재하지 않습니다."})
+
+        new_schedule = Schedule.objects.with_details().get(pk=clones[0].pk)
+        return Response(
+            data=self.serializer_class(instance=new_schedule).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class ScheduleBulkCopyView(APIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = ScheduleBulkCopySerializer
+    queryset = Schedule.objects.all()
 
-            serializer = self.serializer_class(instance=new_schedule)
+    @extend_schema(
+        summary="일정 일괄 복사",
+        description="여러 일정을 메모, 참여자, 태그와 함께 한 번에 복사합니다. \
+            schedule_ids로 일정들을 지정하거나, source_calendar로 캘린더 전체 또는 \
+            start_date~end_date에 시작하는 일정들을 지정합니다. \
+            days, calendar의 의미는 일정 복사 API와 같습니다.",
+        request=ScheduleBulkCopySerializer,
+        responses={201: ScheduleBulkCopyResponseSerializer},
+        tags=["Schedules"],
+    )
+    def post(self, request):
+        serializer = self.serializer_class(data=request.data)
+        if not serializer.is_valid():
+            raise ValidationError(serializer.errors)
+        data = serializer.validated_data
 
-            return Response(
-                data=serializer.data,
-                status=status.HTTP_201_CREATED,
+        sources = self.queryset.filter(calendar__user=request.user)
+        if "schedule_ids" in data:
+            sources = sources.filter(pk__in=data["schedule_ids"])
+            missing = set(data["schedule_ids"]) - set(
+                sources.values_list("pk", flat=True)
             )
-        except ObjectDoesNotExist as exc:
-            raise NotFound(detail={"message": "일정이 존재하지 않습니다."}) from exc
+            if missing:
+                raise NotFound(
+                    detail={
+                        "message": "해당 일정이 존재하지 않습니다.",
+                        "ids": sorted(missing),
+                    }
+                )
+        else:
+            source_calendar = _copy_target(request.user, data["source_calendar"])
+            sources = sources.filter(calendar=source_calendar)
+            if "start_date" in data:
+                sources = sources.filter(start_date__gte=data["start_date"])
+            if "end_date" in data:
+                sources = sources.filter(start_date__lte=data["end_date"])
+
+        target = _copy_target(request.user, data.get("calendar"))
+        clones = _clone(sources, data, target)
+
+        return Response(
+            {"count": len(clones), "ids": [clone.pk for clone in clones]},
+            status=status.HTTP_201_CREATED,
+        )
 
 
 class ScheduleListView(ListAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ScheduleDetailSerializer
-    queryset = Schedule.objects.select_related("calendar")
-    pagination_class = PageNumberPagination
+    queryset = Schedule.objects.select_details()
+    pagination_class = ScheduleCursorPagination
 
     @extend_schema(
         summary="일정 조회",
-        description="기간 내의 일정을 조회합니다. 일간 보기, 주간 보기, 월간 보기 기능이 있으며, 날짜를 기준으로 Pagination을 지원합니다. 원하는 캘린더들을 선택하여 요청을 보낼 수 있습니다.",
+        description="기간 내의 일정을 조회합니다. 일간 보기, 주간 보기, 월간 보기 기능이 있으며, (시작일, 시작시간, id) 기준의 커서 Pagination을 지원합니다. 원하는 캘린더들을 선택하여 요청을 보낼 수 있으며, 참여자로 초대된 다른 유저의 일정도 함께 조회합니다. 응답의 ETag를 If-None-Match로 보내면 바뀐 것이 없을 때 304를 반환합니다.",
         parameters=[
             OpenApiParameter(
                 name="start_date",
@@ -198,11 +437,10 @@ class ScheduleListView(ListAPIView):
                 type=ScheduleViewChoices,
             ),
             OpenApiParameter(
-                name="page",
-                description="페이지 번호를 입력합니다. 1부터 세며, 기본값은 1입니다. 0보다 큰 정수를 허용합니다.",
+                name="cursor",
+                description="페이지 커서입니다. 응답의 next/previous 링크를 그대로 따라가면 됩니다. 없으면 첫 페이지를 조회합니다.",
                 required=False,
-                type=int,
-                default=1,
+                type=str,
             ),
             OpenApiParameter(
                 name="calendar[]",
@@ -210,81 +448,259 @@ class ScheduleListView(ListAPIView):
                 required=False,
                 type=str,
             ),
+            SHARED_PARAMETER,
         ],
         responses={200: ScheduleDetailSerializer(many=True)},
         tags=["Schedules"],
     )
     def get(self, request):
         user = request.user
-        queryset = self.queryset.filter(calendar__user_id=user.id)
-
         param = request.query_params
 
         # `start_date` 필터링
         if not param.get("start_date"):
             raise ValidationError("start_date is required")
-        start_date = datetime.fromisoformat(param["start_date"])
-        queryset = queryset.filter(start_date__gte=start_date)
+        try:
+            start_date = datetime.fromisoformat(param["start_date"]).date()
+        except ValueError:
+            raise ValidationError({"start_date": "YYYY-MM-DD 형식이어야 합니다."})
 
-        # `calendar[]` 필터링
-        if param.get("calendar[]") is not None:
-            calendars = set(param.getlist("calendar[]"))
-            queryset = queryset.filter(calendar__title__in=calendars)
-
-        # `view` 필터링
-        if param.get("view"):
-            match param.get("view"):
-                case "monthly":
-                    queryset = queryset.filter(
-                        start_date__month__lt=start_date.month + 1
-                    )
+        # `view` 필터링: 모든 보기는 [start_date, end_date) 반열린 구간입니다. 기본값은 월간입니다.
+        view = param.get("view", "monthly")
+        try:
+            match view:
                 case "weekly":
-                    queryset = queryset.filter(
-                        start_date__lt=start_date + timedelta(days=7)
-                    )
+                    end_date = start_date + timedelta(days=7)
                 case "daily":
-                    queryset = queryset.filter(
-                        start_date__lt=start_date + timedelta(days=1)
-                    )
+                    end_date = start_date + timedelta(days=1)
+                case _:
+                    end_date = recurrence.add_months(start_date, 1)
+        except (OverflowError, ValueError):
+            # 기간의 끝이 date.max를 넘는 경우입니다.
+            raise ValidationError({"start_date": "조회 기간이 9999-12-31을 넘습니다."})
+
+        # `calendar[]` 필터링, `shared`이면 참여자로 초대된 일정도 함께 조회합니다.
+        titles = None
+        if param.get("calendar[]") is not None:
+            titles = set(param.getlist("calendar[]"))
+        shared = _shared(param)
+        queryset = self.queryset.visible_to(user, titles, shared)
+        calendars = Calendar.objects.visible_to(user, titles, shared)
 
-        # `page` 필터링
-        queryset = self.pagination_class().paginate_queryset(
-            queryset, request, view=self
+        # 요청된 캘린더들의 변경 토큰만 읽어 바뀐 것이 없으면 일정을 조회하지 않고 304로 응답합니다.
+        cursor = param.get(self.pagination_class.cursor_query_param)
+        calendars = list(calendars.only("pk", "version", "updated_at"))
+        validators = etag.calendar_set_validators(
+            calendars, "schedule-list", start_date.isoformat(), view, cursor, shared
         )
+        if (response := etag.not_modified(request, validators)) is not None:
+            return response
 
-        serializer = self.serializer_class(instance=queryset, many=True)
+        # 커서가 있으면 커서 위치부터(또는 위치까지)만 읽습니다.
+        paginator = self.pagination_class()
+        paginator.decode_cursor(request)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # 캐시된 응답이 있으면 일정을 조회하지 않습니다. 캘린더의 일정이 바뀌면 version이 바뀌어 키가 달라집니다.
+        cache_key = schedule_cache.page_key(
+            user.id,
+            calendars,
+            start_date,
+            end_date,
+            view,
+            cursor,
+            shared,
+            request.get_host(),
+        )
+        if (data := schedule_cache.get_page(cache_key)) is not None:
+            return etag.set_validators(Response(data), validators)
+
+        expand_start, expand_end = start_date, end_date
+        if paginator.direction == "next":
+            expand_start = max(start_date, paginator.position[0])
+        elif paginator.direction == "previous" and paginator.position[0] < end_date:
+            expand_end = paginator.position[0] + timedelta(days=1)
+
+        # 캘린더별 정렬된 스트림을 병합하고 페이지에 필요한 만큼만 읽습니다.
+        # 반복 규칙은 커서 위치부터(또는 위치까지)만 전개합니다.
+        # previous 방향은 커서 위치에서 거꾸로 읽는 역순 스트림입니다.
+        stream = timeline.timeline(
+            queryset,
+            [calendar.pk for calendar in calendars],
+            start_date,
+            end_date,
+            expand=(expand_start, expand_end),
+            prepare=paginator.filter_queryset,
+            reverse=paginator.direction == "previous",
+        )
+        page = prefetch_schedule_details(
+            paginator.paginate_stream(stream, request, view=self)
+        )
+
+        serializer = self.serializer_class(instance=page, many=True)
+
+        response = paginator.get_paginated_response(serializer.data)
+        schedule_cache.set_page(cache_key, response.data)
+
+        return etag.set_validators(response, validators)
 
     @extend_schema(
         summary="일정 등록",
-        description="새로운 일정을 등록합니다. 이때 새 메모를 동시에 추가할 수도 있습니다.",
+        description="새로운 일정을 등록합니다. 이때 새 메모를 동시에 추가할 수도 있습니다. \
+            conflicts를 지정하면 겹치는 일정을 검사합니다.",
+        parameters=[CONFLICT_PARAMETER],
         request=ScheduleDetailSerializer,
-        responses={201: ScheduleDetailSerializer},
+        responses={201: ScheduleDetailSerializer, 409: ScheduleConflictSerializer},
         tags=["Schedules"],
     )
     def post(self, request):
+        mode = _conflict_mode(request)
         serializer = self.serializer_class(
             data=request.data, context={"request": request}
         )
         if not serializer.is_valid():
             raise ValidationError(serializer.errors)
 
+        found = None
+        if mode is not None:
+            preview = conflicts.preview(serializer.validated_data)
+            if preview.calendar_id is None:
+                # calendar 미포함시 기본 캘린더에 등록됩니다.
+                preview.calendar = Calendar.objects.filter(
+                    user=request.user, title=DEFAULT_CALENDAR
+                ).first()
+            found, response = _check_conflicts(request, mode, preview, ())
+            if response is not None:
+                return response
+
         serializer.save()
 
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(
+            _with_conflicts(serializer.data, found), status=status.HTTP_201_CREATED
+        )
 
 
-class ScheduleSearchView(APIView):
+class ScheduleAgendaView(APIView):
+    """
+    기간 안의 일정(반복 일정의 발생 포함)을 한 줄에 하나씩 NDJSON으로 스트리밍합니다.
+    일정은 `chunk_size`개씩 서버 측 iterator로 읽으므로 기간이 길어도 메모리 사용량은 일정합니다.
+    """
+
     permission_classes = [IsAuthenticated]
     serializer_class = ScheduleDetailSerializer
-    queryset = Schedule.objects.select_related("calendar").prefetch_related(
-        "schedule_tags"
+    queryset = Schedule.objects.with_details()
+    chunk_size = 500
+
+    @extend_schema(
+        summary="일정 아젠다 내보내기",
+        description="[start_date, end_date) 기간의 일정을 시작 순서대로 application/x-ndjson 형식으로 스트리밍합니다. \
+            한 줄이 일정 하나이며, 반복 일정은 발생마다 한 줄씩 전개됩니다. 페이지 구분 없이 기간 전체를 내려줍니다.",
+        parameters=[
+            OpenApiParameter(
+                name="start_date",
+                description="조회 시작 날짜",
+                required=True,
+                type=date,
+            ),
+            OpenApiParameter(
+                name="end_date",
+                description="조회 종료 날짜로, 이 날짜는 포함하지 않습니다.",
+                required=True,
+                type=date,
+            ),
+            OpenApiParameter(
+                name="calendar[]",
+                description="캘린더 필터링, 다중인자를 허용합니다.",
+                required=False,
+                type=str,
+            ),
+            SHARED_PARAMETER,
+        ],
+        responses={(200, "application/x-ndjson"): ScheduleDetailSerializer},
+        tags=["Schedules"],
     )
+    def get(self, request):
+        param = request.query_params
+
+        try:
+            start_date = date.fromisoformat(param["start_date"])
+            end_date = date.fromisoformat(param["end_date"])
+        except (KeyError, ValueError):
+            raise ValidationError(
+                {"message": "start_date, end_date는 YYYY-MM-DD 형식이어야 합니다."}
+            )
+        if end_date <= start_date:
+            raise ValidationError(
+                {"message": "end_date는 start_date보다 뒤여야 합니다."}
+            )
+
+        titles = None
+        if param.get("calendar[]") is not None:
+            titles = set(param.getlist("calendar[]"))
+        shared = _shared(param)
+        queryset = self.queryset.visible_to(request.user, titles, shared)
+        calendar_ids = Calendar.objects.visible_to(
+            request.user, titles, shared
+        ).values_list("pk", flat=True)
+
+        stream = timeline.timeline(
+            queryset,
+            list(calendar_ids),
+            start_date,
+            end_date,
+            chunk_size=self.chunk_size,
+        )
+
+        return StreamingHttpResponse(
+            self.render_lines(stream), content_type="application/x-ndjson"
+        )
+
+    def render_lines(self, schedules):
+        encoder = JSONEncoder(ensure_ascii=False)
+        for schedule in schedules:
+            data = self.serializer_class(instance=schedule).data
+            yield encoder.encode(data) + "\n"
+
+
+class ScheduleBulkView(APIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = ScheduleBulkSerializer
+
+    @extend_schema(
+        summary="일정 일괄 처리",
+        description="여러 일정의 생성(create), 수정(update), 삭제(delete)를 한 번에 처리합니다. \
+            모든 항목을 검증한 뒤 하나의 트랜잭션으로 쓰며, 한 항목이라도 실패하면 아무것도 반영하지 않습니다. \
+            응답에는 요청 순서대로 항목별 결과가 담깁니다.",
+        request=ScheduleBulkSerializer,
+        responses={
+            200: ScheduleBulkResponseSerializer,
+            400: ScheduleBulkResponseSerializer,
+        },
+        tags=["Schedules"],
+    )
+    def post(self, request):
+        serializer = self.serializer_class(data=request.data)
+        if not serializer.is_valid():
+            raise ValidationError(serializer.errors)
+
+        results, ok = bulk.apply_operations(
+            request.user, serializer.validated_data["operations"]
+        )
+
+        return Response(
+            {"results": results},
+            status=status.HTTP_200_OK if ok else status.HTTP_400_BAD_REQUEST,
+        )
+
+
+class ScheduleSearchView(APIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = ScheduleDetailSerializer
+    queryset = Schedule.objects.with_details()
+    pagination_class = PageNumberPagination
 
     @extend_schema(
         summary="일정 검색",
-        description="문자열 기반 검색을 수행합니다. \
+        description="문자열 기반 검색을 수행합니다. 결과는 관련도 순으로 정렬되어 페이지 단위로 반환됩니다. \
             Calendar 필터링 옵션을 할 수 있습니다. Tag 옵션을 \
             사용하여 지정된 태그만을 필터링 할 수 있습니다.",
         parameters=[
@@ -297,33 +713,53 @@ class ScheduleSearchView(APIView):
                 required=False,
                 type=str,
             ),
+            OpenApiParameter(
+                name="page",
+                description="페이지 번호를 입력합니다. 1부터 세며, 기본값은 1입니다.",
+                required=False,
+                type=int,
+                default=1,
+            ),
         ],
         responses={200: ScheduleDetailSerializer(many=True)},
         tags=["Schedules"],
     )
     def get(self, request):
         """
-        검색엔진을 도입하는 것은 추후에 진행하고 (https://docs.djangoproject.com/en/5.1/topics/db/search/ 참조)
-        이번 티켓은 제목과 메모를 기준으로 검색하는 기능을 우선적으로 구현하자.
+        SQLite에서는 FTS5 인덱스(`ScheduleSearchIndex`)로 제목과 메모 본문을 검색하고 관련도 순으로 정렬합니다.
+        FTS5를 쓸 수 없는 DB에서는 icontains 검색으로 대체합니다.
         """
 
         param = request.query_params
         query = param.get("query")
 
-        schedules = self.queryset
-        if query is not None:
-            schedules = schedules.filter(
-                Q(title__icontains=query) | Q(memo__text__icontains=query)
-            ).distinct()
+        schedules = self.queryset.filter(calendar__user_id=request.user.id).order_by(
+            "start_date", "pk"
+        )
+        if query:
+            if is_fts_available():
+                schedules = search.search(schedules, query)
+            else:
+                schedules = schedules.filter(
+                    Q(title__icontains=query) | Q(memo__text__icontains=query)
+                ).distinct()
 
         # `tag[]` 필터링
         if param.get("tag[]") is not None:
             tags = set(param.getlist("tag[]"))
-            schedules = schedules.filter(schedule_tags__title__in=tags).distinct()
+            schedules = schedules.filter(
+                Exists(
+                    Tag.schedule.through.objects.filter(
+                        schedule_id=OuterRef("pk"), tag__title__in=tags
+                    )
+                )
+            )
 
-        serializer = self.serializer_class(schedules, many=True)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(schedules, request, view=self)
+        serializer = self.serializer_class(page, many=True)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class ScheduleDetailView(APIView):
@@ -333,15 +769,33 @@ class ScheduleDetailView(APIView):
 
     @extend_schema(
         summary="일정 상세 조회",
-        description="schedule_id path param을 기준으로 일정을 조회합니다.",
+        description="schedule_id path param을 기준으로 일정을 조회합니다. 응답의 ETag를 If-None-Match로 보내면 바뀐 것이 없을 때 304를 반환합니다.",
         responses={200: ScheduleDetailSerializer},
         tags=["Schedules"],
     )
     def get(self, request, schedule_id):
-        # Placeholder implementation
-        return Response(
-            {"message": f"Details for schedule {schedule_id}"},
-            status=status.HTTP_200_OK,
+        # 일정이 속한 캘린더의 변경 토큰만 읽어 바뀐 것이 없으면 304로 응답합니다.
+        # 참여자로 초대된 일정도 조회할 수 있습니다.
+        calendars = (
+            Calendar.objects.filter(
+                Q(user=request.user) | Q(calendar_schedule__participant=request.user),
+                calendar_schedule=schedule_id,
+            )
+            .distinct()
+            .only("pk", "version", "updated_at")
+        )
+        if not calendars:
+            raise NotFound(detail={"message": "해당 일정이 존재하지 않습니다."})
+
+        validators = etag.calendar_validators(calendars, "schedule-detail", schedule_id)
+        if (response := etag.not_modified(request, validators)) is not None:
+            return response
+
+        instance = Schedule.objects.with_details().get(pk=schedule_id)
+        serializer = self.serializer_class(instance=instance)
+
+        return etag.set_validators(
+            Response(serializer.data, status=status.HTTP_200_OK), validators
         )
 
     @extend_schema(
@@ -367,16 +821,224 @@ class ScheduleDetailView(APIView):
     @extend_schema(
         summary="일정 수정",
         description="schedule_id path param을 기준으로 일정을 수정합니다. 함께 있는 Memo는 메모 수정 API를 호출해야 합니다.",
+        parameters=[CONFLICT_PARAMETER],
         request=ScheduleUpdateSerializer,
-        responses={200: ScheduleDetailSerializer},
+        responses={200: ScheduleDetailSerializer, 409: ScheduleConflictSerializer},
         tags=["Schedules"],
     )
     def put(self, request, schedule_id):
+        mode = _conflict_mode(request)
         instance = self.queryset.get(pk=schedule_id)
         serializer = self.serializer_class(instance, data=request.data)
         if not serializer.is_valid():
             raise ValidationError(serializer.errors)
 
+        found = None
+        if mode is not None:
+            preview = conflicts.preview(serializer.validated_data, instance)
+            participant_ids = list(instance.participant.values_list("pk", flat=True))
+            found, response = _check_conflicts(request, mode, preview, participant_ids)
+            if response is not None:
+                return response
+
         serializer.save()
 
-        return Response(data=serializer.data, status=status.HTTP_200_OK)
+        return Response(
+            data=_with_conflicts(serializer.data, found), status=status.HTTP_200_OK
+        )
+
+
+class FreeBusyView(APIView):
+    """
+    기간 안에서 캘린더나 참여자가 바쁜 구간을 서버에서 병합해 반환합니다.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = FreeBusySerializer
+    queryset = Schedule.objects.all()
+    max_range = timedelta(days=366)
+
+    def parse_datetime(self, value, name) -> datetime:
+        if not value:
+            raise ValidationError({name: f"{name} is required"})
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError as exc:
+            raise ValidationError({name: "ISO 8601 형식이어야 합니다."}) from exc
+
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    @extend_schema(
+        summary="바쁜 시간 조회",
+        description="기간 안에서 선택한 캘린더와 참여자의 일정이 차지하는 시간을 병합된 구간 목록으로 반환합니다. \
+            반복 일정은 기간 안에서 전개됩니다. 캘린더와 참여자를 모두 생략하면 내 모든 캘린더를 사용합니다.",
+        parameters=[
+            OpenApiParameter(
+                name="start",
+                description="조회 시작 시각 (ISO 8601). 시간대가 없으면 서버 시간대로 해석합니다.",
+                required=True,
+                type=datetime,
+            ),
+            OpenApiParameter(
+                name="end",
+                description="조회 종료 시각 (ISO 8601, 미포함). 최대 366일까지 조회할 수 있습니다.",
+                required=True,
+                type=datetime,
+            ),
+            OpenApiParameter(
+                name="calendar[]",
+                description="내 캘린더 이름, 다중인자를 허용합니다.",
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name="user[]",
+                description="참여자 이메일, 다중인자를 허용합니다. 해당 유저의 캘린더 일정과 참여 일정을 포함합니다.",
+                required=False,
+                type=str,
+            ),
+        ],
+        responses={200: FreeBusySerializer},
+        tags=["Calendars"],
+    )
+    def get(self, request):
+        param = request.query_params
+        window_start = self.parse_datetime(param.get("start"), "start")
+        window_end = self.parse_datetime(param.get("end"), "end")
+
+        if window_end <= window_start:
+            raise ValidationError({"end": "end는 start보다 늦어야 합니다."})
+        if window_end - window_start > self.max_range:
+            raise ValidationError({"end": "최대 366일까지 조회할 수 있습니다."})
+
+        calendars = set(param.getlist("calendar[]"))
+        emails = set(param.getlist("user[]"))
+
+        if not calendars and not emails:
+            q = Q(calendar__user_id=request.user.id)
+        else:
+            q = Q()
+            if calendars:
+                q |= Q(calendar__user_id=request.user.id, calendar__title__in=calendars)
+            if emails:
+                users = User.objects.filter(email__in=emails).values("pk")
+                q |= Q(calendar__user_id__in=users) | Exists(
+                    Schedule.participant.through.objects.filter(
+                        schedule_id=OuterRef("pk"), user_id__in=users
+                    )
+                )
+
+        first_day = timezone.localdate(window_start)
+        last_day = timezone.localdate(window_end)
+        schedules = self.queryset.filter(q)
+
+        singles = schedules.filter(repeat_frequency__isnull=True).overlapping(
+            window_start, window_end
+        )
+        rules = schedules.recurring_overlapping(window_start, window_end)
+
+        occurrences = chain(
+            singles.iterator(),
+            *(
+                recurrence.occurrences_between(
+                    rule, first_day, last_day + timedelta(days=1)
+                )
+                for rule in rules
+            ),
+        )
+        busy = busy_intervals(occurrences, window_start, window_end)
+
+        serializer = self.serializer_class(
+            {
+                "start": window_start,
+                "end": window_end,
+                "busy": [{"start": start, "end": end} for start, end in busy],
+            }
+        )
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class HeatmapView(APIView):
+    """
+    월간 그리드에 표시할 날짜별 일정 수를 반환합니다. 일정 자체는 내려주지 않습니다.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = HeatmapSerializer
+
+    def parse_int(self, value, name, low, high):
+        try:
+            number = int(value)
+        except (TypeError, ValueError) as exc:
+            raise ValidationError({name: f"{name} is required"}) from exc
+        if not low <= number <= high:
+            raise ValidationError({name: f"{low}~{high} 사이여야 합니다."})
+        return number
+
+    @extend_schema(
+        summary="일정 히트맵",
+        description="한 해 또는 한 달의 날짜별 일정 수를 반환합니다. 반복 일정은 발생마다, 여러 날에 걸친 일정은 걸친 날마다 셉니다. \
+            응답의 ETag를 If-None-Match로 보내면 바뀐 것이 없을 때 304를 반환합니다.",
+        parameters=[
+            OpenApiParameter(
+                name="year", description="조회할 연도", required=True, type=int
+            ),
+            OpenApiParameter(
+                name="month",
+                description="조회할 월(1~12). 생략하면 한 해 전체를 조회합니다.",
+                required=False,
+                type=int,
+            ),
+            OpenApiParameter(
+                name="calendar[]",
+                description="캘린더 필터링, 다중인자를 허용합니다.",
+                required=False,
+                type=str,
+            ),
+        ],
+        responses={200: HeatmapSerializer},
+        tags=["Calendars"],
+    )
+    def get(self, request):
+        param = request.query_params
+        year = self.parse_int(param.get("year"), "year", 1, 9998)
+        if param.get("month") is None:
+            first_day, end_date = date(year, 1, 1), date(year + 1, 1, 1)
+        else:
+            month = self.parse_int(param.get("month"), "month", 1, 12)
+            first_day = date(year, month, 1)
+            end_date = recurrence.add_months(first_day, 1)
+
+        calendars = Calendar.objects.filter(user=request.user)
+        if param.get("calendar[]") is not None:
+            calendars = calendars.filter(title__in=set(param.getlist("calendar[]")))
+        calendars = list(calendars.only("pk", "version", "updated_at"))
+
+        validators = etag.calendar_set_validators(
+            calendars, "heatmap", first_day.isoformat(), end_date.isoformat()
+        )
+        if (response := etag.not_modified(request, validators)) is not None:
+            return response
+
+        calendar_ids = [calendar.pk for calendar in calendars]
+        cache_key = schedule_cache.page_key(
+            request.user.id, calendars, first_day, end_date, "heatmap"
+        )
+        if (data := schedule_cache.get_page(cache_key)) is None:
+            counts = heatmap.day_counts(
+                Schedule.objects.filter(calendar_id__in=calendar_ids),
+                first_day,
+                end_date - timedelta(days=1),
+            )
+            data = self.serializer_class(
+                {
+                    "start_date": first_day,
+                    "end_date": end_date - timedelta(days=1),
+                    "counts": counts,
+                }
+            ).data
+            schedule_cache.set_page(cache_key, data)
+
+        return etag.set_validators(Response(data), validators)
@@ -0,0 +1,8 @@
+"""
+회원가입할 때 만드는 기본 캘린더, 메모 세트, 할 일 세트의 이름입니다.
+캘린더나 세트를 지정하지 않은 일정/메모/할 일은 이 이름의 캘린더와 세트에 저장됩니다.
+"""
+
+DEFAULT_CALENDAR = "Calendar"
+DEFAULT_MEMO_SET = "Memo"
+DEFAULT_TODO_SET = "Todo"
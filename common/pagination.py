@@ -0,0 +1,112 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    키셋 기반 커서 페이지네이션의 공통 부분입니다.
+
+    커서는 방향("next"/"previous")과 기준 객체의 키를 JSON 배열로 담아 base64로 인코딩한 불투명 문자열입니다.
+    하위 클래스는 `cursor_key`와 `parse_cursor_key`로 키를 정하고, 페이지를 꺼낸 뒤
+    `request`, `page`, `has_next`, `has_previous`를 설정합니다.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = api_settings.PAGE_SIZE
+    invalid_cursor_message = "잘못된 커서입니다."
+
+    def __init__(self):
+        self.direction = None
+        self.position = None
+
+    def cursor_key(self, obj) -> list:
+        """
+        커서에 담을 obj의 키입니다. JSON으로 직렬화할 수 있어야 합니다.
+        """
+        raise NotImplementedError
+
+    def parse_cursor_key(self, values):
+        """
+        `cursor_key` 값을 `position`으로 되돌립니다. 잘못된 값이면 ValueError 등을 발생시킵니다.
+        """
+        raise NotImplementedError
+
+    def decode_cursor(self, request):
+        """
+        요청의 커서를 해석해 `direction`과 `position`을 설정합니다.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return
+
+        try:
+            raw = urlsafe_b64decode(encoded.encode("ascii")).decode("utf-8")
+            direction, *values = json.loads(raw)
+            position = self.parse_cursor_key(values)
+        except (TypeError, ValueError, UnicodeError, DjangoValidationError):
+            raise NotFound(detail={"message": self.invalid_cursor_message})
+
+        if direction not in ("next", "previous"):
+            raise NotFound(detail={"message": self.invalid_cursor_message})
+
+        self.direction = direction
+        self.position = position
+
+    def encode_cursor(self, direction, obj) -> str:
+        raw = json.dumps([direction, *self.cursor_key(obj)], ensure_ascii=False)
+        return urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    def get_link(self, direction, obj):
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, "page")
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(direction, obj)
+        )
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return self.get_link("next", self.page[-1])
+
+    def get_previous_link(self):
+        if not (self.has_previous and self.page):
+            return None
+        return self.get_link("previous", self.page[0])
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "이전 응답의 next/previous 링크에 포함된 커서 값입니다.",
+                "schema": {"type": "string"},
+            }
+        ]
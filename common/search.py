@@ -0,0 +1,77 @@
+import re
+
+from django.db import connection, models
+
+# 한글 음절과 호환 자모
+HANGUL = "\uac00-\ud7a3\u3131-\u318e"
+TOKEN_PATTERN = re.compile(f"([{HANGUL}]+)|([^\\W{HANGUL}]+)")
+NGRAM_SIZE = 2
+
+
+def is_fts_available() -> bool:
+    """
+    전문 검색 인덱스는 SQLite FTS5 가상 테이블을 사용합니다.
+    다른 DB에서는 호출하는 쪽에서 icontains 검색으로 대체해야 합니다.
+    """
+    return connection.vendor == "sqlite"
+
+
+class SearchDocumentField(models.TextField):
+    """
+    FTS5 테이블 이름과 같은 이름의 숨은 컬럼을 가리키는 필드입니다.
+    `__match` 룩업으로 테이블 전체 컬럼에 대한 MATCH 질의를 표현합니다.
+    """
+
+
+@SearchDocumentField.register_lookup
+class Match(models.Lookup):
+    lookup_name = "match"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", lhs_params + rhs_params
+
+
+def _hangul_ngrams(run: str, n: int) -> list[str]:
+    """
+    한글 구간을 n-gram으로 나눕니다. 끝부분에는 n보다 짧은 접미사도 남겨
+    n보다 짧은 검색어도 접두어 검색으로 찾을 수 있게 합니다.
+
+    "점심약속" -> ["점심", "심약", "약속", "속"]
+    """
+    return [run[i : i + n] for i in range(len(run))]
+
+
+def tokenize(text: str, n: int = NGRAM_SIZE) -> list[str]:
+    """
+    인덱싱용 토크나이저입니다. 한글은 글자 n-gram으로, 그 외 문자는 소문자 단어로 나눕니다.
+    공백으로 띄어 쓰지 않은 한글 복합어 안의 단어도 찾을 수 있습니다.
+    """
+    tokens = []
+    for hangul, word in TOKEN_PATTERN.findall(text or ""):
+        if hangul:
+            tokens.extend(_hangul_ngrams(hangul, n))
+        else:
+            tokens.append(word.lower())
+
+    return tokens
+
+
+def build_match_query(query: str, n: int = NGRAM_SIZE) -> str:
+    """
+    사용자 검색어를 `tokenize`로 만든 인덱스에 대한 FTS5 MATCH 질의로 변환합니다.
+
+    - 한글 구간은 연속된 n-gram의 구(phrase)로 찾습니다. n보다 짧으면 접두어로 찾습니다.
+    - 그 외 단어는 접두어로 찾습니다.
+    - 모든 구간을 포함해야 검색됩니다.
+    """
+    terms = []
+    for hangul, word in TOKEN_PATTERN.findall(query or ""):
+        if hangul and len(hangul) >= n:
+            grams = [hangul[i : i + n] for i in range(len(hangul) - n + 1)]
+            terms.append('"' + " ".join(grams) + '"')
+        else:
+            terms.append(f'"{(hangul or word).lower()}"*')
+
+    return " ".join(terms)
@@ -0,0 +1,22 @@
+from django.test import SimpleTestCase
+
+from common.search import build_match_query, tokenize
+
+
+class TestSearchTokenizer(SimpleTestCase):
+    def test_hangul_is_split_into_ngrams(self):
+        self.assertEqual(tokenize("점심약속"), ["점심", "심약", "약속", "속"])
+        self.assertEqual(tokenize("점심약속", n=3), ["점심약", "심약속", "약속", "속"])
+
+    def test_latin_is_split_into_lowercase_words(self):
+        self.assertEqual(tokenize("Team-Meeting notes"), ["team", "meeting", "notes"])
+
+    def test_mixed_text(self):
+        self.assertEqual(tokenize("PlanB회의 2차"), ["planb", "회의", "의", "2", "차"])
+
+    def test_match_query(self):
+        self.assertEqual(build_match_query("심약"), '"심약"')
+        self.assertEqual(build_match_query("점심약속"), '"점심 심약 약속"')
+        self.assertEqual(build_match_query("점"), '"점"*')
+        self.assertEqual(build_match_query('Meet "x'), '"meet"* "x"*')
+        self.assertEqual(build_match_query("  "), "")
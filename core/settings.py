@@ -100,6 +100,27 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # 일정 조회 응답 캐시입니다. LocMemCache는 MAX_ENTRIES를 넘으면 가장 오래 쓰이지 않은 항목부터 지웁니다(LRU).
+    # 캐시 키에 캘린더 version이 들어가므로 프로세스마다 따로 있어도 바뀐 일정을 돌려주지 않지만,
+    # 적중률 통계(`schedule_cache_stats`)는 모든 프로세스가 보는 공유 백엔드(Redis 등)에서만 모을 수 있습니다.
+    "schedules": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "schedules",
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    },
+}
+
+SCHEDULE_CACHE_ALIAS = "schedules"
+SCHEDULE_CACHE_TIMEOUT = 60 * 60  # 초
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
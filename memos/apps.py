@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class MemosConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "memos"
+
+    def ready(self):
+        from memos import signals  # noqa: F401
@@ -0,0 +1,69 @@
+"""
+메모 연결 종류(`Memo.attached_to`, `Memo.attached_id`) 동기화.
+
+Schedule, Todo, SubTodo는 각자 memo 1:1 필드로 메모를 가집니다. 메모 쪽에서 연결 여부를 보려면
+세 테이블을 역방향으로 JOIN해야 하므로, 연결된 리소스의 종류와 id를 메모에 함께 저장합니다.
+
+리소스를 저장, 삭제할 때(`memos.signals`)와 ScheduleQuerySet의 bulk_create/bulk_update/update에서
+`sync`를 호출합니다. 메모 행은 update()로만 고치므로 메모의 post_save는 보내지 않습니다.
+"""
+
+from django.db.models import OuterRef, Subquery
+
+from memos.models import Memo, MemoAttachment
+
+KINDS = {
+    "calendars.Schedule": MemoAttachment.SCHEDULE,
+    "todos.Todo": MemoAttachment.TODO,
+    "todos.SubTodo": MemoAttachment.SUBTODO,
+}
+
+
+def attachment_kind(model) -> str:
+    return KINDS[model._meta.label]
+
+
+def sync(model, owner_ids):
+    """
+    model(Schedule, Todo, SubTodo)의 owner_ids 행이 가진 메모를 그 행에 연결하고,
+    그 행들에 연결되어 있었지만 더 이상 연결되지 않은 메모(삭제된 행의 메모 포함)는 연결을 해제합니다.
+    """
+    owner_ids = list(owner_ids)
+    if not owner_ids:
+        return
+
+    kind = attachment_kind(model)
+    memo_ids = model._base_manager.filter(
+        pk__in=owner_ids, memo_id__isnull=False
+    ).values("memo_id")
+
+    Memo.objects.filter(attached_to=kind, attached_id__in=owner_ids).exclude(
+        pk__in=memo_ids
+    ).update(attached_to=MemoAttachment.NONE, attached_id=None)
+
+    Memo.objects.filter(pk__in=memo_ids).update(
+        attached_to=kind,
+        attached_id=Subquery(
+            model._base_manager.filter(memo_id=OuterRef("pk")).values("pk")[:1]
+        ),
+    )
+
+
+def detach(model, owner_ids):
+    """
+    삭제된 model 행들에 연결되어 있던 메모의 연결을 해제합니다.
+    """
+    Memo.objects.filter(
+        attached_to=attachment_kind(model), attached_id__in=list(owner_ids)
+    ).update(attached_to=MemoAttachment.NONE, attached_id=None)
+
+
+def sync_cached_memo(instance):
+    """
+    instance가 불러 둔 메모 객체에도 연결 상태를 반영합니다.
+    이후 그 메모 객체를 저장하거나 직렬화해도 DB와 같은 값을 가집니다.
+    """
+    field = type(instance)._meta.get_field("memo")
+    if field.is_cached(instance) and instance.memo is not None:
+        instance.memo.attached_to = attachment_kind(type(instance))
+        instance.memo.attached_id = instance.pk
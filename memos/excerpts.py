@@ -0,0 +1,25 @@
+"""
+메모 목록에 보여줄 본문 요약.
+
+목록 화면은 제목과 본문의 첫 줄만 보여주므로, 저장할 때 본문의 첫 줄을 잘라 `Memo.excerpt`에,
+본문 길이를 `Memo.text_length`에 함께 저장합니다. 목록 조회는 본문(text) 컬럼을 읽지 않습니다.
+"""
+
+EXCERPT_LENGTH = 100
+
+
+def memo_excerpt(text) -> str:
+    """
+    본문의 비어 있지 않은 첫 줄을 최대 EXCERPT_LENGTH 글자로 자른 값입니다.
+    잘린 경우 마지막 글자를 "…"로 바꿉니다.
+    """
+    line = next(
+        (line.strip() for line in (text or "").splitlines() if line.strip()), ""
+    )
+    if len(line) > EXCERPT_LENGTH:
+        return line[: EXCERPT_LENGTH - 1] + "…"
+    return line
+
+
+def text_length(text) -> int:
+    return len(text or "")
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.15 on 2026-10-18 04:59
+
+from django.db import migrations, models
+
+from memos.excerpts import memo_excerpt, text_length
+
+
+def backfill_excerpt(apps, schema_editor):
+    Memo = apps.get_model("memos", "Memo")
+
+    batch = []
+    for memo in Memo.objects.only("text").iterator(chunk_size=2000):
+        memo.excerpt = memo_excerpt(memo.text)
+        memo.text_length = text_length(memo.text)
+        batch.append(memo)
+        if len(batch) == 2000:
+            Memo.objects.bulk_update(batch, ["excerpt", "text_length"])
+            batch = []
+
+    Memo.objects.bulk_update(batch, ["excerpt", "text_length"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("memos", "0004_alter_memo_memo_set"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="memo",
+            name="excerpt",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=100
+            ),
+        ),
+        migrations.AddField(
+            model_name="memo",
+            name="text_length",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_excerpt, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.1.15 on 2026-10-18 05:02
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+ATTACHMENTS = [
+    ("calendars", "Schedule", "schedule"),
+    ("todos", "Todo", "todo"),
+    ("todos", "SubTodo", "subtodo"),
+]
+
+
+def backfill_attached_to(apps, schema_editor):
+    Memo = apps.get_model("memos", "Memo")
+
+    for app_label, model_name, kind in ATTACHMENTS:
+        Owner = apps.get_model(app_label, model_name)
+        Memo.objects.filter(
+            pk__in=Owner.objects.filter(memo_id__isnull=False).values("memo_id")
+        ).update(
+            attached_to=kind,
+            attached_id=Subquery(
+                Owner.objects.filter(memo_id=OuterRef("pk")).values("pk")[:1]
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("memos", "0005_memo_excerpt"),
+        ("calendars", "0013_schedule_ical_uid"),
+        ("todos", "0005_alter_todo_todo_set"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="memo",
+            name="attached_id",
+            field=models.PositiveBigIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="memo",
+            name="attached_to",
+            field=models.CharField(
+                choices=[
+                    ("none", "None"),
+                    ("schedule", "Schedule"),
+                    ("todo", "Todo"),
+                    ("subtodo", "Subtodo"),
+                ],
+                default="none",
+                editable=False,
+                max_length=10,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="memo",
+            index=models.Index(
+                fields=["attached_to", "attached_id"], name="memo_attached_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_attached_to, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-18 05:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("memos", "0006_memo_attached_to"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="memo",
+            index=models.Index(
+                fields=["memo_set", "created_at"], name="memo_set_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="memo",
+            index=models.Index(
+                fields=["memo_set", "updated_at"], name="memo_set_updated_idx"
+            ),
+        ),
+    ]
@@ -1,6 +1,11 @@
 from django.db import models
+from django.db.models import Count, Exists, OuterRef, Subquery
 
 from common.models import CommonModel
+from memos.excerpts import EXCERPT_LENGTH, memo_excerpt, text_length
+
+# text에서 파생되어 함께 저장되는 필드입니다.
+MEMO_EXCERPT_FIELDS = ("excerpt", "text_length")
 
 
 class MemoSet(CommonModel):
@@ -15,9 +20,103 @@ class MemoSet(CommonModel):
         ]
 
 
+class MemoAttachment(models.TextChoices):
+    """
+    메모가 연결된 리소스의 종류입니다. 메모는 최대 하나의 리소스에 연결됩니다.
+    """
+
+    NONE = "none"
+    SCHEDULE = "schedule"
+    TODO = "todo"
+    SUBTODO = "subtodo"
+
+
+class MemoQuerySet(models.QuerySet):
+    def tagged(self, titles, match_all=False):
+        """
+        titles 중 하나의 태그라도 가진 메모(match_all이면 모든 태그를 가진 메모)만 남깁니다.
+
+        태그 연결 중간 테이블을 JOIN하지 않고 상관 서브쿼리로 확인하므로,
+        여러 태그가 맞아도 메모가 중복되지 않고 DISTINCT가 필요 없습니다.
+        """
+        titles = set(titles)
+        links = self.model.memo_tags.through.objects.filter(
+            memo_id=OuterRef("pk"), tag__title__in=titles
+        )
+        if not match_all:
+            return self.filter(Exists(links))
+
+        # 태그 이름은 고유하므로 맞은 연결 수가 태그 수와 같으면 모든 태그를 가진 것입니다.
+        matched = links.order_by().values("memo_id").annotate(n=Count("pk")).values("n")
+        return self.alias(matched_tags=Subquery(matched)).filter(
+            matched_tags=len(titles)
+        )
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.sync_excerpt()
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs, fields = list(objs), list(fields)
+        if "text" in fields:
+            for obj in objs:
+                obj.sync_excerpt()
+            fields += [f for f in MEMO_EXCERPT_FIELDS if f not in fields]
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
+
 class Memo(CommonModel):
     memo_set = models.ForeignKey(
         "memos.MemoSet", on_delete=models.CASCADE, related_name="set_memo"
     )
     title = models.CharField(max_length=50, default="새로운 메모")
     text = models.TextField(null=True, blank=True)
+
+    # 목록 조회용 본문 요약입니다. `memos.excerpts`를 참고하세요.
+    excerpt = models.CharField(
+        max_length=EXCERPT_LENGTH, blank=True, default="", editable=False
+    )
+    text_length = models.PositiveIntegerField(default=0, editable=False)
+
+    # 메모를 가진 리소스(Schedule, Todo, SubTodo)의 종류와 id입니다.
+    # 역방향 1:1 관계를 JOIN하지 않고 필터링, 직렬화할 수 있도록 `memos.attachments`가 맞춥니다.
+    attached_to = models.CharField(
+        max_length=10,
+        choices=MemoAttachment.choices,
+        default=MemoAttachment.NONE,
+        editable=False,
+    )
+    attached_id = models.PositiveBigIntegerField(null=True, editable=False)
+
+    objects = MemoQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["attached_to", "attached_id"], name="memo_attached_idx"
+            ),
+            # 메모 목록의 날짜 필터와 정렬(`memos.pagination`)에 사용합니다.
+            models.Index(
+                fields=["memo_set", "created_at"], name="memo_set_created_idx"
+            ),
+            models.Index(
+                fields=["memo_set", "updated_at"], name="memo_set_updated_idx"
+            ),
+        ]
+
+    def sync_excerpt(self):
+        self.excerpt = memo_excerpt(self.text)
+        self.text_length = text_length(self.text)
+
+    def save(self, *args, **kwargs):
+        # text를 불러오지 않은(defer) 인스턴스는 text가 저장되지 않으므로 요약도 그대로 둡니다.
+        if "text" not in self.get_deferred_fields():
+            self.sync_excerpt()
+
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "text" in update_fields:
+                kwargs["update_fields"] = {*update_fields, *MEMO_EXCERPT_FIELDS}
+
+        super().save(*args, **kwargs)
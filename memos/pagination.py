@@ -0,0 +1,85 @@
+from django.db.models import Q
+
+from common.pagination import KeysetCursorPagination
+from memos.models import Memo
+
+
+class MemoCursorPagination(KeysetCursorPagination):
+    """
+    (정렬 필드, id) 키셋 기반의 커서 페이지네이션입니다.
+
+    `sort` query param이 정한 필드와 id로 정렬하고, 마지막으로 본 메모 다음부터 이어서 읽습니다.
+    COUNT(*)와 OFFSET이 없으므로 응답 시간은 메모 수가 아니라 페이지 크기에 비례합니다.
+    커서에는 정렬도 함께 담으며, 다른 정렬의 커서는 거부합니다.
+    """
+
+    cursor_query_param = "cursor"
+    sort_query_param = "sort"
+
+    # sort 값: (정렬 필드, 내림차순 여부)
+    orderings = {
+        "created_at_asc": ("created_at", False),
+        "created_at_desc": ("created_at", True),
+        "updated_at_asc": ("updated_at", False),
+        "updated_at_desc": ("updated_at", True),
+        "title_asc": ("title", False),
+        "title_desc": ("title", True),
+    }
+    default_sort = "created_at_asc"
+
+    def get_sort(self, request):
+        """
+        요청의 정렬입니다. 알 수 없는 값이면 기본 정렬을 사용합니다.
+        """
+        sort = request.query_params.get(self.sort_query_param)
+        return sort if sort in self.orderings else self.default_sort
+
+    def cursor_key(self, memo) -> list:
+        field, _ = self.orderings[self.sort]
+        value = getattr(memo, field)
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        return [self.sort, value, memo.pk]
+
+    def parse_cursor_key(self, values):
+        sort, value, pk = values
+        if sort != self.sort:
+            raise ValueError("다른 정렬의 커서입니다.")
+
+        field, _ = self.orderings[self.sort]
+        return Memo._meta.get_field(field).to_python(value), int(pk)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.sort = self.get_sort(request)
+        self.decode_cursor(request)
+
+        # 이전 페이지는 반대 방향으로 정렬해 읽은 뒤 뒤집습니다.
+        field, descending = self.orderings[self.sort]
+        backwards = self.direction == "previous"
+        descending = descending != backwards
+
+        if descending:
+            queryset = queryset.order_by(f"-{field}", "-id")
+        else:
+            queryset = queryset.order_by(field, "id")
+
+        if self.position is not None:
+            value, pk = self.position
+            op = "lt" if descending else "gt"
+            queryset = queryset.filter(
+                Q(**{f"{field}__{op}": value}) | Q(**{field: value, f"id__{op}": pk})
+            )
+
+        page = list(queryset[: self.page_size + 1])
+        has_more = len(page) > self.page_size
+        page = page[: self.page_size]
+
+        if backwards:
+            page.reverse()
+            self.has_previous, self.has_next = has_more, True
+        else:
+            self.has_previous, self.has_next = self.position is not None, has_more
+
+        self.page = page
+        return page
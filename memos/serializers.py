@@ -1,17 +1,36 @@
 from django.contrib.auth import get_user_model
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers as s
 
 from calendars.models import Schedule
-from memos.models import Memo, MemoSet
+from common.defaults import DEFAULT_MEMO_SET
+from memos.models import Memo, MemoAttachment, MemoSet
 from todos.models import Todo
 
 User = get_user_model()
 
 
+@extend_schema_field(OpenApiTypes.INT)
+class AttachedIdField(s.Field):
+    """
+    메모가 kind 종류의 리소스에 연결되어 있으면 그 리소스의 id, 아니면 None입니다.
+    역방향 관계 대신 `Memo.attached_to`, `Memo.attached_id`를 읽으므로 쿼리나 JOIN이 필요 없습니다.
+    """
+
+    def __init__(self, kind, **kwargs):
+        kwargs.update(source="*", read_only=True)
+        super().__init__(**kwargs)
+        self.kind = kind
+
+    def to_representation(self, memo):
+        return memo.attached_id if memo.attached_to == self.kind else None
+
+
 class MemoDetailSerializer(s.ModelSerializer):
     memo_set = s.PrimaryKeyRelatedField(queryset=MemoSet.objects.all(), required=False)
-    memo_schedule = s.PrimaryKeyRelatedField(read_only=True)
-    memo_todo = s.PrimaryKeyRelatedField(read_only=True)
+    memo_schedule = AttachedIdField(MemoAttachment.SCHEDULE)
+    memo_todo = AttachedIdField(MemoAttachment.TODO)
 
     class Meta:
         model = Memo
@@ -20,6 +39,7 @@ class MemoDetailSerializer(s.ModelSerializer):
             "title",
             "memo_set",
             "text",
+            "attached_to",
             "memo_schedule",
             "memo_todo",
         )
@@ -34,10 +54,9 @@ class MemoDetailSerializer(s.ModelSerializer):
         # get default memo_set if no "memo_set" found
         memo_set = validated_data.pop(
             "memo_set",
-            # TODO - abstract default memo_set name
             MemoSet.objects.get(
                 user=user,
-                title="Memo",
+                title=DEFAULT_MEMO_SET,
             ),
         )
 
@@ -52,6 +71,30 @@ class MemoDetailSerializer(s.ModelSerializer):
         return instance
 
 
+class MemoListSerializer(s.ModelSerializer):
+    """
+    메모 목록용 serializer입니다. 본문 대신 저장된 요약(excerpt)과 본문 길이를 반환합니다.
+    본문 전체는 메모 디테일 조회로 가져옵니다.
+    """
+
+    memo_set = s.PrimaryKeyRelatedField(read_only=True)
+    memo_schedule = AttachedIdField(MemoAttachment.SCHEDULE)
+    memo_todo = AttachedIdField(MemoAttachment.TODO)
+
+    class Meta:
+        model = Memo
+        fields = (
+            "id",
+            "title",
+            "memo_set",
+            "excerpt",
+            "text_length",
+            "attached_to",
+            "memo_schedule",
+            "memo_todo",
+        )
+
+
 class MemoSetDetailSerializer(s.ModelSerializer):
     user = s.PrimaryKeyRelatedField(read_only=True)
 
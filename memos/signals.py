@@ -0,0 +1,25 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from calendars.models import Schedule
+from memos import attachments
+from todos.models import SubTodo, Todo
+
+
+@receiver(post_save, sender=Schedule)
+@receiver(post_save, sender=Todo)
+@receiver(post_save, sender=SubTodo)
+def sync_saved_attachment(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not {"memo", "memo_id"} & update_fields:
+        return
+
+    attachments.sync(sender, [instance.pk])
+    attachments.sync_cached_memo(instance)
+
+
+@receiver(post_delete, sender=Schedule)
+@receiver(post_delete, sender=Todo)
+@receiver(post_delete, sender=SubTodo)
+def detach_deleted_attachment(sender, instance, **kwargs):
+    if instance.memo_id is not None:
+        attachments.detach(sender, [instance.pk])
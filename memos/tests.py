@@ -3,13 +3,18 @@ import json
 import pprint
 from django.urls import reverse
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 
+from calendars import cloning
 from calendars.models import Calendar, Schedule
 from tags.models import Tag
-from memos.models import Memo, MemoSet
+from memos.excerpts import EXCERPT_LENGTH
+from memos.models import Memo, MemoAttachment, MemoSet
 from tests.auth_base_test import TestAuthBase
-from todos.models import Todo, TodoSet
+from todos.models import SubTodo, Todo, TodoSet
 
 User = get_user_model()
 
@@ -64,7 +69,7 @@ class TestMemoList(TestAuthBase):
                 "year": 9999,
             },
         )
-        self.assertEqual(len(response.data), 3)
+        self.assertEqual(len(response.data["results"]), 3)
 
         response = self.client.get(
             self.URL,
@@ -73,13 +78,44 @@ class TestMemoList(TestAuthBase):
                 "month": 12,
             },
         )
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data["results"]), 2)
 
         response = self.client.get(
             self.URL,
             query_params={"year": 9999, "month": 12, "day": 1},
         )
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_get_memos_by_local_date(self):
+        """
+        날짜 필터는 UTC가 아니라 기본 시간대(Asia/Seoul)의 날짜 경계를 사용합니다.
+        """
+        # 2024-12-31 15:30 UTC는 한국 시간으로 2025-01-01 00:30입니다.
+        created_at = datetime.datetime(
+            2024, 12, 31, 15, 30, tzinfo=datetime.timezone.utc
+        )
+        Memo.objects.filter(pk=self.memo.pk).update(created_at=created_at)
+
+        for params, count in (
+            ({"year": 2025}, 1),
+            ({"year": 2025, "month": 1}, 1),
+            ({"year": 2025, "month": 1, "day": 1}, 1),
+            ({"year": 2024}, 0),
+            ({"year": 2024, "month": 12, "day": 31}, 0),
+            ({"year": 1}, 0),
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.URL, params)
+            self.assertEqual(len(response.data["results"]), count, params)
+
+            # 컬럼을 날짜 함수로 감싸지 않아야 인덱스를 사용할 수 있습니다.
+            sql = " ".join(q["sql"] for q in queries)
+            self.assertNotIn("django_datetime", sql)
+
+    def test_get_memos_with_invalid_date(self):
+        for params in ({"year": 2024, "month": 13}, {"year": "abc"}):
+            response = self.client.get(self.URL, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_get_memos_with_memo_set(self):
         """
@@ -105,22 +141,22 @@ class TestMemoList(TestAuthBase):
             self.URL, query_params={"memo_set[]": [self.memo_set.pk]}
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data["results"]), 2)
 
         # other memo set
         response = self.client.get(
             self.URL, query_params={"memo_set[]": [other_memo_set.pk]}
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["title"], memo_in_other_set.title)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["title"], memo_in_other_set.title)
 
         # 둘 다
         response = self.client.get(
             self.URL, query_params={"memo_set[]": [self.memo_set.pk, other_memo_set.pk]}
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 3)
+        self.assertEqual(len(response.data["results"]), 3)
 
         # Error case: invalid query param
         response = self.client.get(
@@ -135,7 +171,7 @@ class TestMemoList(TestAuthBase):
 
         # 없는 태그를 쿼리할 경우
         response = self.client.get(self.URL, query_params={"tag[]": "sample_tag"})
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data["results"]), 0)
 
         # 새 태그 생성 및 연결
         tag = Tag.objects.create(user=self.user, title="sample_tag")
@@ -144,7 +180,7 @@ class TestMemoList(TestAuthBase):
 
         # 존재하는 태그를 쿼리할 경우
         response = self.client.get(self.URL, query_params={"tag[]": "sample_tag"})
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
 
     def __create_sample_memos_relates_to_schedule_and_todo(self):
         """하나의 테스트케이스 마다 한 번의 request만 가능하기에 따로 뽑아놨습니다."""
@@ -188,7 +224,7 @@ class TestMemoList(TestAuthBase):
         # it should only give schedule_related_memo if `type[]=schedule` query param has entered
         response = self.client.get(self.URL, query_params={"type[]": "schedule"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        data = response.data
+        data = response.data["results"]
         self.assertEqual(len(data), 1, str(data))
         self.assertEqual(self.schedule_related_memo.title, data[0].get("title"))
 
@@ -209,7 +245,9 @@ class TestMemoList(TestAuthBase):
         # if `type[]=schedule&type[]=` query param has entered
         response = self.client.get(self.URL, query_params={"type[]": ["schedule", ""]})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2, str(response.data))
+        self.assertEqual(
+            len(response.data["results"]), 2, str(response.data["results"])
+        )
 
     def test_get_memos_with_types3(self):
         """
@@ -227,8 +265,10 @@ class TestMemoList(TestAuthBase):
         # it should give standalone memo if `type[]=schedule&type[]=todo` query param has entered
         response = self.client.get(self.URL, query_params={"type[]": [""]})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1, str(response.data))
-        self.assertEqual(response.data[0]["title"], self.memo.title)
+        self.assertEqual(
+            len(response.data["results"]), 1, str(response.data["results"])
+        )
+        self.assertEqual(response.data["results"][0]["title"], self.memo.title)
 
     def test_create_memo(self):
         """Test creating a new Memo"""
@@ -279,10 +319,10 @@ class TestMemoList(TestAuthBase):
         # it should give reversed result when sort with "created_at_asc"
         response = self.client.get(self.URL, query_params={"sort": "created_at_asc"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), COUNT)
+        self.assertEqual(len(response.data["results"]), COUNT)
 
         for i, memo in enumerate(reversed(memos)):
-            self.assertEqual(response.data[i]["id"], memo.id)
+            self.assertEqual(response.data["results"][i]["id"], memo.id)
 
     def test_get_memos_order_by_created_at_desc(self):
         """order_by("-created_at")"""
@@ -300,10 +340,10 @@ class TestMemoList(TestAuthBase):
         response = self.client.get(self.URL, query_params={"sort": "created_at_desc"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), COUNT)
+        self.assertEqual(len(response.data["results"]), COUNT)
 
         for i, memo in enumerate(reversed(memos)):
-            self.assertEqual(response.data[i]["id"], memo.id)
+            self.assertEqual(response.data["results"][i]["id"], memo.id)
 
     def test_get_memos_order_by_updated_at_asc(self):
         """order_by("updated_at")"""
@@ -325,10 +365,10 @@ class TestMemoList(TestAuthBase):
         # it should give sequential result when sort with "updated_at_asc"
         response = self.client.get(self.URL, query_params={"sort": "updated_at_asc"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), COUNT)
+        self.assertEqual(len(response.data["results"]), COUNT)
 
         for i, memo in enumerate(memos):
-            self.assertEqual(response.data[i]["id"], memo.id)
+            self.assertEqual(response.data["results"][i]["id"], memo.id)
 
     def test_get_memos_order_by_updated_at_desc(self):
         """order_by("-updated_at")"""
@@ -351,10 +391,10 @@ class TestMemoList(TestAuthBase):
         # it should give reversed result when sort with "updated_at_desc"
         response = self.client.get(self.URL, query_params={"sort": "updated_at_desc"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), COUNT)
+        self.assertEqual(len(response.data["results"]), COUNT)
 
         for i, memo in enumerate(reversed(memos)):
-            self.assertEqual(response.data[i]["id"], memo.id)
+            self.assertEqual(response.data["results"][i]["id"], memo.id)
 
     def test_get_memos_order_by_title_asc(self):
         COUNT = 10
@@ -371,10 +411,10 @@ class TestMemoList(TestAuthBase):
         # it should give sequential result when sort with "title_asc"
         response = self.client.get(self.URL, query_params={"sort": "title_asc"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), COUNT)
+        self.assertEqual(len(response.data["results"]), COUNT)
 
         for i, memo in enumerate(memos):
-            self.assertEqual(response.data[i]["title"], memo.title)
+            self.assertEqual(response.data["results"][i]["title"], memo.title)
 
     def test_get_memos_order_by_title_desc(self):
         COUNT = 10
@@ -391,10 +431,286 @@ class TestMemoList(TestAuthBase):
         # it should give reversed result when sort with "title_desc"
         response = self.client.get(self.URL, query_params={"sort": "title_desc"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), COUNT)
+        self.assertEqual(len(response.data["results"]), COUNT)
 
         for i, memo in enumerate(reversed(memos)):
-            self.assertEqual(response.data[i]["title"], memo.title)
+            self.assertEqual(response.data["results"][i]["title"], memo.title)
+
+
+class TestMemoTagFilter(TestAuthBase):
+
+    URL = "/api/v1/memos/"
+
+    def setUp(self):
+        super().setUp()
+
+        memo_set = MemoSet.objects.create(user=self.user, title="Memo")
+        self.both, self.work, self.untagged = [
+            Memo.objects.create(memo_set=memo_set, title=title)
+            for title in ("both", "work", "untagged")
+        ]
+        work = Tag.objects.create(user=self.user, title="work")
+        home = Tag.objects.create(user=self.user, title="home")
+        work.memo.add(self.both, self.work)
+        home.memo.add(self.both)
+
+    def get_titles(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.URL, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.sql = " ".join(q["sql"] for q in queries)
+        return sorted(memo["title"] for memo in response.data["results"])
+
+    def test_any_tag_without_duplicates(self):
+        titles = self.get_titles({"tag[]": ["work", "home"]})
+        self.assertEqual(titles, ["both", "work"])
+        self.assertNotIn("DISTINCT", self.sql)
+
+    def test_all_tags(self):
+        params = {"tag[]": ["work", "home"], "tag_match": "all"}
+        self.assertEqual(self.get_titles(params), ["both"])
+
+        params["tag[]"] = ["work", "missing"]
+        self.assertEqual(self.get_titles(params), [])
+
+    def test_memo_set_in(self):
+        other = MemoSet.objects.create(user=self.user, title="Other")
+        Memo.objects.create(memo_set=other, title="other")
+
+        params = {"memo_set[]": [other.pk, other.pk, self.work.memo_set_id]}
+        self.assertEqual(len(self.get_titles(params)), 4)
+        self.assertIn('"memo_set_id" IN', self.sql)
+
+
+class TestMemoListPagination(TestAuthBase):
+
+    URL = "/api/v1/memos/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.memo_set = MemoSet.objects.create(user=self.user, title="Memo")
+        self.other_set = MemoSet.objects.create(user=self.user, title="Other")
+        # 제목이 겹치는 메모가 있어도 id로 순서가 정해집니다.
+        self.memos = [
+            Memo.objects.create(
+                memo_set=self.memo_set if i % 5 else self.other_set,
+                title=f"memo {i // 2:02d}",
+                text="text",
+            )
+            for i in range(25)
+        ]
+
+    def walk(self, params, link="next"):
+        ids, url, pages = [], self.URL, 0
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [memo["id"] for memo in response.data["results"]]
+            url, params, pages = response.data[link], None, pages + 1
+        return ids, pages, response
+
+    def test_walk_pages_with_sort(self):
+        ids, pages, _ = self.walk({"sort": "title_desc"})
+        expected = [
+            memo.pk
+            for memo in sorted(self.memos, key=lambda m: (m.title, m.pk), reverse=True)
+        ]
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 3)
+
+    def test_previous_link(self):
+        response = self.client.get(self.URL, {"sort": "created_at_desc"})
+        first_page = [memo["id"] for memo in response.data["results"]]
+        self.assertIsNone(response.data["previous"])
+
+        response = self.client.get(response.data["next"])
+        response = self.client.get(response.data["previous"])
+        self.assertEqual([memo["id"] for memo in response.data["results"]], first_page)
+
+    def test_filters_are_kept(self):
+        ids, _, _ = self.walk({"memo_set[]": self.memo_set.pk, "sort": "title_asc"})
+        self.assertEqual(len(ids), 20)
+        self.assertEqual(
+            set(ids), {m.pk for m in self.memos if m.memo_set_id == self.memo_set.pk}
+        )
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.URL, {"sort": "title_asc"})
+        cursor = response.data["next"].split("cursor=")[1]
+
+        for params in (
+            {"cursor": "invalid"},
+            # 다른 정렬에서 만든 커서는 사용할 수 없습니다.
+            {"cursor": cursor, "sort": "updated_at_asc"},
+        ):
+            response = self.client.get(self.URL, params)
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_query_count_does_not_depend_on_library_size(self):
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(self.URL)
+
+        for i in range(50):
+            Memo.objects.create(memo_set=self.memo_set, title=f"more {i}")
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(self.URL)
+
+        self.assertEqual(len(response.data["results"]), 10)
+        self.assertEqual(len(large), len(small))
+
+
+class TestMemoExcerpt(TestAuthBase):
+
+    URL = "/api/v1/memos/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.memo_set = MemoSet.objects.create(user=self.user, title="Memo")
+        self.text = "\n  첫 줄입니다  \n두 번째 줄\n" + "본문 " * 500
+        self.memo = Memo.objects.create(
+            memo_set=self.memo_set, title="long", text=self.text
+        )
+
+    def test_excerpt_is_saved(self):
+        self.assertEqual(self.memo.excerpt, "첫 줄입니다")
+        self.assertEqual(self.memo.text_length, len(self.text))
+
+        self.memo.text = "가" * (EXCERPT_LENGTH + 10)
+        self.memo.save(update_fields=["text"])
+        self.memo.refresh_from_db()
+        self.assertEqual(len(self.memo.excerpt), EXCERPT_LENGTH)
+        self.assertTrue(self.memo.excerpt.endswith("…"))
+        self.assertEqual(self.memo.text_length, EXCERPT_LENGTH + 10)
+
+    def test_excerpt_on_bulk_create(self):
+        memo, empty = Memo.objects.bulk_create(
+            [
+                Memo(memo_set=self.memo_set, text="one\ntwo"),
+                Memo(memo_set=self.memo_set, text=None),
+            ]
+        )
+        rows = Memo.objects.filter(pk__in=[memo.pk, empty.pk]).order_by("pk")
+        self.assertEqual(
+            list(rows.values_list("excerpt", "text_length")), [("one", 7), ("", 0)]
+        )
+
+    def test_list_returns_excerpt_without_text(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        memo = response.data["results"][0]
+        self.assertNotIn("text", memo)
+        self.assertEqual(memo["excerpt"], "첫 줄입니다")
+        self.assertEqual(memo["text_length"], len(self.text))
+
+        select = next(q["sql"] for q in queries if 'FROM "memos_memo"' in q["sql"])
+        self.assertNotIn('"memos_memo"."text"', select)
+
+    def test_detail_returns_text(self):
+        response = self.client.get(f"{self.URL}{self.memo.pk}/")
+        self.assertEqual(response.data["text"], self.text)
+
+
+class TestMemoAttachment(TestAuthBase):
+
+    URL = "/api/v1/memos/"
+
+    def setUp(self):
+        super().setUp()
+
+        self.memo_set = MemoSet.objects.create(user=self.user, title="Memo")
+        self.memo = Memo.objects.create(memo_set=self.memo_set, title="memo")
+        self.calendar = Calendar.objects.create(user=self.user, title="calendar")
+        self.todo_set = TodoSet.objects.create(user=self.user, title="todoset")
+
+    def assertAttached(self, memo, kind, owner_id):
+        memo.refresh_from_db()
+        self.assertEqual((memo.attached_to, memo.attached_id), (kind, owner_id))
+
+    def create_schedule(self, **kwargs):
+        return Schedule.objects.create(
+            calendar=self.calendar,
+            title="schedule",
+            start_date=datetime.date(2024, 12, 4),
+            **kwargs,
+        )
+
+    def test_schedule_link_and_unlink(self):
+        schedule = self.create_schedule(memo=self.memo)
+        self.assertAttached(self.memo, MemoAttachment.SCHEDULE, schedule.pk)
+
+        # 메모를 바꾸면 이전 메모의 연결은 해제됩니다.
+        other = Memo.objects.create(memo_set=self.memo_set, title="other")
+        schedule.memo = other
+        schedule.save()
+        self.assertAttached(self.memo, MemoAttachment.NONE, None)
+        self.assertAttached(other, MemoAttachment.SCHEDULE, schedule.pk)
+
+        schedule.delete()
+        self.assertAttached(other, MemoAttachment.NONE, None)
+
+    def test_todo_and_subtodo(self):
+        todo = Todo.objects.create(
+            todo_set=self.todo_set,
+            memo=self.memo,
+            title="todo",
+            start_date=timezone.now(),
+        )
+        self.assertAttached(self.memo, MemoAttachment.TODO, todo.pk)
+
+        todo.memo = None
+        todo.save(update_fields=["memo"])
+        self.assertAttached(self.memo, MemoAttachment.NONE, None)
+
+        sub_todo = SubTodo.objects.create(
+            todo=todo, memo=self.memo, title="sub", start_date=timezone.now()
+        )
+        self.assertAttached(self.memo, MemoAttachment.SUBTODO, sub_todo.pk)
+
+        todo.delete()
+        self.assertAttached(self.memo, MemoAttachment.NONE, None)
+
+    def test_bulk_writes(self):
+        schedule = self.create_schedule(memo=self.memo)
+        (clone,) = cloning.clone_schedules(Schedule.objects.filter(pk=schedule.pk))
+        self.assertAttached(clone.memo, MemoAttachment.SCHEDULE, clone.pk)
+        self.assertAttached(self.memo, MemoAttachment.SCHEDULE, schedule.pk)
+
+        Schedule.objects.filter(pk=schedule.pk).update(memo=None)
+        self.assertAttached(self.memo, MemoAttachment.NONE, None)
+
+    def test_list_needs_no_joins(self):
+        schedule = self.create_schedule(memo=self.memo)
+        Memo.objects.create(memo_set=self.memo_set, title="standalone")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.URL, {"type[]": "schedule"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        (memo,) = response.data["results"]
+        self.assertEqual(memo["attached_to"], MemoAttachment.SCHEDULE)
+        self.assertEqual(memo["memo_schedule"], schedule.pk)
+        self.assertIsNone(memo["memo_todo"])
+
+        sql = " ".join(q["sql"] for q in queries)
+        self.assertNotIn("calendars_schedule", sql)
+        self.assertNotIn("todos_todo", sql)
+
+    def test_detail_serializer(self):
+        todo = Todo.objects.create(
+            todo_set=self.todo_set,
+            memo=self.memo,
+            title="todo",
+            start_date=timezone.now(),
+        )
+
+        with self.assertNumQueries(2):
+            response = self.client.get(f"{self.URL}{self.memo.pk}/")
+        self.assertEqual(response.data["memo_todo"], todo.pk)
+        self.assertIsNone(response.data["memo_schedule"])
 
 
 class TestMemoDetail(TestAuthBase):
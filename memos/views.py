@@ -1,6 +1,7 @@
 import datetime
 from django.core.exceptions import BadRequest, ObjectDoesNotExist
-from django.db.models import F, Q
+from django.db.models import F
+from django.utils import timezone
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
 from rest_framework.exceptions import NotFound, ValidationError
@@ -8,21 +9,76 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from memos.models import Memo, MemoSet
+from memos.models import Memo, MemoAttachment, MemoSet
+from memos.pagination import MemoCursorPagination
 from users.models import User
 
-from .serializers import MemoDetailSerializer, MemoSetDetailSerializer
+from .serializers import (
+    MemoDetailSerializer,
+    MemoListSerializer,
+    MemoSetDetailSerializer,
+)
+
+# `type[]` query param 값과 메모 연결 종류입니다. ''는 아무 리소스에 연결되지 않은 메모입니다.
+MEMO_TYPES = {
+    "schedule": MemoAttachment.SCHEDULE,
+    "todo": MemoAttachment.TODO,
+    "subtodo": MemoAttachment.SUBTODO,
+    "": MemoAttachment.NONE,
+}
+
+
+def _local_midnight(day):
+    """
+    기본 시간대(Asia/Seoul)에서 day가 시작하는 시각입니다. 표현할 수 없으면 None입니다.
+    """
+    if day is None:
+        return None
+    try:
+        value = datetime.datetime.combine(
+            day, datetime.time.min, timezone.get_default_timezone()
+        )
+        value.astimezone(datetime.timezone.utc)
+    except OverflowError:
+        return None
+    return value
+
+
+def _created_range(year, month=None, day=None):
+    """
+    year(, month(, day))에 해당하는 created_at의 [시작, 끝) 구간입니다.
+    경계가 표현할 수 있는 범위를 벗어나면 그쪽은 None(제한 없음)입니다.
+    존재하지 않는 날짜이면 ValueError가 발생합니다.
+    """
+    if day is not None:
+        first = datetime.date(year, month, day)
+        following = (
+            first + datetime.timedelta(days=1) if first < datetime.date.max else None
+        )
+    elif month is not None:
+        first = datetime.date(year, month, 1)
+        following = (
+            datetime.date(year + month // 12, month % 12 + 1, 1)
+            if (year, month) < (datetime.MAXYEAR, 12)
+            else None
+        )
+    else:
+        first = datetime.date(year, 1, 1)
+        following = datetime.date(year + 1, 1, 1) if year < datetime.MAXYEAR else None
+
+    return _local_midnight(first), _local_midnight(following)
 
 
 class MemoListView(APIView):
 
     permission_classes = [IsAuthenticated]
     serializer_class = MemoDetailSerializer
-    queryset = Memo.objects.select_related("memo_set")
+    queryset = Memo.objects.all()
+    pagination_class = MemoCursorPagination
 
     @extend_schema(
         summary="메모 조회",
-        description="날짜와 다양한 분류,정렬 기준으로 사용자의 메모를 조회합니다.",
+        description="날짜와 다양한 분류,정렬 기준으로 사용자의 메모를 조회합니다. (정렬 기준, id) 기준의 커서 Pagination을 지원합니다. 본문 대신 본문 첫 줄의 요약(excerpt)과 본문 길이(text_length)를 반환하며, 본문 전체는 메모 디테일 조회로 가져옵니다.",
         parameters=[
             OpenApiParameter(
                 name="year", description="조회 연도", required=False, type=int
@@ -41,13 +97,19 @@ class MemoListView(APIView):
             ),
             OpenApiParameter(
                 name="sort",
-                description="정렬 옵션. created_at_asc, created_at_desc, updated_at_asc, updated_at_desc, title_asc, title_desc 중 하나를 허용합니다.",
+                description="정렬 옵션. created_at_asc, created_at_desc, updated_at_asc, updated_at_desc, title_asc, title_desc 중 하나를 허용합니다. 기본값은 created_at_asc입니다.",
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name="cursor",
+                description="페이지 커서입니다. 응답의 next/previous 링크를 그대로 따라가면 됩니다. 없으면 첫 페이지를 조회합니다.",
                 required=False,
                 type=str,
             ),
             OpenApiParameter(
                 name="type[]",
-                description="메모 타입. 'schedule', 'todo', ''를 포함할 수 있습니다. ''는 아무 리소스에 연결되지 않은 메모임을 의미합니다. 다중인자를 허용합니다. null일 경우 필터링 없이 가져옵니다.",
+                description="메모 타입. 'schedule', 'todo', 'subtodo', ''를 포함할 수 있습니다. ''는 아무 리소스에 연결되지 않은 메모임을 의미합니다. 다중인자를 허용합니다. null일 경우 필터링 없이 가져옵니다.",
                 required=False,
                 type=str,
                 many=True,
@@ -66,66 +128,54 @@ class MemoListView(APIView):
                 type=str,
                 many=True,
             ),
+            OpenApiParameter(
+                name="tag_match",
+                description="tag[] 필터 방식. 'any'는 태그 중 하나라도 가진 메모, 'all'은 모든 태그를 가진 메모를 조회합니다. 기본값은 any입니다.",
+                required=False,
+                type=str,
+                enum=["any", "all"],
+            ),
         ],
-        responses={200: MemoDetailSerializer(many=True)},
+        responses={200: MemoListSerializer(many=True)},
         tags=["Memos"],
     )
     def get(self, request):
         user = request.user
-        queryset = self.queryset.filter(memo_set__user_id=user.id)
+        # 목록은 본문을 보여주지 않으므로 text 컬럼을 읽지 않습니다.
+        queryset = self.queryset.filter(memo_set__user_id=user.id).defer("text")
 
         param = request.query_params
 
         # year 없는 month는 존재하지 않고 month 없는 day는 존재하지 않는다.
-        if param.get("year"):
-            year = int(param.get("year"))
-
-            if param.get("month"):
-                month = int(param.get("month"))
-
-                if param.get("day"):  # year + month + day
-                    day = int(param.get("day"))
-                    queryset = queryset.filter(
-                        created_at__date=datetime.date(year, month, day)
-                    )
-
-                else:  # year + month
-                    queryset = queryset.filter(
-                        created_at__year=year, created_at__month=month
-                    )
-
-            else:  # year
-                queryset = queryset.filter(created_at__year=year)
+        # 기본 시간대의 연/월/일 경계로 [시작, 끝) 구간을 만들어 created_at 인덱스로 찾습니다.
+        try:
+            if param.get("year"):
+                year = int(param.get("year"))
+                month = int(param.get("month")) if param.get("month") else None
+                day = int(param.get("day")) if month and param.get("day") else None
+
+                start, end = _created_range(year, month, day)
+                if start is not None:
+                    queryset = queryset.filter(created_at__gte=start)
+                if end is not None:
+                    queryset = queryset.filter(created_at__lt=end)
+        except ValueError:
+            return Response(
+                "year, month, day query parameter가 유효하지 않습니다.",
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         # `type` filtering
         if param.get("type[]") is not None:
             types = set(param.getlist("type[]"))
-            excluded_types = {"todo", "schedule", ""} - types
-
-            q = Q()
-            for e in excluded_types:
-                # 여기서 e는 걸러질 타입을 의미한다!
-                match e:
-                    case "todo":
-                        q &= Q(memo_todo__isnull=True)
-                    case "schedule":
-                        q &= Q(memo_schedule__isnull=True)
-                    case "":
-                        q &= Q(memo_todo__isnull=False) | Q(memo_schedule__isnull=False)
-
-            queryset = queryset.filter(q)
-            del q
+            kinds = [kind for value, kind in MEMO_TYPES.items() if value in types]
+            queryset = queryset.filter(attached_to__in=kinds)
 
         # `memo_set` filtering
         try:
             if param.get("memo_set[]"):
-                memo_sets = map(int, param.getlist("memo_set[]"))
-                q = Q()
-                for i in memo_sets:
-                    q |= Q(memo_set_id=i)
-
-                queryset = queryset.filter(q)
-                del q
+                memo_sets = set(map(int, param.getlist("memo_set[]")))
+                queryset = queryset.filter(memo_set_id__in=memo_sets)
         except ValueError:
             return Response(
                 "memo_set[] query parameter가 유효하지 않습니다.",
@@ -134,32 +184,17 @@ class MemoListView(APIView):
 
         # `tag` filtering
         if param.get("tag[]"):
-            tags = param.getlist("tag[]")
-            q = Q()
-            for tag_title in tags:
-                q |= Q(memo_tags__title=tag_title)
-
-            queryset = queryset.filter(q)
-            del q
+            queryset = queryset.tagged(
+                param.getlist("tag[]"), match_all=param.get("tag_match") == "all"
+            )
 
         # `sort` created_at_asc, created_at_desc, updated_at_asc, updated_at_desc, title_asc, title_desc
-        match param.get("sort"):
-            case "created_at_asc":
-                queryset = queryset.order_by("created_at")
-            case "created_at_desc":
-                queryset = queryset.order_by("-created_at")
-            case "updated_at_asc":
-                queryset = queryset.order_by("updated_at")
-            case "updated_at_desc":
-                queryset = queryset.order_by("-updated_at")
-            case "title_asc":
-                queryset = queryset.order_by("title")
-            case "title_desc":
-                queryset = queryset.order_by("-title")
+        # 정렬과 (정렬 필드, id) 키셋 조건은 paginator가 적용합니다.
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = MemoListSerializer(page, many=True)
 
-        serializer = self.serializer_class(queryset, many=True)
-
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serializer.data)
 
     @extend_schema(
         summary="메모 등록",
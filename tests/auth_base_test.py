@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 
@@ -11,6 +12,10 @@ class TestAuthBase(APITestCase):
     """
 
     def setUp(self):
+        # 캐시는 테스트 DB와 함께 초기화되지 않으므로 테스트마다 비웁니다.
+        for cache in caches.all():
+            cache.clear()
+
         self.user = User.objects.create(
             email="tester@test.com",
             birthday="1997-09-26",
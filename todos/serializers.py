@@ -1,6 +1,7 @@
 from rest_framework import serializers as s
 from rest_framework.exceptions import NotFound, ParseError
 
+from common.defaults import DEFAULT_MEMO_SET, DEFAULT_TODO_SET
 from memos.models import Memo, MemoSet
 from memos.serializers import MemoDetailSerializer
 from todos.models import SubTodo, Todo, TodoSet
@@ -82,13 +83,13 @@ class TodoDetailSerializer(s.ModelSerializer):
 
     def create(self, validated_data):
         user = validated_data.pop("user")
-        todo_set = validated_data.pop("todo_set", TodoSet.objects.get(user=user, title="Todo"))
+        todo_set = validated_data.pop("todo_set", TodoSet.objects.get(user=user, title=DEFAULT_TODO_SET))
         memo = validated_data.pop("memo", None)
         todo_title = validated_data.pop("title", None)
 
         memo_title = memo.pop("title", None)
         memo_text = memo.pop("text", None)
-        memo_set = MemoSet.objects.get(user=user, title="Memo")
+        memo_set = MemoSet.objects.get(user=user, title=DEFAULT_MEMO_SET)
 
 
         memo = Memo.objects.create(title=memo_title, text=memo_text, memo_set=memo_set)
@@ -107,7 +108,7 @@ class TodoDetailSerializer(s.ModelSerializer):
 
     def update(self, instance, validated_data):
         todo = instance
-        todo_set = validated_data.pop("todo_set", TodoSet.objects.get(user=validated_data.pop("user"), title="Todo"))
+        todo_set = validated_data.pop("todo_set", TodoSet.objects.get(user=validated_data.pop("user"), title=DEFAULT_TODO_SET))
         memo = validated_data.pop("memo", None)
         todo_title = validated_data.pop("title")
         todo_start_date = validated_data.pop("start_date")
@@ -13,6 +13,7 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from calendars.models import Calendar
+from common.defaults import DEFAULT_CALENDAR, DEFAULT_MEMO_SET, DEFAULT_TODO_SET
 from memos.models import Memo, MemoSet
 from todos.models import TodoSet
 from users.models import User
@@ -43,9 +44,9 @@ class SignUp(APIView):
         user.set_password(password)
         user.save()
 
-        MemoSet.objects.create(user=user, title="Memo")
-        TodoSet.objects.create(user=user, title="Todo")
-        Calendar.objects.create(user=user, title="Calendar")
+        MemoSet.objects.create(user=user, title=DEFAULT_MEMO_SET)
+        TodoSet.objects.create(user=user, title=DEFAULT_TODO_SET)
+        Calendar.objects.create(user=user, title=DEFAULT_CALENDAR)
 
         # Send Email Link
         email = user.email